@@ -1,9 +1,13 @@
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from dataclasses import dataclass
+import numbers
 import numpy as np
 import logging
 from enum import Enum
 
+# Share of a template's thresholds that must be met for it to be detected
+DETECTION_THRESHOLD = 0.7
+
 @dataclass
 class ScenarioTemplate:
     name: str
@@ -11,11 +15,173 @@ class ScenarioTemplate:
     weight_adjustments: Dict[str, float]
     detection_thresholds: Dict[str, float]
 
+class ScenarioTemplates(dict):
+    """
+    Scenario templates by name, with a version bumped on every change.
+
+    ContextEngine compiles the templates into a ScenarioIndex and rebuilds
+    it when the version moves. Editing a template's thresholds in place is
+    not seen; assign the template again or call
+    ``ContextEngine.rebuild_index()``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def _changed(self):
+        self.version += 1
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._changed()
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+def _threshold_value(value: Any) -> float:
+    # Only numbers can meet a threshold
+    return float(value) if isinstance(value, numbers.Real) else np.nan
+
+class ScenarioIndex:
+    """
+    Scenario templates compiled for vectorized detection.
+
+    ``thresholds`` is a templates x parameters matrix holding each template's
+    detection threshold, NaN where the template does not use the parameter
+    (a comparison with NaN is never true). ``param_index`` maps a parameter
+    name to its column.
+    """
+
+    def __init__(self, templates: List[ScenarioTemplate], params: List[str], thresholds: np.ndarray):
+        self.templates = templates
+        self.params = params
+        self.param_index = {param: i for i, param in enumerate(params)}
+        self.thresholds = thresholds
+        self.sizes = np.maximum((~np.isnan(thresholds)).sum(axis=1), 1)
+        self._users = []
+        for j in range(len(params)):
+            users = np.flatnonzero(~np.isnan(thresholds[:, j]))
+            self._users.append((users, thresholds[users, j]))
+        neutral = next((t for t in templates if t.name == "high_risk"), None)
+        self.neutral_adjustments = {key: 1.0 for key in neutral.weight_adjustments} if neutral else {}
+
+    @classmethod
+    def compile(cls, templates: Iterable[ScenarioTemplate]) -> "ScenarioIndex":
+        templates = list(templates)
+        params = list(dict.fromkeys(param for t in templates for param in t.detection_thresholds))
+        index = {param: i for i, param in enumerate(params)}
+        thresholds = np.full((len(templates), len(params)), np.nan)
+        for row, template in enumerate(templates):
+            for param, threshold in template.detection_thresholds.items():
+                thresholds[row, index[param]] = threshold
+        return cls(templates, params, thresholds)
+
+    def values(self, parameters: Dict[str, Any]) -> np.ndarray:
+        """One row of parameter values; absent parameters count as 0."""
+        return np.array([_threshold_value(parameters.get(param, 0)) for param in self.params])
+
+    def values_batch(self, inputs: Any) -> np.ndarray:
+        """
+        An inputs x parameters matrix from a list of dicts, or from a DataFrame or
+        mapping of columns (where NaN cells count as absent, i.e. 0).
+        """
+        if hasattr(inputs, "keys"):
+            n_rows = len(inputs.index) if hasattr(inputs, "index") else len(next(iter(inputs.values()), ()))
+            values = np.zeros((n_rows, len(self.params)))
+            for j, param in enumerate(self.params):
+                if param not in inputs:
+                    continue
+                column = inputs[param]
+                try:
+                    array = np.asarray(column)
+                except ValueError:
+                    # Ragged sequences in the cells
+                    array = None
+                if array is not None and array.ndim == 1 and array.dtype.kind in "biuf":
+                    array = array.astype(float)
+                    values[:, j] = np.where(np.isnan(array), 0.0, array)
+                else:
+                    values[:, j] = [
+                        0.0 if isinstance(value, float) and value != value else _threshold_value(value)
+                        for value in list(column)
+                    ]
+            return values
+        # Convert cell by cell, as values() does, so that strings such as "0.9"
+        # or sequences never meet a threshold or change the matrix's shape
+        rows = list(inputs)
+        values = np.fromiter(
+            (_threshold_value(row.get(param, 0)) for row in rows for param in self.params),
+            dtype=float, count=len(rows) * len(self.params)
+        )
+        return values.reshape(len(rows), len(self.params))
+
+    def scores(self, values: np.ndarray) -> np.ndarray:
+        """Share of each template's thresholds met, for one row or a batch of rows."""
+        if values.ndim == 1:
+            return (values >= self.thresholds).sum(axis=1) / self.sizes
+        # Templates use few of the parameters, so compare each parameter only
+        # against the templates that use it
+        counts = np.zeros((len(values), len(self.templates)))
+        for j, (users, thresholds) in enumerate(self._users):
+            counts[:, users] += values[:, j, None] >= thresholds
+        return counts / self.sizes
+
+    def detect(self, values: np.ndarray) -> Tuple[Optional[str], Dict[str, float]]:
+        if not self.templates:
+            return None, self.neutral_adjustments
+        return self._pick(self.scores(values))
+
+    def detect_batch(self, values: np.ndarray) -> List[Tuple[Optional[str], Dict[str, float]]]:
+        if not self.templates:
+            return [(None, self.neutral_adjustments)] * len(values)
+        scores = self.scores(values)
+        best = np.argmax(scores, axis=1)
+        detected = scores[np.arange(len(scores)), best] >= DETECTION_THRESHOLD
+        none = (None, self.neutral_adjustments)
+        return [
+            (self.templates[b].name, self.templates[b].weight_adjustments) if hit else none
+            for b, hit in zip(best.tolist(), detected.tolist())
+        ]
+
+    def _pick(self, scores: np.ndarray) -> Tuple[Optional[str], Dict[str, float]]:
+        # argmax keeps the first of equal scores, like max() over the templates
+        best = int(np.argmax(scores))
+        if scores[best] >= DETECTION_THRESHOLD:
+            template = self.templates[best]
+            return template.name, template.weight_adjustments
+        return None, self.neutral_adjustments
+
 class ContextEngine:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Scenario templates for ethical adjustments
+        # Scenario templates for ethical adjustments, compiled on first detection
+        self._index: Optional[Tuple[int, ScenarioIndex]] = None
         self.scenario_templates = {
             'high_risk': ScenarioTemplate(
                 name="high_risk",
@@ -69,6 +235,31 @@ class ContextEngine:
         self.context_history: List[Dict[str, Any]] = []
         self.current_context: Optional[Dict[str, Any]] = None
 
+    @property
+    def scenario_templates(self) -> ScenarioTemplates:
+        return self._scenario_templates
+
+    @scenario_templates.setter
+    def scenario_templates(self, templates: Dict[str, ScenarioTemplate]) -> None:
+        self._scenario_templates = ScenarioTemplates(templates)
+        self._index = None
+
+    def rebuild_index(self) -> ScenarioIndex:
+        """Compile the scenario templates; needed only after editing a template in place."""
+        templates = self._scenario_templates
+        version = templates.version
+        index = ScenarioIndex.compile(templates.values())
+        self._index = (version, index)
+        return index
+
+    @property
+    def scenario_index(self) -> ScenarioIndex:
+        """The compiled templates, rebuilt whenever ``scenario_templates`` changed."""
+        cached = self._index
+        if cached is None or cached[0] != self._scenario_templates.version:
+            return self.rebuild_index()
+        return cached[1]
+
     def add_context_entry(self, entry: Any) -> None:
         """Add or update a context entry."""
         self.context_store[entry['id']] = entry
@@ -95,22 +286,30 @@ class ContextEngine:
         self.logger.debug("Cleared all context")
 
     def detect_scenario(self, parameters: Dict[str, float]) -> Tuple[Optional[str], Dict[str, float]]:
-        """Detect the most relevant scenario based on parameters."""
-        scenario_scores = {}
-        for scenario_name, template in self.scenario_templates.items():
-            score = sum(
-                1 for param, threshold in template.detection_thresholds.items()
-                if parameters.get(param, 0) >= threshold
-            )
-            scenario_scores[scenario_name] = score / len(template.detection_thresholds)
+        """
+        Detect the most relevant scenario based on parameters.
 
-        if scenario_scores:
-            best_scenario = max(scenario_scores.items(), key=lambda x: x[1])
-            if best_scenario[1] >= 0.7:
-                detected_scenario = self.scenario_templates[best_scenario[0]]
-                return detected_scenario.name, detected_scenario.weight_adjustments
-        
-        return None, {key: 1.0 for key in self.scenario_templates['high_risk'].weight_adjustments}
+        The template whose thresholds are most often met wins, if it meets at
+        least 70% of them; absent parameters count as 0 and non-numeric
+        values never meet a threshold.
+        """
+        index = self.scenario_index
+        return index.detect(index.values(parameters))
+
+    def detect_scenarios(self, inputs: Any) -> List[Tuple[Optional[str], Dict[str, float]]]:
+        """
+        Detect the scenario of many inputs with one comparison against the threshold matrix.
+
+        Args:
+            inputs: A list of parameter dicts, or a DataFrame / mapping of columns with
+                one input per row.
+
+        Returns:
+            List[Tuple[Optional[str], Dict[str, float]]]: What ``detect_scenario`` returns
+            for each input, in input order.
+        """
+        index = self.scenario_index
+        return index.detect_batch(index.values_batch(inputs))
 
     def analyze_context(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze context and return adjustments."""
@@ -131,9 +330,11 @@ class ContextEngine:
 
     def _calculate_confidence(self, parameters: Dict[str, float]) -> float:
         """Calculate confidence in the context analysis."""
-        expected_params = {param for template in self.scenario_templates.values() for param in template.detection_thresholds}
-        coverage = len(set(parameters) & expected_params) / len(expected_params)
-        avg_value = np.mean([value for value in parameters.values() if isinstance(value, (int, float))])
+        expected_params = self.scenario_index.param_index
+        covered = sum(1 for param in parameters if param in expected_params)
+        coverage = covered / len(expected_params) if expected_params else 0.0
+        values = [value for value in parameters.values() if isinstance(value, (int, float))]
+        avg_value = sum(values) / len(values) if values else float("nan")
         return round((coverage + avg_value) / 2, 2)
 
     def get_context_history(self) -> List[Dict[str, Any]]:
@@ -1,24 +1,259 @@
-from typing import Dict, Any
+from typing import Dict, Any, Callable, List, Optional
+from collections import deque
 import logging
+import queue
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+OVERFLOW_POLICIES = ("block", "drop_newest", "drop_oldest")
+
 class HostAIActionController:
     def apply_decision(self, decision_report: Dict[str, Any]) -> None:
         """
-        Apply the decision report to the host AI system.
-        
+        Apply the ethical decision to the host AI system.
+
         Args:
-            decision_report (Dict[str, Any]): The decision report to apply.
+            decision_report (Dict[str, Any]): The consistent output report from AEPF.
+        """
+        logger.info("Applying ethical decision to host AI: %s", decision_report)
+        # TODO: Implement integration with the host AI system (e.g., via API call or direct configuration update)
+
+    def apply_decisions(self, decision_reports: List[Dict[str, Any]]) -> None:
         """
-        pass
+        Apply several decisions in one host call.
+
+        Integrations with a batch endpoint should override this; the default
+        applies the decisions one by one.
+
+        Args:
+            decision_reports (List[Dict[str, Any]]): The output reports, oldest first.
+        """
+        for decision_report in decision_reports:
+            self.apply_decision(decision_report)
+
+class InMemoryHostAIController(HostAIActionController):
+    """
+    In-process stand-in for a host AI, for tests and local runs.
+
+    Records every batch it receives and can simulate a slow or failing host.
+    """
+
+    def __init__(self, latency: float = 0.0, fail_times: int = 0):
+        """
+        Args:
+            latency (float): Seconds each host call takes.
+            fail_times (int): Number of host calls that raise before calls succeed.
+        """
+        self.latency = latency
+        self.fail_times = fail_times
+        self.calls = 0
+        self.batches: List[List[Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    @property
+    def applied(self) -> List[Dict[str, Any]]:
+        """Every decision applied so far, in order."""
+        with self._lock:
+            return [report for batch in self.batches for report in batch]
 
     def apply_decision(self, decision_report: Dict[str, Any]) -> None:
+        self.apply_decisions([decision_report])
+
+    def apply_decisions(self, decision_reports: List[Dict[str, Any]]) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.calls += 1
+            if self.fail_times > 0:
+                self.fail_times -= 1
+                raise ConnectionError("Host AI unavailable.")
+            self.batches.append(list(decision_reports))
+
+class QueuedActionDispatcher:
+    """
+    Applies decisions to a host controller from a background thread.
+
+    The dispatcher has the ``apply_decision`` interface of a controller, so it
+    can be passed to EthicalGovernor as its action controller: ``apply_decision``
+    only enqueues the report and returns. A worker thread coalesces queued
+    reports into batches of up to ``batch_size`` per host call, and retries a
+    failed call with exponential backoff before giving up on the batch.
+    """
+
+    def __init__(self, controller: HostAIActionController, max_queue_size: int = 1024,
+                 batch_size: int = 32, linger: float = 0.0, overflow: str = "block",
+                 block_timeout: Optional[float] = None, max_retries: int = 3,
+                 backoff_base: float = 0.05, backoff_max: float = 2.0,
+                 on_failure: Optional[Callable[[List[Dict[str, Any]], Exception], None]] = None):
         """
-        Apply the ethical decision to the host AI system.
+        Args:
+            controller (HostAIActionController): The controller that talks to the host.
+            max_queue_size (int): Maximum number of reports waiting to be applied.
+            batch_size (int): Maximum number of reports per host call.
+            linger (float): Seconds to wait for more reports before sending a partial batch.
+            overflow (str): What to do when the queue is full: "block" the caller,
+                "drop_newest" (discard the new report) or "drop_oldest" (discard the oldest queued report).
+            block_timeout (float, optional): With "block", seconds to wait before dropping the report.
+            max_retries (int): Retries of a failed host call before the batch is given up.
+            backoff_base (float): Delay before the first retry; doubled on every retry.
+            backoff_max (float): Upper bound on the retry delay.
+            on_failure (Callable, optional): Called with the batch and the last error when a batch is given up.
+
+        Raises:
+            ValueError: If the overflow policy is unknown.
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.controller = controller
+        self.batch_size = batch_size
+        self.linger = linger
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.on_failure = on_failure
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=max_queue_size)
+        self._latencies: deque = deque(maxlen=1024)
+        self._counts = {"enqueued": 0, "dropped": 0, "dispatched": 0, "batches": 0, "retries": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._worker = threading.Thread(target=self._run, name="aepf-action-dispatcher", daemon=True)
+        self._worker.start()
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counts[name] += amount
+
+    def apply_decision(self, decision_report: Dict[str, Any]) -> bool:
+        """
+        Queue a decision for the host.
 
         Args:
-            decision_report (Dict[str, Any]): The consistent output report from AEPF.
+            decision_report (Dict[str, Any]): The output report to apply.
+
+        Returns:
+            bool: False if the report was dropped by the overflow policy.
         """
-        logger.info("Applying ethical decision to host AI: %s", decision_report)
-        # TODO: Implement integration with the host AI system (e.g., via API call or direct configuration update) 
\ No newline at end of file
+        item = (time.monotonic(), decision_report)
+        try:
+            if self.overflow == "block":
+                self._queue.put(item, timeout=self.block_timeout)
+            elif self.overflow == "drop_newest":
+                self._queue.put_nowait(item)
+            else:
+                self._put_dropping_oldest(item)
+        except queue.Full:
+            self._count("dropped")
+            logger.warning("Action dispatch queue is full; dropping decision.")
+            return False
+        self._count("enqueued")
+        return True
+
+    def apply_decisions(self, decision_reports: List[Dict[str, Any]]) -> None:
+        for decision_report in decision_reports:
+            self.apply_decision(decision_report)
+
+    def _put_dropping_oldest(self, item: tuple) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self._queue.task_done()
+                self._count("dropped")
+                logger.warning("Action dispatch queue is full; dropping oldest decision.")
+
+    def _next_batch(self) -> List[tuple]:
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.batch_size:
+            try:
+                remaining = deadline - time.monotonic()
+                batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while not (self._stopping.is_set() and self._queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            try:
+                self._dispatch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _dispatch(self, batch: List[tuple]) -> None:
+        reports = [report for _, report in batch]
+        delay = self.backoff_base
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.controller.apply_decisions(reports)
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    self._count("failed", len(reports))
+                    logger.error(f"Failed to apply {len(reports)} ethical decisions to host AI: {e}")
+                    if self.on_failure:
+                        self.on_failure(reports, e)
+                    return
+                self._count("retries")
+                logger.warning(f"Host AI call failed ({e}); retrying in {delay:.2f}s.")
+                time.sleep(delay)
+                delay = min(delay * 2, self.backoff_max)
+
+        now = time.monotonic()
+        with self._lock:
+            self._counts["dispatched"] += len(reports)
+            self._counts["batches"] += 1
+            self._latencies.extend(now - enqueued_at for enqueued_at, _ in batch)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued decision has been dispatched or given up.
+
+        Args:
+            timeout (float, optional): Maximum seconds to wait.
+
+        Returns:
+            bool: True if the queue drained in time.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Dispatch what is queued, then stop the worker thread."""
+        self._stopping.set()
+        self._worker.join(timeout)
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return queue depth, dispatch counters and enqueue-to-applied latency.
+
+        Latency figures are in seconds, over the most recent 1024 dispatched decisions.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            metrics = dict(self._counts)
+        metrics["queue_depth"] = self._queue.qsize()
+        if latencies:
+            metrics["latency_mean"] = sum(latencies) / len(latencies)
+            metrics["latency_p95"] = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+            metrics["latency_max"] = latencies[-1]
+        return metrics
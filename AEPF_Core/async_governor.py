@@ -0,0 +1,205 @@
+"""
+Asyncio front end for the Ethical Governor.
+
+AsyncEthicalGovernor produces the same reports as EthicalGovernor.evaluate
+without blocking the event loop:
+
+* plugins that define a coroutine ``evaluate_async(input_data)`` are awaited
+  directly; the other plugins run on the governor's PrismExecutor in a worker
+  thread, with the same timeouts and failure isolation as the sync path;
+* history records are handed to a background writer that persists them to the
+  history store in batches;
+* reports are handed to a background dispatcher that applies them through the
+  action controller, awaiting ``apply_decision`` when it is a coroutine.
+
+Concurrency is limited by a semaphore, and both background queues are bounded,
+so callers are slowed down (backpressure) instead of queuing without limit.
+"""
+
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import asyncio
+import logging
+from ethical_prisms.ethical_prism_agent import call_evaluate
+from ethical_governor import EthicalGovernor
+from prism_executor import PrismRun, prepare_plugins
+
+logger = logging.getLogger(__name__)
+
+def _is_async_plugin(plugin: Any) -> bool:
+    return asyncio.iscoroutinefunction(getattr(plugin, "evaluate_async", None))
+
+async def _no_results() -> PrismRun:
+    return PrismRun({}, {}, [])
+
+class AsyncEthicalGovernor:
+    """Non-blocking wrapper around an EthicalGovernor."""
+
+    def __init__(self, governor: Optional[EthicalGovernor] = None, max_concurrency: int = 32,
+                 history_queue_size: int = 1024, history_batch_size: int = 256,
+                 dispatch_queue_size: int = 1024, **governor_kwargs: Any):
+        """
+        Args:
+            governor (EthicalGovernor, optional): The governor to wrap. Built from
+                ``governor_kwargs`` when omitted.
+            max_concurrency (int): Maximum number of decisions evaluated at once.
+            history_queue_size (int): Records waiting to be persisted before ``evaluate`` waits.
+            history_batch_size (int): Maximum number of records written per store call.
+            dispatch_queue_size (int): Reports waiting to be applied before ``evaluate`` waits.
+        """
+        self.governor = governor if governor is not None else EthicalGovernor(**governor_kwargs)
+        self.max_concurrency = max_concurrency
+        self.history_queue_size = history_queue_size
+        self.history_batch_size = history_batch_size
+        self.dispatch_queue_size = dispatch_queue_size
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._history_queue: Optional[asyncio.Queue] = None
+        self._dispatch_queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        """Start the background history writer and decision dispatcher."""
+        if self._tasks:
+            return
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._history_queue = asyncio.Queue(maxsize=self.history_queue_size)
+        self._dispatch_queue = asyncio.Queue(maxsize=self.dispatch_queue_size)
+        self._tasks = [
+            asyncio.create_task(self._history_writer(), name="aepf-history-writer"),
+            asyncio.create_task(self._decision_dispatcher(), name="aepf-decision-dispatcher")
+        ]
+
+    async def __aenter__(self) -> "AsyncEthicalGovernor":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def evaluate(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate the input data and produce a decision report.
+
+        Args:
+            input_data (Dict): The input data for evaluation.
+
+        Returns:
+            Dict: The report ``EthicalGovernor.evaluate`` would produce. History is
+            persisted and the decision applied in the background.
+        """
+        await self.start()
+        governor = self.governor
+        async with self._semaphore:
+            prism_run = await self._evaluate_prisms(input_data)
+            # The experta rule backend and causal inference, which may load the
+            # model from disk on first use, can block
+            record, report = await asyncio.to_thread(governor._score, input_data, prism_run)
+            governor._remember([record])
+            await self._history_queue.put(record)
+        await self._dispatch_queue.put(report)
+        return report
+
+    async def evaluate_many(self, inputs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Evaluate several decisions concurrently, within the concurrency limit.
+
+        Returns:
+            List[Dict[str, Any]]: One report per input, in input order.
+        """
+        return list(await asyncio.gather(*(self.evaluate(input_data) for input_data in inputs)))
+
+    async def _evaluate_prisms(self, input_data: Dict[str, Any]) -> PrismRun:
+        """Await async plugins and run the others on the executor, keeping plugin order."""
+        plugins = self.governor.plugin_manager.get_plugins()
+        sync_plugins = [plugin for plugin in plugins if not _is_async_plugin(plugin)]
+        # The executor validates its own plugins; async plugins are validated here
+        async_runnable, async_errors, async_skipped = prepare_plugins(
+            [plugin for plugin in plugins if _is_async_plugin(plugin)], input_data
+        )
+
+        outcomes = await asyncio.gather(
+            asyncio.to_thread(self.governor.prism_executor.run, sync_plugins, input_data)
+            if sync_plugins else _no_results(),
+            *(self._evaluate_async_plugin(plugin, plugin_input) for plugin, plugin_input in async_runnable)
+        )
+        (sync_results, errors, skipped), async_outcomes = outcomes[0], outcomes[1:]
+        errors.update(async_errors)
+        async_results = {}
+        for name, succeeded, value in async_outcomes:
+            (async_results if succeeded else errors)[name] = value
+
+        results = {}
+        for plugin in plugins:
+            name = plugin.__class__.__name__
+            if name in sync_results:
+                results[name] = sync_results[name]
+            elif name in async_results:
+                results[name] = async_results[name]
+        skipped = [plugin.__class__.__name__ for plugin in plugins
+                   if plugin.__class__.__name__ in skipped or plugin.__class__.__name__ in async_skipped]
+        return PrismRun(results, errors, skipped)
+
+    async def _evaluate_async_plugin(self, plugin: Any, input_data: Dict[str, Any]) -> Tuple[str, bool, Any]:
+        name = plugin.__class__.__name__
+        timeout = getattr(plugin, "timeout", None) or self.governor.prism_executor.timeout
+        try:
+            return name, True, await asyncio.wait_for(
+                call_evaluate(plugin.evaluate_async, input_data, self.governor.prism_executor.narratives), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"Plugin {name} timed out after {timeout}s.")
+            return name, False, f"TimeoutError: timed out after {timeout}s"
+        except Exception as e:
+            logger.error(f"Plugin {name} failed: {e}")
+            return name, False, f"{type(e).__name__}: {e}"
+
+    async def _history_writer(self) -> None:
+        """Persist queued history records in batches."""
+        queue = self._history_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.history_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await asyncio.to_thread(self.governor.history_store.extend, batch)
+            except Exception as e:
+                logger.error(f"Failed to persist {len(batch)} decision records: {e}")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+
+    async def _decision_dispatcher(self) -> None:
+        """Apply queued reports through the action controller."""
+        queue = self._dispatch_queue
+        while True:
+            report = await queue.get()
+            try:
+                controller = self.governor.action_controller
+                if controller is not None and asyncio.iscoroutinefunction(controller.apply_decision):
+                    await controller.apply_decision(report)
+                elif controller is not None:
+                    await asyncio.to_thread(controller.apply_decision, report)
+            except Exception as e:
+                logger.error(f"Failed to apply ethical decision to host AI: {e}")
+            finally:
+                queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued record is persisted and every report applied."""
+        if self._tasks:
+            await self._history_queue.join()
+            await self._dispatch_queue.join()
+
+    async def close(self, close_governor: bool = True) -> None:
+        """
+        Flush the background queues and stop the background tasks.
+
+        Args:
+            close_governor (bool): Also close the wrapped governor's pool and history store.
+        """
+        await self.flush()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if close_governor:
+            await asyncio.to_thread(self.governor.close)
@@ -0,0 +1,239 @@
+"""
+Versioned on-disk format for the governor's causal model.
+
+A saved model is a directory holding two files:
+
+* ``manifest.json`` - format version, node list, edge list and one entry per CPD
+  (variable, evidence, cardinalities, state names and the name of its array);
+* ``cpds-<id>.npz`` - the CPD value tables as plain NumPy arrays, under a name
+  unique to each save (models written before this used ``cpds.npz``).
+
+The manifest names its arrays file, so replacing the manifest is the single
+step that publishes a new model: a reader sees the old model or the new one,
+never the new arrays with the old manifest.
+
+Nothing is unpickled on load, so the files are safe to read and do not depend on
+the pgmpy version that wrote them. pgmpy is only imported when a model is
+rebuilt from the loaded specification.
+"""
+
+from typing import Dict, Any, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import logging
+import os
+import pickle
+import re
+import uuid
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FORMAT_NAME = "aepf-causal-model"
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+ARRAYS_FILE = "cpds.npz"  # Arrays file of models saved before it was versioned
+_ARRAYS_PATTERN = re.compile(r"^cpds(-[0-9a-f]+)?\.npz$")
+
+@dataclass
+class CPDSpec:
+    """A conditional probability table in the shape TabularCPD expects."""
+    variable: str
+    variable_card: int
+    values: np.ndarray
+    evidence: List[str] = field(default_factory=list)
+    evidence_card: List[int] = field(default_factory=list)
+    state_names: Dict[str, list] = field(default_factory=dict)
+
+@dataclass
+class CausalModelSpec:
+    """Structure and CPDs of a causal model, independent of pgmpy."""
+    nodes: List[str]
+    edges: List[Tuple[str, str]]
+    cpds: List[CPDSpec]
+
+    @classmethod
+    def from_model(cls, model: Any) -> "CausalModelSpec":
+        """
+        Capture a pgmpy BayesianNetwork.
+
+        Args:
+            model: The pgmpy model to capture.
+
+        Returns:
+            CausalModelSpec: The model's nodes, edges and CPD tables.
+        """
+        cpds = []
+        for cpd in model.get_cpds():
+            evidence = list(cpd.variables[1:])
+            cpds.append(CPDSpec(
+                variable=cpd.variable,
+                variable_card=int(cpd.variable_card),
+                values=np.asarray(cpd.get_values(), dtype=float),
+                evidence=evidence,
+                evidence_card=[int(card) for card in cpd.cardinality[1:]],
+                state_names={var: list(states) for var, states in cpd.state_names.items()}
+            ))
+        return cls(list(model.nodes()), [tuple(edge) for edge in model.edges()], cpds)
+
+    def to_model(self) -> Any:
+        """
+        Rebuild a checked pgmpy BayesianNetwork.
+
+        Raises:
+            ValueError: If the CPDs do not form a valid model.
+        """
+        from pgmpy.models import BayesianNetwork
+        from pgmpy.factors.discrete import TabularCPD
+
+        model = BayesianNetwork(self.edges)
+        model.add_nodes_from(self.nodes)
+        for spec in self.cpds:
+            model.add_cpds(TabularCPD(
+                variable=spec.variable,
+                variable_card=spec.variable_card,
+                values=spec.values,
+                evidence=spec.evidence or None,
+                evidence_card=spec.evidence_card or None,
+                state_names=spec.state_names or {}
+            ))
+        model.check_model()
+        return model
+
+def _replace_atomically(path: Path, write) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _manifest_arrays(directory: Path) -> Optional[str]:
+    """Return the arrays file the current manifest points at, if there is a readable one."""
+    try:
+        with open(directory / MANIFEST_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("arrays", ARRAYS_FILE)
+    except (OSError, ValueError):
+        return None
+
+def save_causal_model(spec: Union[CausalModelSpec, Any], directory: Union[str, Path]) -> Path:
+    """
+    Write a causal model in the versioned format.
+
+    The arrays go to a new file first, then the manifest pointing at them
+    replaces the old one atomically. Arrays files older than the one the
+    replaced manifest pointed at are removed; that one is kept so a reader
+    that has just read the old manifest can still open its arrays.
+
+    Args:
+        spec: A CausalModelSpec, or a pgmpy BayesianNetwork to capture.
+        directory (Union[str, Path]): The model directory to write.
+
+    Returns:
+        Path: The path of the written manifest.
+
+    Raises:
+        ValueError: If the state names cannot be stored as JSON.
+    """
+    if not isinstance(spec, CausalModelSpec):
+        spec = CausalModelSpec.from_model(spec)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    arrays = {f"cpd_{i}": cpd.values for i, cpd in enumerate(spec.cpds)}
+    arrays_file = f"cpds-{uuid.uuid4().hex}.npz"
+    manifest = {
+        "format": FORMAT_NAME,
+        "version": FORMAT_VERSION,
+        "arrays": arrays_file,
+        "nodes": list(spec.nodes),
+        "edges": [list(edge) for edge in spec.edges],
+        "cpds": [
+            {
+                "variable": cpd.variable,
+                "variable_card": cpd.variable_card,
+                "evidence": list(cpd.evidence),
+                "evidence_card": list(cpd.evidence_card),
+                "state_names": cpd.state_names,
+                "array": f"cpd_{i}"
+            }
+            for i, cpd in enumerate(spec.cpds)
+        ]
+    }
+    try:
+        manifest_bytes = json.dumps(manifest, indent=2).encode("utf-8")
+    except TypeError as e:
+        raise ValueError(f"Causal model cannot be stored in the manifest: {e}")
+
+    previous = _manifest_arrays(directory)
+    _replace_atomically(directory / arrays_file, lambda f: np.savez(f, **arrays))
+    _replace_atomically(directory / MANIFEST_FILE, lambda f: f.write(manifest_bytes))
+    for name in os.listdir(directory):
+        if _ARRAYS_PATTERN.match(name) and name not in (arrays_file, previous):
+            (directory / name).unlink(missing_ok=True)
+    logger.info(f"Saved causal model with {len(spec.cpds)} CPDs to {directory}.")
+    return directory / MANIFEST_FILE
+
+def load_causal_model(directory: Union[str, Path]) -> CausalModelSpec:
+    """
+    Read a causal model written by ``save_causal_model``.
+
+    Args:
+        directory (Union[str, Path]): The model directory.
+
+    Returns:
+        CausalModelSpec: The stored structure and CPD tables.
+
+    Raises:
+        FileNotFoundError: If the directory has no manifest.
+        ValueError: If the manifest is not a supported version of the format.
+    """
+    directory = Path(directory)
+    with open(directory / MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != FORMAT_NAME:
+        raise ValueError(f"{directory} does not contain a causal model.")
+    if manifest.get("version", 0) > FORMAT_VERSION:
+        raise ValueError(
+            f"Causal model format version {manifest.get('version')} is newer than the supported version {FORMAT_VERSION}."
+        )
+
+    with np.load(directory / manifest.get("arrays", ARRAYS_FILE), allow_pickle=False) as arrays:
+        cpds = [
+            CPDSpec(
+                variable=entry["variable"],
+                variable_card=int(entry["variable_card"]),
+                values=arrays[entry["array"]],
+                evidence=list(entry.get("evidence", [])),
+                evidence_card=[int(card) for card in entry.get("evidence_card", [])],
+                state_names=entry.get("state_names", {})
+            )
+            for entry in manifest["cpds"]
+        ]
+    return CausalModelSpec(
+        nodes=list(manifest["nodes"]),
+        edges=[tuple(edge) for edge in manifest["edges"]],
+        cpds=cpds
+    )
+
+def migrate_pickle_model(pickle_path: Union[str, Path], directory: Union[str, Path]) -> Optional[Path]:
+    """
+    Convert a legacy pickled pgmpy model to the versioned format.
+
+    Only run this on pickle files you trust: unpickling can execute arbitrary code.
+
+    Args:
+        pickle_path (Union[str, Path]): The legacy ``.pkl`` model file.
+        directory (Union[str, Path]): The model directory to write.
+
+    Returns:
+        Optional[Path]: The written manifest, or None if the pickle does not hold
+        a model with CPDs that can be converted.
+    """
+    with open(pickle_path, "rb") as f:
+        model = pickle.load(f)
+    if not (hasattr(model, "get_cpds") and hasattr(model, "edges")):
+        logger.warning(f"{pickle_path} does not hold a pgmpy model; it cannot be migrated.")
+        return None
+    return save_causal_model(model, directory)
@@ -0,0 +1,117 @@
+"""
+Precompiled conditional tables for the governor's causal model.
+
+The causal structure used by the Ethical Governor is a single target node
+(``final_score``) whose parents are independent root nodes. For that shape the
+posterior of the target given any subset of observed parents can be computed
+ahead of time: the unobserved parents are summed out against their priors once,
+and every query becomes an array lookup instead of a variable elimination run.
+"""
+
+from typing import Dict, Any, Optional, Tuple
+import logging
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+class CompiledCausalTable:
+    """
+    Posterior tables of a target node for every subset of observed parents.
+
+    Use ``compile`` to build one from a pgmpy model; it returns None when the
+    model does not have the single-target, root-parents shape, in which case the
+    caller keeps using variable elimination.
+    """
+
+    def __init__(self, target: str, parents: Tuple[str, ...], target_cpd: np.ndarray,
+                 priors: Dict[str, np.ndarray], state_names: Dict[str, list]):
+        """
+        Materialize the posterior table for every evidence subset.
+
+        Args:
+            target (str): The query variable.
+            parents (Tuple[str, ...]): The target's parents, in the CPD's evidence order.
+            target_cpd (np.ndarray): P(target | parents) with shape (target_card, *parent_cards).
+            priors (Dict[str, np.ndarray]): Marginal distribution of each parent.
+            state_names (Dict[str, list]): State names of each parent, in index order.
+        """
+        self.target = target
+        self.parents = parents
+        self._state_index = {
+            parent: {state: i for i, state in enumerate(state_names[parent])} for parent in parents
+        }
+        # Move the target axis last so observed parent states index straight into it
+        joint = np.moveaxis(np.asarray(target_cpd, dtype=float), 0, -1)
+        self._tables: Dict[int, np.ndarray] = {}
+        for mask in range(1 << len(parents)):
+            table = joint
+            # Sum out unobserved parents from the last axis backwards so earlier axes keep their position
+            for axis in reversed(range(len(parents))):
+                if not mask & (1 << axis):
+                    table = np.tensordot(priors[parents[axis]], table, axes=([0], [axis]))
+            totals = table.sum(axis=-1, keepdims=True)
+            self._tables[mask] = np.divide(table, totals, out=np.zeros_like(table), where=totals > 0)
+
+    @classmethod
+    def compile(cls, model: Any, target: str) -> Optional["CompiledCausalTable"]:
+        """
+        Compile a checked pgmpy model for queries on ``target``.
+
+        Args:
+            model: A pgmpy BayesianNetwork whose CPDs have been added.
+            target (str): The query variable.
+
+        Returns:
+            Optional[CompiledCausalTable]: The compiled tables, or None if the model
+            is not a target with independent root parents.
+        """
+        if target not in model.nodes():
+            return None
+        target_cpd = model.get_cpds(target)
+        if target_cpd is None:
+            return None
+        # The CPD's evidence order decides the axis layout of its values
+        parents = tuple(target_cpd.variables[1:])
+        if set(parents) != set(model.get_parents(target)) or set(model.nodes()) != {target, *parents}:
+            return None
+        if any(model.get_parents(parent) for parent in parents):
+            return None
+
+        priors, state_names = {}, {}
+        for parent in parents:
+            cpd = model.get_cpds(parent)
+            if cpd is None:
+                return None
+            priors[parent] = np.asarray(cpd.values, dtype=float).reshape(-1)
+            state_names[parent] = list(cpd.state_names[parent])
+        logger.debug(f"Compiled causal table for {target} over {len(parents)} parents.")
+        return cls(target, parents, target_cpd.values, priors, state_names)
+
+    def supports(self, evidence: Dict[str, Any]) -> bool:
+        """Return True if every evidence item is a known state of one of the parents."""
+        for variable, state in evidence.items():
+            states = self._state_index.get(variable)
+            try:
+                if states is None or state not in states:
+                    return False
+            except TypeError:
+                return False
+        return True
+
+    def query(self, evidence: Dict[str, Any]) -> np.ndarray:
+        """
+        Return the posterior distribution of the target given the evidence.
+
+        Args:
+            evidence (Dict[str, Any]): Observed parent states. Must pass ``supports``.
+
+        Returns:
+            np.ndarray: The target's distribution, as VariableElimination would return it.
+        """
+        mask = 0
+        index = []
+        for axis, parent in enumerate(self.parents):
+            if parent in evidence:
+                mask |= 1 << axis
+                index.append(self._state_index[parent][evidence[parent]])
+        return self._tables[mask][tuple(index)].copy()
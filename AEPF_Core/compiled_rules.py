@@ -0,0 +1,199 @@
+"""
+Declarative threshold rules for the Ethical Governor and a compiled evaluator.
+
+The rules are the single source of truth for both rule backends: rule_engine.py
+builds the experta KnowledgeEngine rules from THRESHOLD_RULES, and
+CompiledRuleEngine turns the same table into threshold arrays that can be
+evaluated per row or vectorized over a batch without running Rete.
+"""
+
+from typing import Dict, Any, Iterable, List, Sequence, Tuple
+from dataclasses import dataclass, field
+import logging
+import operator
+import numpy as np
+
+OPERATORS = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+@dataclass(frozen=True)
+class ThresholdRule:
+    """A rule that declares a weight fact when every field passes its threshold."""
+    name: str
+    conditions: Tuple[Tuple[str, str, float], ...]
+    fact: Tuple[str, float]
+    description: str = ""
+
+@dataclass(frozen=True)
+class RuleOutcome:
+    """Rules fired for one input and the weight facts they declared."""
+    fired: Tuple[str, ...] = ()
+    facts: Dict[str, float] = field(default_factory=dict)
+
+THRESHOLD_RULES: Tuple[ThresholdRule, ...] = (
+    ThresholdRule(
+        name="increase_human_centric_weight",
+        conditions=(("bias_reduction", ">", 0.7), ("fairness_score", ">", 0.8)),
+        fact=("human_centric_weight", 1.1),
+        description="Increase human_centric weight",
+    ),
+    ThresholdRule(
+        name="decrease_sentient_first_weight",
+        conditions=(("sentient_welfare", "<", 0.5),),
+        fact=("sentient_first_weight", 0.9),
+        description="Decrease sentient_first weight",
+    ),
+    # Increase equity_focused weight if equity_score is high
+    ThresholdRule(
+        name="increase_equity_focused_weight",
+        conditions=(("equity_score", ">", 0.8),),
+        fact=("equity_focused_weight", 1.2),
+        description="Increase equity_focused weight",
+    ),
+    # Decrease innovation_focused weight if financial_risk is high
+    ThresholdRule(
+        name="decrease_innovation_focused_weight",
+        conditions=(("financial_risk", ">", 0.7),),
+        fact=("innovation_focused_weight", 0.8),
+        description="Decrease innovation_focused weight",
+    ),
+    # Increase ecocentric weight if carbon_footprint is low
+    ThresholdRule(
+        name="increase_ecocentric_weight",
+        conditions=(("carbon_footprint", "<", 0.3),),
+        fact=("ecocentric_weight", 1.2),
+        description="Increase ecocentric weight",
+    ),
+)
+
+def _as_number(value: Any) -> float:
+    """Return the value as a float, or NaN when it cannot be compared numerically."""
+    if isinstance(value, (int, float, np.number)):
+        return float(value)
+    return np.nan
+
+class CompiledRuleEngine:
+    """
+    Evaluates ThresholdRules from a precomputed threshold table.
+
+    Every condition becomes one column of the table (field index, operator and
+    threshold). A rule fires when all of its conditions pass; a missing or
+    non-numeric field never passes, matching the experta pattern match.
+    """
+
+    def __init__(self, rules: Sequence[ThresholdRule] = THRESHOLD_RULES):
+        """
+        Compile the rules into a threshold table.
+
+        Args:
+            rules (Sequence[ThresholdRule]): The rules to compile.
+
+        Raises:
+            ValueError: If a rule uses an unsupported comparison operator.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.rules = tuple(rules)
+        self.fields: List[str] = []
+        field_index: Dict[str, int] = {}
+        rule_index, cond_fields, cond_ops, cond_thresholds = [], [], [], []
+
+        for i, rule in enumerate(self.rules):
+            for field_name, op, threshold in rule.conditions:
+                if op not in OPERATORS:
+                    raise ValueError(f"Rule {rule.name} uses unsupported operator '{op}'.")
+                if field_name not in field_index:
+                    field_index[field_name] = len(self.fields)
+                    self.fields.append(field_name)
+                rule_index.append(i)
+                cond_fields.append(field_index[field_name])
+                cond_ops.append(op)
+                cond_thresholds.append(float(threshold))
+
+        self.field_index = field_index
+        self.rule_names = tuple(rule.name for rule in self.rules)
+        self._rule_index = np.array(rule_index, dtype=np.intp)
+        self._cond_fields = np.array(cond_fields, dtype=np.intp)
+        self._op_columns = {
+            op: np.array([i for i, cond_op in enumerate(cond_ops) if cond_op == op], dtype=np.intp)
+            for op in set(cond_ops)
+        }
+        self._thresholds = np.array(cond_thresholds, dtype=float)
+        # Conditions are laid out rule by rule, so each rule owns a contiguous slice
+        counts = np.bincount(self._rule_index, minlength=len(self.rules))
+        stops = np.cumsum(counts)
+        self._rule_slices = [slice(stop - count, stop) for count, stop in zip(counts, stops)]
+        # Row path: (field, comparison, threshold) per rule, bound once
+        self._row_table = [
+            (rule, [(f, OPERATORS[op], float(t)) for f, op, t in rule.conditions])
+            for rule in self.rules
+        ]
+
+    def evaluate(self, input_data: Dict[str, Any]) -> RuleOutcome:
+        """
+        Evaluate the rules for a single input.
+
+        Args:
+            input_data (Dict[str, Any]): The input facts.
+
+        Returns:
+            RuleOutcome: The fired rules (in rule order) and the facts they declared.
+        """
+        fired, facts = [], {}
+        for rule, conditions in self._row_table:
+            if all(compare(_as_number(input_data.get(f)), t) for f, compare, t in conditions):
+                fired.append(rule.name)
+                facts[rule.fact[0]] = rule.fact[1]
+        if fired:
+            self.logger.debug(f"Rules triggered: {', '.join(fired)}")
+        return RuleOutcome(tuple(fired), facts)
+
+    def fired_matrix(self, inputs: Iterable[Dict[str, Any]]) -> np.ndarray:
+        """
+        Evaluate every rule for a batch of inputs in one vectorized pass.
+
+        Args:
+            inputs (Iterable[Dict[str, Any]]): The input facts, one dict per row.
+
+        Returns:
+            np.ndarray: Boolean matrix of shape (rows, rules); True where the rule fired.
+        """
+        rows = list(inputs)
+        values = np.array(
+            [[_as_number(row.get(f)) for f in self.fields] for row in rows], dtype=float
+        ).reshape(len(rows), len(self.fields))
+        cond_values = values[:, self._cond_fields]
+        passed = np.empty(cond_values.shape, dtype=bool)
+        for op, columns in self._op_columns.items():
+            # NaN compares False, so missing fields never pass
+            passed[:, columns] = OPERATORS[op](cond_values[:, columns], self._thresholds[columns])
+        fired = np.empty((len(rows), len(self.rules)), dtype=bool)
+        for i, conditions in enumerate(self._rule_slices):
+            fired[:, i] = passed[:, conditions].all(axis=1)
+        return fired
+
+    def evaluate_batch(self, inputs: Iterable[Dict[str, Any]]) -> List[RuleOutcome]:
+        """
+        Evaluate the rules for a batch of inputs.
+
+        Args:
+            inputs (Iterable[Dict[str, Any]]): The input facts, one dict per row.
+
+        Returns:
+            List[RuleOutcome]: One outcome per input row, identical to ``evaluate``.
+        """
+        fired = self.fired_matrix(inputs)
+        outcomes = []
+        # Rows that fire the same rules share one outcome object
+        cache: Dict[bytes, RuleOutcome] = {}
+        for row in fired:
+            key = row.tobytes()
+            if key not in cache:
+                names = tuple(self.rule_names[i] for i in np.flatnonzero(row))
+                facts = dict(self.rules[i].fact for i in np.flatnonzero(row))
+                cache[key] = RuleOutcome(names, facts)
+            outcomes.append(cache[key])
+        return outcomes
@@ -1,19 +1,20 @@
-import os
 import pandas as pd
 import logging
+from pgmpy.models import BayesianNetwork
+from pgmpy.estimators import BayesianEstimator
 from ethical_governor import EthicalGovernor
 
 logger = logging.getLogger(__name__)
 
+PRISMS = ["human_centric", "sentient_first", "ecocentric", "innovation_focused", "equity_focused"]
+
 def create_and_save_causal_model():
     try:
-        # Initialize the Ethical Governor
-        eg = EthicalGovernor()
+        # Each prism score feeds the final score
+        causal_structure = [(prism, "final_score") for prism in PRISMS]
 
-        # Ensure the models directory exists
-        models_dir = os.path.dirname(eg.causal_model_path)
-        if not os.path.exists(models_dir):
-            os.makedirs(models_dir)
+        # Initialize the Ethical Governor
+        eg = EthicalGovernor(causal_structure)
 
         # Example data to fit the Bayesian Network
         # Replace this with your actual data
@@ -26,12 +27,23 @@ def create_and_save_causal_model():
             "final_score": [0.75, 0.85, 0.65]
         })
 
-        # Update and save the causal model
-        eg.update_causal_model(data)
-        logger.info("Causal model updated and saved successfully.")
+        # The network is discrete: 0 = low (< 0.5), 1 = high
+        discrete_data = (data >= 0.5).astype(int)
+        model = BayesianNetwork(causal_structure)
+        model.fit(
+            discrete_data,
+            estimator=BayesianEstimator,
+            prior_type="BDeu",
+            state_names={column: [0, 1] for column in discrete_data.columns}
+        )
+
+        # Update and save the causal model in the versioned format
+        eg.update_causal_model({cpd.variable: cpd for cpd in model.get_cpds()})
+        manifest_path = eg.save_causal_model()
+        logger.info(f"Causal model updated and saved successfully to {manifest_path.parent}.")
 
     except Exception as e:
         logger.error(f"Failed to create and save causal model: {e}")
 
 if __name__ == "__main__":
-    create_and_save_causal_model() 
\ No newline at end of file
+    create_and_save_causal_model()
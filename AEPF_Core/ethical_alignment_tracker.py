@@ -1,6 +1,13 @@
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import deque
+from itertools import combinations
+from prism_agreement import PrismAgreementMatrix, prism_scores
+
+STATUSES = ("harmonious", "conflicted")
+
+# Below this scale the decayed counts are folded back into plain counts
+_RESCALE_BELOW = 1e-100
 
 @dataclass
 class AlignmentScore:
@@ -9,37 +16,189 @@ class AlignmentScore:
     details: Dict[str, Any]
 
 class EthicalAlignmentTracker:
-    def __init__(self):
-        self.alignment_history = []
+    """
+    Streaming tally of which prism pairs agree and which conflict.
+
+    Each recorded decision classifies every pair of prisms: a pair whose
+    scores are within ``harmony_tolerance`` of each other is harmonious, one
+    whose scores are at least ``conflict_threshold`` apart is conflicted.
+    Pair counts are updated as each decision arrives, over either
+
+    * a sliding window of the last ``window`` decisions (the default), or
+    * an exponentially decayed window when ``decay`` is given: every new
+      decision multiplies the weight of the earlier ones by ``decay``.
+
+    Recurring-pattern queries read the counts directly, so they cost
+    O(pairs) however long the tracker has been running, and memory is
+    bounded by the window. Every decision also feeds ``agreement``, the
+    running correlation of the prisms' scores.
+    """
+
+    def __init__(self, window: int = 1000, decay: Optional[float] = None,
+                 harmony_tolerance: float = 0.1, conflict_threshold: float = 0.3,
+                 agreement: Optional[PrismAgreementMatrix] = None):
+        """
+        Args:
+            window (int): Number of recent decisions kept in the sliding window and in
+                ``alignment_history``.
+            decay (float, optional): Per-decision decay factor in (0, 1). Switches the
+                counts from a sliding window to an exponentially decayed one.
+            harmony_tolerance (float): Largest score gap for a harmonious pair.
+            conflict_threshold (float): Smallest score gap for a conflicted pair.
+            agreement (PrismAgreementMatrix, optional): Agreement matrix to feed, e.g.
+                one shared with the governor. A new one is created when omitted.
+
+        Raises:
+            ValueError: If the window or decay factor is out of range.
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1.")
+        if decay is not None and not 0 < decay < 1:
+            raise ValueError("decay must be between 0 and 1.")
+        self.window = window
+        self.decay = decay
+        self.harmony_tolerance = harmony_tolerance
+        self.conflict_threshold = conflict_threshold
+        self.alignment_history = deque(maxlen=window)
+        self.agreement = agreement if agreement is not None else PrismAgreementMatrix()
+        self.decisions = 0
+        self._counts: Dict[str, Dict[Tuple[str, str], float]] = {status: {} for status in STATUSES}
+        # Decayed counts are stored divided by the running decay factor, so
+        # an update touches only the pairs in the new decision
+        self._scale = 1.0
+
+    def classify(self, prism_scores: Dict[str, float]) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Split the prism pairs of one decision into harmonious and conflicted pairs.
+
+        Pairs are sorted by name, so (a, b) and (b, a) are the same pair.
+        """
+        patterns = {status: [] for status in STATUSES}
+        for (a, score_a), (b, score_b) in combinations(sorted(prism_scores.items()), 2):
+            gap = abs(score_a - score_b)
+            if gap <= self.harmony_tolerance:
+                patterns["harmonious"].append((a, b))
+            elif gap >= self.conflict_threshold:
+                patterns["conflicted"].append((a, b))
+        return patterns
+
+    def record_decision(self, prism_results: Dict[str, Any]) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Add one decision to the tracker.
+
+        Args:
+            prism_results (Dict[str, Any]): Prism name to score, or to a result
+                dict with a 'score', as found in a governor report.
+
+        Returns:
+            Dict[str, List[Tuple[str, str]]]: The decision's harmonious and conflicted pairs.
+        """
+        scores = prism_scores(prism_results)
+        patterns = self.classify(scores)
+        if self.decay is None:
+            if len(self.alignment_history) == self.window:
+                self._add(self.alignment_history[0]["patterns"], -1.0)
+            self._add(patterns, 1.0)
+        else:
+            self._scale *= self.decay
+            if self._scale < _RESCALE_BELOW:
+                self._rescale()
+            self._add(patterns, 1.0 / self._scale)
+        self.alignment_history.append({"scores": scores, "patterns": patterns})
+        self.agreement.update(scores)
+        self.decisions += 1
+        return patterns
+
+    def record_decisions(self, results: Iterable[Dict[str, Any]]) -> None:
+        """Add several decisions, oldest first."""
+        for prism_results in results:
+            self.record_decision(prism_results)
+
+    def _add(self, patterns: Dict[str, List[Tuple[str, str]]], amount: float) -> None:
+        for status, pairs in patterns.items():
+            counts = self._counts[status]
+            for pair in pairs:
+                count = counts.get(pair, 0.0) + amount
+                if count > 0:
+                    counts[pair] = count
+                else:
+                    counts.pop(pair, None)
+
+    def _rescale(self) -> None:
+        for counts in self._counts.values():
+            for pair in list(counts):
+                counts[pair] *= self._scale
+                # Drop pairs whose weight has decayed to nothing
+                if counts[pair] < 1e-12:
+                    del counts[pair]
+        self._scale = 1.0
+
+    def pair_counts(self, status: str) -> Dict[Tuple[str, str], float]:
+        """
+        Return how often each pair was harmonious or conflicted in the window.
+
+        With a decayed window the counts are the decayed weights.
+        """
+        return {pair: count * self._scale for pair, count in self._counts[status].items()}
 
     def evaluate_alignment(self) -> float:
-        # Placeholder implementation
-        return 0.85
+        """
+        Return the share of classified pairs in the window that are harmonious.
+
+        Returns 1.0 until a harmonious or conflicted pair has been seen.
+        """
+        harmonious = sum(self._counts["harmonious"].values())
+        conflicted = sum(self._counts["conflicted"].values())
+        if harmonious + conflicted == 0:
+            return 1.0
+        return harmonious / (harmonious + conflicted)
 
     def generate_narrative(self) -> str:
-        return "Alignment analysis completed successfully"
-    
+        if not self.alignment_history:
+            return "Alignment analysis completed successfully"
+        recurring = self.get_recurring_patterns()
+        return (
+            f"Prism alignment is {self.evaluate_alignment():.2f} over the last "
+            f"{len(self.alignment_history)} decisions, with {len(recurring['harmonious'])} recurring "
+            f"harmonious and {len(recurring['conflicted'])} recurring conflicted prism pairs."
+        )
+
     def get_alignment_history(self) -> List[Dict[str, Any]]:
-        """Get historical alignment patterns"""
-        return self.alignment_history
-    
-    def get_recurring_patterns(self) -> Dict[str, List[Tuple[str, str]]]:
-        """Identify recurring alignment patterns"""
-        recurring = {
-            "harmonious": [],
-            "conflicted": []
+        """Get historical alignment patterns, oldest first, for the decisions still in the window"""
+        return list(self.alignment_history)
+
+    @property
+    def alignment_patterns(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Every classified pair in the window, by status."""
+        return {
+            status: [
+                {"prisms": pair}
+                for entry in self.alignment_history
+                for pair in entry["patterns"][status]
+            ]
+            for status in STATUSES
+        }
+
+    def get_recurring_patterns(self, min_count: float = 1.0) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Identify recurring alignment patterns.
+
+        Args:
+            min_count (float): Pairs counted more than this many times recur. With a
+                decayed window this is compared with the decayed weight.
+
+        Returns:
+            Dict[str, List[Tuple[str, str]]]: Recurring harmonious and conflicted pairs.
+        """
+        threshold = min_count / self._scale
+        return {
+            status: [pair for pair, count in self._counts[status].items() if count > threshold]
+            for status in STATUSES
         }
-        
-        # Count occurrences of each prism pair in patterns
-        for status in ["harmonious", "conflicted"]:
-            pair_counts = defaultdict(int)
-            for alignment in self.alignment_patterns[status]:
-                pair = alignment["prisms"]
-                pair_counts[pair] += 1
-            
-            # Add pairs that appear multiple times
-            for pair, count in pair_counts.items():
-                if count > 1:
-                    recurring[status].append(pair)
-        
-        return recurring 
\ No newline at end of file
+
+    def reset(self) -> None:
+        """Forget every recorded decision."""
+        self.alignment_history.clear()
+        self.decisions = 0
+        self._counts = {status: {} for status in STATUSES}
+        self._scale = 1.0
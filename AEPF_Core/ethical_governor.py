@@ -1,42 +1,79 @@
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Iterable, List, Optional, Tuple, Union
+import inspect
 import logging
 import pickle
+import sys
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-import numpy as np
-import networkx as nx
-from causalnex.structure.notears import from_pandas
-from causalnex.inference import InferenceEngine
-from causalnex.structure import StructureModel
-from causalnex.network import BayesianNetwork
-from causalnex.plots import plot_structure
 from ethical_prisms.ecocentric import EcocentricPrism
 from ethical_prisms.equity_focused import EquityFocusedPrism
 from ethical_prisms.human_centric import HumanCentricPrism
 from ethical_prisms.innovation_focused import InnovationFocusedPrism
 from ethical_prisms.sentient_first import SentientFirstPrism
 from Context_manager import ContextEngine
-import os
-from rule_engine import EthicalGovernorRules, EthicalContext
-import pandas as pd  # Ensure pandas is imported
-from pgmpy.models import BayesianNetwork
-from pgmpy.inference import VariableElimination
-from pgmpy.factors.discrete import TabularCPD
+from location_context import LocationContextManager
+from compiled_rules import CompiledRuleEngine, RuleOutcome
 from plugin_manager import PluginManager
 from action_controller import HostAIActionController
+from history_store import HistoryStore, SQLiteHistoryStore, import_pickle_history
+from query_cache import LRUQueryCache, canonical_evidence
+from prism_agreement import PrismAgreementMatrix
+from prism_executor import PrismExecutor, PrismRun
+from weight_checkpoints import WeightCheckpointStore
+from compiled_causal import CompiledCausalTable
+from causal_model_store import MANIFEST_FILE, load_causal_model as load_model_spec, save_causal_model as save_model_spec
+
+# pgmpy, pandas and experta are slow to import and only needed by the causal
+# model, DataFrame input and the experta rule backend, so they are imported
+# where those features are used.
+if TYPE_CHECKING:
+    import pandas as pd
+    from pgmpy.models import BayesianNetwork
+    from pgmpy.factors.discrete import TabularCPD
+    from pgmpy.inference import VariableElimination
+    from rule_engine import EthicalGovernorRules
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+def _copy_prediction(prediction: Any) -> Any:
+    """Copy a causal prediction so callers cannot mutate a cached result."""
+    return prediction.copy() if hasattr(prediction, "copy") else prediction
+
 class EthicalGovernor:
-    def __init__(self, causal_structure: List[tuple] = None, action_controller: HostAIActionController = None):
+    def __init__(self, causal_structure: List[tuple] = None, action_controller: HostAIActionController = None,
+                 history_store: HistoryStore = None, history_window: int = 1000,
+                 rule_backend: str = "compiled", causal_cache_size: int = 1024,
+                 causal_cache_ttl: float = None, executor_mode: str = "serial",
+                 max_workers: int = None, plugin_timeout: float = None,
+                 weight_checkpoints: WeightCheckpointStore = None, narratives: bool = False):
         """
         Initialize the Ethical Governor with a configurable causal structure.
 
         Args:
             causal_structure (List[tuple], optional): List of edges defining the Bayesian network structure.
             action_controller: The action controller for applying decisions to the host AI.
+            history_store (HistoryStore, optional): Backend for the decision history. Defaults to an
+                SQLite store next to the legacy pickle file, which is imported on first use.
+            history_window (int): Number of recent decisions kept in memory in ``decision_history``.
+            rule_backend (str): "compiled" evaluates the threshold rules from a precomputed table;
+                "experta" runs the experta KnowledgeEngine, for rules too complex to compile.
+            causal_cache_size (int): Maximum number of causal query results kept in the LRU cache.
+            causal_cache_ttl (float, optional): Seconds a cached causal query result stays valid.
+            executor_mode (str): How plugins run: "serial", "thread" or "process".
+            max_workers (int, optional): Pool size for the thread and process modes.
+            plugin_timeout (float, optional): Seconds each plugin may take in the pooled modes.
+                Plugins that fail or time out are listed under ``full_report['prism_errors']``.
+                Plugins that declare an input schema are validated before they run, and those
+                with none of their inputs present are listed under ``full_report['prism_skipped']``.
+            weight_checkpoints (WeightCheckpointStore, optional): Checkpointed prism weights,
+                e.g. written by an RL learner. The latest checkpoint replaces the default
+                base weights at startup; see ``load_weights`` to hot-swap later ones.
+            narratives (bool): Render the prisms' metric narratives into every report.
+                Off by default, since formatting the text dominates prism time on hot
+                batches; ``render_narratives`` adds it to a report that is shown.
         """
         self.logger = logging.getLogger(self.__class__.__name__)
         self.prisms = {
@@ -47,34 +84,237 @@ class EthicalGovernor:
             "sentient_first": SentientFirstPrism()
         }
         self.context_engine = ContextEngine()
+        if rule_backend not in ("compiled", "experta"):
+            raise ValueError(f"Unknown rule backend: {rule_backend}")
+        self.rule_backend = rule_backend
+        self.compiled_rules = CompiledRuleEngine()
+        self.location_context = LocationContextManager()
+        self.weight_cache_size = 256
+        self.base_weights = {
+            'equity_focused': 0.3,
+            'human_centric': 0.3,
+            'innovation_focused': 0.15,
+            'ecocentric': 0.15,
+            'sentient_first': 0.1
+        }
+        self.weight_checkpoints = weight_checkpoints
+        if weight_checkpoints is not None:
+            self.load_weights()
         self.history_path = Path("history/ethical_governor_history.pkl")
         self.causal_model_path = Path("models/causal_model.pkl")
+        self.causal_model_dir = Path("models/causal_model")
+        self.history_window = history_window
+        self.history_store = history_store if history_store is not None else self._default_history_store()
         self.decision_history = self.load_history()
-        self.causal_model = BayesianNetwork(causal_structure or [])
-        self.inference = None  # Delay inference initialization
+        self.causal_structure = list(causal_structure or [])
+        self._causal_model = None  # Built on first use, see the causal_model property
+        # Inference is set up on first use; see _initialize_inference
+        self._causal_state = (None, None, LRUQueryCache(maxsize=causal_cache_size, ttl=causal_cache_ttl))
+        # Without an explicit structure, the saved model is loaded on the first causal query
+        self._causal_model_pending = causal_structure is None
+        # Pairwise prism agreement, warmed from the in-memory history window and
+        # updated with every recorded decision
+        self.prism_agreement = PrismAgreementMatrix()
+        self.prism_agreement.update_many(record.get('prism_results', {}) for record in self.decision_history)
         self.action_controller = action_controller
+        self.prism_executor = PrismExecutor(executor_mode, max_workers=max_workers, timeout=plugin_timeout,
+                                            narratives=narratives)
         self.plugin_manager = PluginManager()
         self.plugin_manager.load_plugins()
     
-    def load_history(self):
-        if self.history_path.exists():
-            with open(self.history_path, "rb") as f:
-                return pickle.load(f)
-        return []
-    
-    def save_history(self):
-        with open(self.history_path, "wb") as f:
-            pickle.dump(self.decision_history, f)
+    @property
+    def base_weights(self) -> Dict[str, float]:
+        """The prism weights before rule, scenario and regional adjustments. Treat as read-only."""
+        return self._weight_state[0]
+
+    @base_weights.setter
+    def base_weights(self, weights: Dict[str, float]) -> None:
+        # The weights and the cache of weights derived from them are published
+        # as one tuple, so an evaluation running during a swap sees either the
+        # old pair or the new one, never new weights with stale cache entries
+        self._weight_state = (dict(weights), {})
+
+    @property
+    def inference(self) -> Optional["VariableElimination"]:
+        """Variable elimination over the current causal model, or None before it is set up."""
+        return self._causal_state[0]
+
+    @property
+    def compiled_causal(self) -> Optional[CompiledCausalTable]:
+        """The precomputed final_score table of the current causal model, if it compiled."""
+        return self._causal_state[1]
+
+    @property
+    def causal_cache(self) -> LRUQueryCache:
+        """The query cache of the current causal model."""
+        return self._causal_state[2]
+
+    @property
+    def _weight_cache(self) -> Dict[tuple, Dict[str, float]]:
+        return self._weight_state[1]
+
+    def load_weights(self, version: Union[int, str, None] = None,
+                     key_map: Dict[str, str] = None) -> bool:
+        """
+        Hot-swap the base weights from a weight checkpoint.
+
+        The swap is a single reference assignment, so evaluations in other
+        threads keep running without a lock and pick up the new weights on
+        their next decision.
+
+        Args:
+            version: Checkpoint version or name; the latest checkpoint by default.
+            key_map (Dict[str, str], optional): Maps checkpoint keys to the governor's
+                prism keys, for checkpoints saved by the RL manager or
+                MultiAgentPrismSystem under agent or class names.
+
+        Returns:
+            bool: True if weights were loaded, False if there is no checkpoint or its
+            keys (after ``key_map``) are not exactly the current prism keys.
+        """
+        checkpoint = self.weight_checkpoints.load(version) if self.weight_checkpoints else None
+        if checkpoint is None:
+            return False
+        key_map = key_map or {}
+        weights = {key_map.get(key, key): weight for key, weight in checkpoint.as_dict().items()}
+        if weights.keys() != self.base_weights.keys():
+            # Rule, scenario and region multipliers are keyed by prism, so
+            # other keys would silently switch them off
+            self.logger.error(
+                f"Not loading weight checkpoint version {checkpoint.version}: its keys "
+                f"{sorted(weights)} do not match the prism weights {sorted(self.base_weights)}."
+            )
+            return False
+        self.base_weights = weights
+        self.logger.info(f"Loaded prism weights from checkpoint version {checkpoint.version}.")
+        return True
+
+    def _default_history_store(self) -> HistoryStore:
+        store = SQLiteHistoryStore(self.history_path.with_suffix(".db"))
+        if len(store) == 0 and self.history_path.exists():
+            import_pickle_history(self.history_path, store)
+        return store
+
+    def load_history(self) -> deque:
+        """Load the most recent decisions from the history store."""
+        return deque(self.history_store.tail(self.history_window), maxlen=self.history_window)
+
+    def record_history(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Append decision records to the history store and the in-memory window,
+        and add their prism scores to the agreement matrix.
+
+        Args:
+            records (List[Dict[str, Any]]): The decision records to record.
+        """
+        self.history_store.extend(records)
+        self._remember(records)
+
+    def _remember(self, records: List[Dict[str, Any]]) -> None:
+        """Add decision records to the in-memory window and the agreement matrix only."""
+        self.decision_history.extend(records)
+        self.prism_agreement.update_many(record['prism_results'] for record in records)
     
     def load_causal_model(self):
+        """
+        Load the saved causal model.
+
+        The versioned model directory is preferred. The legacy pickle file is only
+        read when no versioned model exists; convert it with
+        ``causal_model_store.migrate_pickle_model``.
+
+        Returns:
+            The loaded model, or None if no saved model exists.
+        """
+        if (self.causal_model_dir / MANIFEST_FILE).exists():
+            self.logger.info(f"Loading causal model from {self.causal_model_dir}.")
+            return load_model_spec(self.causal_model_dir).to_model()
         if self.causal_model_path.exists():
             with open(self.causal_model_path, "rb") as f:
-                self.logger.info("Loading causal model from file.")
+                self.logger.warning("Loading legacy pickled causal model from file.")
                 return pickle.load(f)
         self.logger.warning("Causal model file not found.")
         return None
+
+    def save_causal_model(self, directory: Union[str, Path] = None) -> Path:
+        """
+        Save the causal model in the versioned on-disk format.
+
+        Args:
+            directory (Union[str, Path], optional): Target directory. Defaults to ``causal_model_dir``.
+
+        Returns:
+            Path: The path of the written manifest.
+        """
+        return save_model_spec(self.causal_model, directory or self.causal_model_dir)
+
+    def reload_causal_model(self) -> bool:
+        """
+        Replace the causal model with the one saved in ``causal_model_dir``.
+
+        The current model keeps serving until the new one is loaded and checked.
+
+        Returns:
+            bool: True if a saved model was loaded.
+        """
+        if not (self.causal_model_dir / MANIFEST_FILE).exists():
+            self.logger.warning(f"No saved causal model in {self.causal_model_dir}.")
+            return False
+        model = load_model_spec(self.causal_model_dir).to_model()
+        self.causal_model = model
+        self._causal_model_pending = False
+        self._initialize_inference()
+        return True
+
+    def reload_plugins(self, force: bool = False) -> int:
+        """
+        Re-scan the plugins directory and hot-reload plugins whose files changed.
+
+        The new plugins replace the old ones in a single assignment, so
+        evaluations in flight finish with the plugins they started with.
+
+        Args:
+            force (bool): Re-execute every plugin file, not only the changed ones.
+
+        Returns:
+            int: The number of plugins loaded.
+        """
+        manager = PluginManager(self.plugin_manager.plugins_dir, self.plugin_manager.create_if_missing,
+                                entry_point_group=self.plugin_manager.entry_point_group,
+                                registry=self.plugin_manager.registry)
+        manager.load_plugins(reload=force)
+        self.plugin_manager = manager
+        return len(manager.get_plugins())
+
+    def _ensure_causal_model(self) -> None:
+        """Load the saved causal model the first time inference is needed."""
+        if self.inference is not None or not self._causal_model_pending:
+            return
+        self._causal_model_pending = False
+        if not (self.causal_model_dir / MANIFEST_FILE).exists():
+            return
+        try:
+            self.causal_model = load_model_spec(self.causal_model_dir).to_model()
+        except Exception as e:
+            self.logger.error(f"Failed to load causal model: {e}")
+            return
+        self._initialize_inference()
     
-    def _is_valid_cpd(self, cpd: TabularCPD, expected_parents: set) -> bool:
+    @property
+    def causal_model(self) -> "BayesianNetwork":
+        """The causal Bayesian network, created from ``causal_structure`` on first access."""
+        if self._causal_model is None:
+            from pgmpy.models import BayesianNetwork
+            self._causal_model = BayesianNetwork(self.causal_structure)
+        return self._causal_model
+
+    @causal_model.setter
+    def causal_model(self, model: "BayesianNetwork") -> None:
+        self._causal_model = model
+
+    def _is_valid_cpd(self, cpd: "TabularCPD", expected_parents: set) -> bool:
+        from pgmpy.factors.discrete import TabularCPD
+
         # Type Check
         if not isinstance(cpd, TabularCPD):
             self.logger.warning("Provided CPD is not a TabularCPD.")
@@ -88,7 +328,7 @@ class EthicalGovernor:
 
         return True
 
-    def update_causal_model(self, cpds: Dict[str, TabularCPD]):
+    def update_causal_model(self, cpds: Dict[str, "TabularCPD"]):
         """
         Update the causal model with the provided CPDs.
 
@@ -102,51 +342,156 @@ class EthicalGovernor:
             else:
                 self.logger.error(f"Invalid CPD for {node}. It will not be added to the model.")
 
+        # Explicit CPDs take precedence over the saved model
+        self._causal_model_pending = False
         # Initialize inference after adding CPDs
+        self._initialize_inference()
+
+    def _initialize_inference(self) -> None:
+        """
+        Set up inference for the current causal model.
+
+        The new inference, its compiled table and an empty query cache are
+        published as one tuple once they are built. A query still running on
+        the previous model can only write its result to the previous cache,
+        which is dropped with it.
+        """
+        old_inference, _, old_cache = self._causal_state
         try:
+            from pgmpy.inference import VariableElimination
             self.causal_model.check_model()
-            self.inference = VariableElimination(self.causal_model)
+            inference = VariableElimination(self.causal_model)
         except Exception as e:
             self.logger.error(f"Failed to initialize inference: {e}")
+            # Cached results were computed against the previous CPDs
+            self._causal_state = (old_inference, None, old_cache.empty_copy())
+            return
+        self._causal_state = (inference, self._compile_causal(), old_cache.empty_copy())
+
+    def compile_causal_model(self) -> None:
+        """
+        Precompute the final_score posterior for every evidence combination.
+
+        Queries the compiled table can answer become array lookups; everything
+        else, including models that are not a single target with root parents,
+        keeps going through VariableElimination.
+        """
+        inference, _, cache = self._causal_state
+        self._causal_state = (inference, self._compile_causal(), cache)
+
+    def _compile_causal(self) -> Optional[CompiledCausalTable]:
+        try:
+            return CompiledCausalTable.compile(self.causal_model, 'final_score')
+        except Exception as e:
+            self.logger.warning(f"Failed to compile causal model, using variable elimination: {e}")
+            return None
     
     def predict_causal_impact(self, evidence: Dict[str, Any]) -> Dict[str, Any]:
         """
         Predict the causal impact based on the given evidence.
 
+        Results are cached per evidence set until the causal model is updated.
+
         Args:
             evidence (Dict[str, Any]): Evidence for the Bayesian inference.
 
         Returns:
             Dict[str, Any]: Predicted impact on the final score.
         """
-        if not self.inference:
+        self._ensure_causal_model()
+        state = self._causal_state
+        if not state[0]:
             self.logger.error("Inference not initialized. Ensure CPDs are added before prediction.")
             return {"error": "Causal model not available."}
+        return self._query_causal_impact(state, evidence, canonical_evidence(evidence))
 
-        try:
-            query_result = self.inference.query(variables=['final_score'], evidence=evidence)
-            return query_result.values
-        except Exception as e:
-            self.logger.error(f"Failed to predict causal impact: {e}")
-            return {}
+    def predict_causal_impact_batch(self, evidence_list: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Predict the causal impact for many evidence sets.
 
-    def adjust_weights(self, engine_facts: Dict[str, Any]):
+        Identical evidence sets are grouped so each distinct set is queried once.
+
+        Args:
+            evidence_list (List[Dict[str, Any]]): Evidence for each prediction.
+
+        Returns:
+            List[Any]: One prediction per evidence set, in input order.
+        """
+        self._ensure_causal_model()
+        # One model for the whole batch, even if it is swapped meanwhile
+        state = self._causal_state
+        if not state[0]:
+            self.logger.error("Inference not initialized. Ensure CPDs are added before prediction.")
+            return [{"error": "Causal model not available."} for _ in evidence_list]
+
+        predictions = [None] * len(evidence_list)
+        groups: Dict[tuple, List[int]] = {}
+        for i, evidence in enumerate(evidence_list):
+            key = canonical_evidence(evidence)
+            if key is None:
+                predictions[i] = self._query_causal_impact(state, evidence, None)
+            else:
+                groups.setdefault(key, []).append(i)
+
+        for key, indices in groups.items():
+            result = self._query_causal_impact(state, evidence_list[indices[0]], key)
+            predictions[indices[0]] = result
+            for i in indices[1:]:
+                predictions[i] = _copy_prediction(result)
+        return predictions
+
+    def _query_causal_impact(self, state: tuple, evidence: Dict[str, Any], key: Any) -> Any:
+        """Run (or fetch from the cache) the final_score query for one evidence set."""
+        inference, compiled_causal, cache = state
+        if key is not None:
+            cached = cache.get(key, None)
+            if cached is not None:
+                return _copy_prediction(cached)
+
+        if compiled_causal is not None and compiled_causal.supports(evidence):
+            prediction = compiled_causal.query(evidence)
+        else:
+            try:
+                prediction = inference.query(variables=['final_score'], evidence=evidence).values
+            except Exception as e:
+                self.logger.error(f"Failed to predict causal impact: {e}")
+                return {}
+
+        # Failed queries are not cached, so a fixed model can answer them later
+        if key is not None:
+            cache.put(key, _copy_prediction(prediction))
+        return prediction
+
+    def causal_cache_stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters for the causal query cache."""
+        return self.causal_cache.stats()
+
+    def adjust_weights(self, engine_facts: Dict[str, Any]) -> Dict[str, float]:
         """
         Adjust weights based on the rule engine's facts.
 
         Args:
-            engine_facts (Dict[str, Any]): Facts from the rule engine.
+            engine_facts (Dict[str, Any]): Facts from the rule engine, each a dict such as
+                ``{"human_centric_weight": 1.1}``.
+
+        Returns:
+            Dict[str, float]: Weight multiplier per prism, e.g. ``{"human_centric": 1.1}``.
         """
+        multipliers = {}
         for fact in engine_facts.values():
             if not isinstance(fact, dict):
                 self.logger.error("Fact is not structured as a dictionary.")
                 continue
             # Process valid fact
-            try:
-                human_centric_weight = fact.get("human_centric_weight", 0)
-                sentient_first_weight = fact.get("sentient_first_weight", 0)
-            except KeyError as e:
-                self.logger.warning(f"Missing expected key in fact: {e}")
+            for key, value in fact.items():
+                if not key.endswith("_weight"):
+                    continue
+                if not isinstance(value, (int, float)):
+                    self.logger.warning(f"Ignoring non-numeric weight fact {key}: {value}")
+                    continue
+                prism = key[:-len("_weight")]
+                multipliers[prism] = multipliers.get(prism, 1.0) * value
+        return multipliers
 
     def normalize_weights(self, weights: Dict[str, float]) -> Dict[str, float]:
         """
@@ -175,52 +520,191 @@ class EthicalGovernor:
         Returns:
             Dict: Evaluation results including final score and impact predictions.
         """
+        prism_run = self._evaluate_prisms(input_data)
+        print("Prism Results:", prism_run.results)
+
+        record, report = self._score(input_data, prism_run)
+        self.record_history([record])
+        self._apply_decision(report)
+        return report
+
+    def _score(self, input_data: Dict[str, Any], prism_run: PrismRun) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Score one decision from its prism run.
+
+        Covers everything ``evaluate`` does besides running the plugins,
+        recording the history and applying the decision, which
+        AsyncEthicalGovernor does without blocking.
+
+        Returns:
+            Tuple[Dict, Dict]: The history record and the report.
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         scenario = self.context_engine.detect_scenario(input_data)
-        
-        # Initialize the rule engine
-        engine = EthicalGovernorRules()
-        engine.reset()
-        
-        # Insert facts into the rule engine
-        engine.declare(EthicalContext(**input_data))
-        
-        # Run the rule engine
-        engine.run()
-        
-        # Collect results from the rule engine
-        weights = {
-            'equity_focused': 0.3,
-            'human_centric': 0.3,
-            'innovation_focused': 0.15,
-            'ecocentric': 0.15,
-            'sentient_first': 0.1
-        }
-        
-        # Normalize weights
-        weights = self.normalize_weights(weights)
-        
-        # Continue with the existing evaluation logic
-        prism_results = {}
-        for plugin in self.plugin_manager.get_plugins():
-            result = plugin.evaluate(input_data)
-            prism_results[plugin.__class__.__name__] = result
-        
-        print("Prism Results:", prism_results)
-        
-        total_score = sum(weights[p] * prism_results[p]['score'] for p in prism_results if p in weights) / sum(weights.values())
-        
-        self.decision_history.append({
+
+        # Run the rule engine against the input facts
+        rule_outcome = self._create_rule_engine().evaluate(input_data)
+
+        weights = self._resolve_weights(rule_outcome, scenario, input_data.get("region"))
+
+        prism_results, prism_errors, prism_skipped = prism_run
+        total_score = self._calculate_total_score(weights, prism_results)
+
+        record = self._history_record(timestamp, scenario, weights, prism_results, total_score)
+        report = self._build_report(scenario, weights, prism_results, total_score,
+                                    prism_errors=prism_errors, prism_skipped=prism_skipped)
+        return record, report
+
+    def evaluate_batch(self, inputs: Union[Iterable[Dict[str, Any]], "pd.DataFrame"]) -> List[Dict[str, Any]]:
+        """
+        Evaluate many decisions in one pass.
+
+        The rules are evaluated, the scenarios detected and the plugin inputs
+        validated for the whole batch in one pass, weights come from the
+        memoized weight cache and the decision history is persisted once,
+        instead of once per decision. Each
+        returned report is identical to what ``evaluate`` produces for that row.
+
+        Args:
+            inputs: A list of input dicts, or a DataFrame with one decision per row.
+
+        Returns:
+            List[Dict[str, Any]]: One report per input row, in input order.
+        """
+        rows = self._batch_rows(inputs)
+        if not rows:
+            return []
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        rule_outcomes = self._run_rules_batch(rows)
+
+        prism_runs = self.prism_executor.run_batch(self.plugin_manager.get_plugins(), rows)
+
+        decisions = []
+        records = []
+        if hasattr(self.context_engine, "detect_scenarios"):
+            scenarios = self.context_engine.detect_scenarios(rows)
+        else:
+            scenarios = [self.context_engine.detect_scenario(input_data) for input_data in rows]
+        for input_data, scenario, rule_outcome, prism_run in zip(rows, scenarios, rule_outcomes, prism_runs):
+            weights = self._resolve_weights(rule_outcome, scenario, input_data.get("region"))
+            prism_results, prism_errors, prism_skipped = prism_run
+            total_score = self._calculate_total_score(weights, prism_results)
+            records.append(self._history_record(timestamp, scenario, weights, prism_results, total_score))
+            decisions.append((scenario, weights, prism_results, total_score, prism_errors, prism_skipped))
+
+        self.record_history(records)
+
+        impact_predictions = self.predict_causal_impact_batch([decision[2] for decision in decisions])
+        reports = [
+            self._build_report(scenario, weights, prism_results, total_score,
+                               impact_predictions=impact, prism_errors=prism_errors,
+                               prism_skipped=prism_skipped)
+            for (scenario, weights, prism_results, total_score, prism_errors, prism_skipped), impact
+            in zip(decisions, impact_predictions)
+        ]
+
+        for report in reports:
+            self._apply_decision(report)
+        return reports
+
+    @staticmethod
+    def _batch_rows(inputs: Union[Iterable[Dict[str, Any]], "pd.DataFrame"]) -> List[Dict[str, Any]]:
+        """Normalize batch input into a list of per-decision dicts."""
+        # A DataFrame can only be passed in if pandas has already been imported
+        pd = sys.modules.get("pandas")
+        if pd is not None and isinstance(inputs, pd.DataFrame):
+            # Cells missing from a row come back as NaN; drop them so each row
+            # looks exactly like the dict a caller would pass to evaluate().
+            return [
+                {k: v for k, v in row.items() if not (isinstance(v, float) and pd.isna(v))}
+                for row in inputs.to_dict(orient="records")
+            ]
+        return list(inputs)
+
+    def _create_rule_engine(self) -> Union[CompiledRuleEngine, "EthicalGovernorRules"]:
+        """Return the rule engine for the configured backend."""
+        if self.rule_backend == "experta":
+            from rule_engine import EthicalGovernorRules
+            return EthicalGovernorRules()
+        return self.compiled_rules
+
+    def _run_rules_batch(self, rows: List[Dict[str, Any]]) -> List[RuleOutcome]:
+        """Run the rules for every row, vectorized when the compiled backend is used."""
+        engine = self._create_rule_engine()
+        if isinstance(engine, CompiledRuleEngine):
+            return engine.evaluate_batch(rows)
+        return [engine.evaluate(input_data) for input_data in rows]
+
+    def _resolve_weights(self, rule_outcome: RuleOutcome, scenario: Any, region: Any = None) -> Dict[str, float]:
+        """
+        Return the normalized prism weights used to aggregate scores.
+
+        The base weights are scaled by the weight facts the rules declared, the
+        detected scenario's adjustments and the regional context, then normalized.
+        Normalized weights are memoized per (fired rules, scenario, region) since
+        most decisions share a handful of combinations.
+
+        Args:
+            rule_outcome (RuleOutcome): The rules fired for the decision.
+            scenario: The result of ``ContextEngine.detect_scenario``.
+            region: The decision's region, if any.
+
+        Returns:
+            Dict[str, float]: Normalized weights.
+        """
+        if isinstance(scenario, tuple):
+            scenario_name, scenario_adjustments = scenario
+        else:
+            scenario_name, scenario_adjustments = scenario, {}
+        key = (
+            rule_outcome.fired,
+            frozenset(rule_outcome.facts.items()),
+            scenario_name,
+            frozenset(scenario_adjustments.items()),
+            region if isinstance(region, str) else None
+        )
+        base_weights, cache = self._weight_state
+        weights = cache.get(key)
+        if weights is None:
+            multipliers = self.adjust_weights({"rule_facts": rule_outcome.facts})
+            weights = {
+                prism: weight * multipliers.get(prism, 1.0) * scenario_adjustments.get(prism, 1.0)
+                for prism, weight in base_weights.items()
+            }
+            regional_context = self.location_context.get_context(key[-1]) if key[-1] else None
+            weights = self.normalize_weights(self.location_context.adjust_weights(weights, regional_context))
+            if len(cache) >= self.weight_cache_size:
+                cache.clear()
+            cache[key] = weights
+        # Reports and history hold on to the weights, so hand out a copy
+        return dict(weights)
+
+    def _evaluate_prisms(self, input_data: Dict[str, Any]) -> PrismRun:
+        """Validate the input and run every loaded plugin against it."""
+        return self.prism_executor.run(self.plugin_manager.get_plugins(), input_data)
+
+    @staticmethod
+    def _calculate_total_score(weights: Dict[str, float], prism_results: Dict[str, Any]) -> float:
+        return sum(weights[p] * prism_results[p]['score'] for p in prism_results if p in weights) / sum(weights.values())
+
+    @staticmethod
+    def _history_record(timestamp: str, scenario: Any, weights: Dict[str, float],
+                        prism_results: Dict[str, Any], total_score: float) -> Dict[str, Any]:
+        return {
             'timestamp': timestamp,
             'scenario': scenario,
             'weights': weights,
             'prism_results': prism_results,
             'total_score': total_score
-        })
-        self.save_history()
-        
-        impact_predictions = self.predict_causal_impact(prism_results)
-        
+        }
+
+    def _build_report(self, scenario: Any, weights: Dict[str, float],
+                      prism_results: Dict[str, Any], total_score: float,
+                      impact_predictions: Any = None, prism_errors: Dict[str, str] = None,
+                      prism_skipped: List[str] = None) -> Dict[str, Any]:
+        if impact_predictions is None:
+            impact_predictions = self.predict_causal_impact(prism_results)
         report = {
             'summary': {
                 'final_score': total_score,
@@ -233,14 +717,55 @@ class EthicalGovernor:
                 'causal_analysis': impact_predictions
             }
         }
+        if prism_errors:
+            report['full_report']['prism_errors'] = prism_errors
+        if prism_skipped:
+            report['full_report']['prism_skipped'] = prism_skipped
+        return report
 
+    def render_narratives(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return a copy of a report with the prisms' metric narratives rendered.
+
+        Reports are built without narrative text unless the governor was
+        created with ``narratives=True``; call this where a report is
+        serialized for people. The report itself and the history records that
+        share its prism results are left untouched.
+
+        Args:
+            report (Dict[str, Any]): A report from ``evaluate`` or ``evaluate_batch``.
+
+        Returns:
+            Dict[str, Any]: The report with narratives on every templated metric.
+        """
+        plugins = {plugin.__class__.__name__: plugin for plugin in self.plugin_manager.get_plugins()}
+        prism_results = {}
+        for name, result in report['full_report']['prism_results'].items():
+            plugin = plugins.get(name)
+            if getattr(plugin, "NARRATIVE_TEMPLATES", None) and isinstance(result, dict):
+                metrics = {
+                    metric: dict(value) if isinstance(value, dict) else value
+                    for metric, value in result.get('metrics', {}).items()
+                }
+                result = plugin.render_narratives(dict(result, metrics=metrics))
+            prism_results[name] = result
+        return dict(report, full_report=dict(report['full_report'], prism_results=prism_results))
+
+    def _apply_decision(self, report: Dict[str, Any]) -> None:
         if self.action_controller:
+            if inspect.iscoroutinefunction(self.action_controller.apply_decision):
+                # Calling it here would only create a coroutine that never runs
+                self.logger.error("The action controller is async; apply its decisions through AsyncEthicalGovernor.")
+                return
             try:
                 self.action_controller.apply_decision(report)
             except Exception as e:
                 self.logger.error(f"Failed to apply ethical decision to host AI: {e}")
 
-        return report
+    def close(self) -> None:
+        """Shut down the plugin worker pool and close the history store."""
+        self.prism_executor.shutdown()
+        self.history_store.close()
 
     def process_facts(self, facts: List[Any]) -> List[Dict[str, Any]]:
         processed_facts = []
@@ -326,6 +851,7 @@ def test_ethical_governor():
 
 def run_evaluations(input_data: Dict[str, Any]) -> Dict[str, Any]:
     plugin_manager = PluginManager()
+    # Unchanged plugin files come from the process-wide registry, not a re-import
     plugin_manager.load_plugins()
     results = {}
     for plugin in plugin_manager.get_plugins():
@@ -1,29 +1,51 @@
 from typing import Dict, Any, List, Optional
 import logging
 from .ethical_prism_agent import EthicalPrismAgent
+from .input_schema import InputField
 
 class EcocentricPrism(EthicalPrismAgent):
     """Evaluates environmental and ecological impact."""
+
+    NARRATIVE_TEMPLATES = {
+        "environmental_score": "Environmental impact score: {value}",
+        "biodiversity_score": "Biodiversity preservation score: {value}",
+        "carbon_score": "Carbon neutrality score: {value}",
+        "water_score": "Water conservation score: {value}",
+        "renewable_score": "Renewable resource utilization: {value}"
+    }
+
+    INPUT_SCHEMA = (
+        InputField('environmental_impact'),
+        InputField('biodiversity_preservation'),
+        InputField('carbon_neutrality'),
+        InputField('water_conservation'),
+        InputField('renewable_resource_use')
+    )
     
     def __init__(self):
         """Initialize the prism."""
         self.logger = logging.getLogger(self.__class__.__module__)
         
         # Define required criteria
-        self.required_inputs = [
-            'environmental_impact',
-            'biodiversity_preservation',
-            'carbon_neutrality',
-            'water_conservation',
-            'renewable_resource_use'
-        ]
+        self.required_inputs = [field.name for field in self.INPUT_SCHEMA]
+
+        # Metric name -> input field it reports
+        self.metric_inputs = {
+            "environmental_score": "environmental_impact",
+            "biodiversity_score": "biodiversity_preservation",
+            "carbon_score": "carbon_neutrality",
+            "water_score": "water_conservation",
+            "renewable_score": "renewable_resource_use"
+        }
     
-    def evaluate(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def evaluate(self, input_data: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
         """
         Evaluate the Ecocentric Prism with the provided input data.
         
         Args:
             input_data: Dictionary containing scores for evaluation
+            narratives: Whether to render metric narratives; they can be
+                added later with render_narratives()
             
         Returns:
             Dict containing evaluated metrics and their narratives
@@ -32,62 +54,51 @@ class EcocentricPrism(EthicalPrismAgent):
             ValueError: If required inputs are missing or invalid
         """
         try:
-            # Check for missing fields
-            missing_fields = [
-                field for field in self.required_inputs
-                if field not in input_data
-            ]
-            if missing_fields:
-                raise ValueError(
-                    f"Missing required input data: {', '.join(missing_fields)}"
-                )
-            
-            # Validate numeric values
-            for field in self.required_inputs:
-                value = input_data[field]
-                if not isinstance(value, (int, float)):
-                    raise ValueError(
-                        f"{field} must be a numeric value between 0 and 1."
-                    )
-                if not 0 <= float(value) <= 1:
-                    raise ValueError(
-                        f"Value {value} for {field} must be between 0 and 1"
-                    )
-            
-            # Calculate metrics
-            metrics = {
-                "environmental_score": {
-                    "value": input_data["environmental_impact"],
-                    "narrative": f"Environmental impact score: {input_data['environmental_impact']}"
-                },
-                "biodiversity_score": {
-                    "value": input_data["biodiversity_preservation"],
-                    "narrative": f"Biodiversity preservation score: {input_data['biodiversity_preservation']}"
-                },
-                "carbon_score": {
-                    "value": input_data["carbon_neutrality"],
-                    "narrative": f"Carbon neutrality score: {input_data['carbon_neutrality']}"
-                },
-                "water_score": {
-                    "value": input_data["water_conservation"],
-                    "narrative": f"Water conservation score: {input_data['water_conservation']}"
-                },
-                "renewable_score": {
-                    "value": input_data["renewable_resource_use"],
-                    "narrative": f"Renewable resource utilization: {input_data['renewable_resource_use']}"
-                }
-            }
+            self.validate_inputs(input_data)
+            return self.evaluate_validated(input_data, narratives)
             
-            # Return results
-            return {
-                "score": sum(metric["value"] for metric in metrics.values()) / len(metrics),
-                "metrics": metrics
-            }
-            
-        except ValueError as ve:
-            self.logger.error("Error in EcocentricPrism: %s", str(ve))
+        except ValueError:
+            # Already logged by validate_inputs()
             raise
             
         except Exception as e:
             self.logger.error("Unexpected error in EcocentricPrism: %s", str(e))
             return {"error": str(e)}
+
+    def evaluate_validated(self, input_data: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
+        """Calculate the metrics for input that has passed validate_inputs()."""
+        metrics = {
+            metric: self._metric(metric, input_data[field], narratives)
+            for metric, field in self.metric_inputs.items()
+        }
+        return {
+            "score": sum(metric["value"] for metric in metrics.values()) / len(metrics),
+            "metrics": metrics
+        }
+
+    def evaluate_columns(self, frame: Any) -> Dict[str, Any]:
+        """
+        Evaluate the Ecocentric Prism for every row of column-oriented input.
+
+        Args:
+            frame: DataFrame or mapping of input field to per-row values
+
+        Returns:
+            Dict with the per-row 'score' array and per-metric value arrays
+
+        Raises:
+            ValueError: If required inputs are missing or invalid in any row
+        """
+        columns = self._require_columns(frame, self.required_inputs)
+
+        metrics = {
+            metric: columns[field] for metric, field in self.metric_inputs.items()
+        }
+        # Accumulate in the same order as the per-row sum() so scores match exactly
+        total = 0
+        for values in metrics.values():
+            total = total + values
+        return {
+            "score": total / len(metrics),
+            "metrics": metrics
+        }
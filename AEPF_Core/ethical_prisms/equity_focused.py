@@ -1,22 +1,36 @@
 from typing import Dict, Any
 import logging
-from .ethical_prism_agent import EthicalPrismAgent
+import numbers
+from .ethical_prism_agent import EthicalPrismAgent, weighted_column_average
+from .input_schema import InputField
 
 class EquityFocusedPrism(EthicalPrismAgent):
+    METRIC_WEIGHTS = {
+        'bias_mitigation_score': 0.3,
+        'accessibility_score': 0.2,
+        'representation_score': 0.2,
+        'demographic_equity_score': 0.2,
+        'resource_fairness_score': 0.1
+    }
+
+    # Every metric is optional; a metric may also be given as {'value': ...}
+    INPUT_SCHEMA = tuple(
+        InputField(metric, dtype=(numbers.Real, dict), required=False) for metric in METRIC_WEIGHTS
+    )
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def evaluate(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate equity-focused ethical considerations."""
+    def evaluate(self, metrics: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
+        """
+        Evaluate equity-focused ethical considerations.
+
+        The metrics are returned as given, so there are no narratives to
+        render; ``narratives`` is accepted for the common prism interface.
+        """
         try:
             # Calculate weighted average of equity metrics
-            weights = {
-                'bias_mitigation_score': 0.3,
-                'accessibility_score': 0.2,
-                'representation_score': 0.2,
-                'demographic_equity_score': 0.2,
-                'resource_fairness_score': 0.1
-            }
+            weights = self.METRIC_WEIGHTS
             
             score = 0.0
             total_weight = 0.0
@@ -42,3 +56,15 @@ class EquityFocusedPrism(EthicalPrismAgent):
                 "score": 0.0,
                 "metrics": {}
             }
+
+    def evaluate_columns(self, frame: Any) -> Dict[str, Any]:
+        """Evaluate equity-focused considerations for every row of column-oriented input."""
+        try:
+            score, metrics = weighted_column_average(self, frame, self.METRIC_WEIGHTS)
+        except ValueError:
+            # Nested {'value': ...} cells are only understood by the per-row path
+            return super().evaluate_columns(frame)
+        return {
+            "score": score,
+            "metrics": metrics
+        }
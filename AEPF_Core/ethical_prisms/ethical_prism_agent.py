@@ -1,16 +1,221 @@
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Tuple, Union
 from abc import ABC, abstractmethod
+from functools import lru_cache
+import inspect
+import logging
+import numpy as np
+from .input_schema import (
+    InputField, ValidationResult, compile_schema, has_inputs, project_inputs, validate_batch, validate_inputs
+)
+
+logger = logging.getLogger(__name__)
+
+def column_count(frame: Any) -> int:
+    """Return the number of rows in a DataFrame or a mapping of columns."""
+    if hasattr(frame, "index"):
+        return len(frame.index)
+    for values in frame.values():
+        return len(values)
+    return 0
+
+def iter_rows(frame: Any) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the rows of a DataFrame or a mapping of columns as dicts.
+
+    Cells that are missing (NaN) are left out of the row, so each row looks
+    like the input dict a caller would pass to ``evaluate``.
+    """
+    if hasattr(frame, "to_dict") and hasattr(frame, "index"):
+        records = frame.to_dict(orient="records")
+    else:
+        columns = list(frame.keys())
+        records = (dict(zip(columns, values)) for values in zip(*(frame[c] for c in columns)))
+    for record in records:
+        yield {k: v for k, v in record.items() if not (isinstance(v, float) and v != v)}
+
+@lru_cache(maxsize=None)
+def _function_takes_narratives(function: Callable) -> bool:
+    try:
+        parameters = inspect.signature(function).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(p.name == "narratives" or p.kind is p.VAR_KEYWORD for p in parameters)
+
+def takes_narratives(evaluate: Callable) -> bool:
+    """Return True if an evaluate method accepts ``narratives``; older plugins may not."""
+    return _function_takes_narratives(getattr(evaluate, "__func__", evaluate))
+
+def call_evaluate(evaluate: Callable, input_data: Dict[str, Any], narratives: bool) -> Dict[str, Any]:
+    """Call an evaluate method, passing ``narratives`` only if it accepts it."""
+    if takes_narratives(evaluate):
+        return evaluate(input_data, narratives=narratives)
+    return evaluate(input_data)
+
+def weighted_column_average(prism: "EthicalPrismAgent", frame: Any,
+                            weights: Dict[str, float]) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Column version of the weighted average used by the human-centric and equity prisms.
+
+    Only the metrics present in a row contribute to that row's score, exactly as
+    in the per-row ``if metric in metrics`` loop.
+
+    Returns:
+        Tuple[np.ndarray, Dict[str, np.ndarray]]: Per-row scores and the metric columns used.
+
+    Raises:
+        ValueError: If a metric column holds non-numeric values.
+    """
+    n_rows = column_count(frame)
+    score = np.zeros(n_rows)
+    total_weight = np.zeros(n_rows)
+    metrics = {}
+    for metric, weight in weights.items():
+        if metric in frame:
+            values = prism._column_array(frame, metric)
+            present = ~np.isnan(values)
+            score = score + np.where(present, values * weight, 0.0)
+            total_weight = total_weight + np.where(present, weight, 0.0)
+            metrics[metric] = values
+    final_score = np.divide(score, total_weight, out=np.zeros(n_rows), where=total_weight > 0)
+    return final_score, metrics
 
 class EthicalPrismAgent(ABC):
+    # Metric name -> str.format template for its human-readable narrative.
+    # Templates receive the metric value as ``value``.
+    NARRATIVE_TEMPLATES: Dict[str, str] = {}
+
+    # The inputs the prism reads. Prisms that declare a schema are validated
+    # centrally by the governor, receive only these fields, and are skipped
+    # when none of their inputs are present. An empty schema receives the whole input.
+    INPUT_SCHEMA: Tuple[InputField, ...] = ()
+
     @abstractmethod
-    def evaluate(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def evaluate(self, input_data: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
         """
         Evaluate the ethical dimensions based on the given input data.
 
         Args:
             input_data (Dict[str, Any]): Input parameters for evaluation.
+            narratives (bool): Whether to render the metric narratives. Hot paths pass
+                False and call ``render_narratives`` only when a report is shown.
 
         Returns:
             Dict[str, Any]: A dictionary with keys 'score' (float) and 'metrics' (dict).
         """
-        raise NotImplementedError("Subclasses must implement this method") 
\ No newline at end of file
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def validate_inputs(self, input_data: Dict[str, Any]) -> None:
+        """
+        Check the input against INPUT_SCHEMA, logging the problem before raising.
+
+        Raises:
+            ValueError: If a required input is missing or an input is invalid.
+        """
+        try:
+            validate_inputs(self.INPUT_SCHEMA, input_data)
+        except ValueError as ve:
+            logger.error(f"Invalid input for {self.__class__.__name__}: {ve}")
+            raise
+
+    def validate_batch(self, rows: Iterable[Dict[str, Any]]) -> ValidationResult:
+        """Check a batch of inputs against INPUT_SCHEMA in one pass, without raising."""
+        return validate_batch(self.INPUT_SCHEMA, rows)
+
+    def accepts(self, input_data: Dict[str, Any]) -> bool:
+        """Return True if the input carries the fields this prism needs."""
+        return not self.INPUT_SCHEMA or has_inputs(self.INPUT_SCHEMA, input_data)
+
+    def project(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the part of the input this prism reads."""
+        return project_inputs(self.INPUT_SCHEMA, input_data) if self.INPUT_SCHEMA else input_data
+
+    def evaluate_validated(self, input_data: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
+        """
+        Evaluate input that has already passed ``validate_inputs``.
+
+        Prisms with a schema override this to skip their own validation; the
+        default simply calls ``evaluate``.
+        """
+        return call_evaluate(self.evaluate, input_data, narratives)
+
+    def _metric(self, name: str, value: Any, narratives: bool = True) -> Dict[str, Any]:
+        """Build a metric entry, rendering its narrative only when asked to."""
+        metric = {"value": value}
+        if narratives:
+            metric["narrative"] = self.NARRATIVE_TEMPLATES[name].format(value=value)
+        return metric
+
+    def render_narratives(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fill in the narratives of a result evaluated with ``narratives=False``.
+
+        Args:
+            result (Dict[str, Any]): A result returned by ``evaluate``. It is updated in place.
+
+        Returns:
+            Dict[str, Any]: The same result, with a narrative on every templated metric.
+        """
+        for name, metric in result.get("metrics", {}).items():
+            template = self.NARRATIVE_TEMPLATES.get(name)
+            if template and isinstance(metric, dict) and "narrative" not in metric:
+                metric["narrative"] = template.format(value=metric["value"])
+        return result
+
+    def evaluate_columns(self, frame: Any) -> Dict[str, Any]:
+        """
+        Evaluate many rows at once from column-oriented input.
+
+        Prisms with a native column kernel override this to compute all scores as
+        array operations. The default implementation calls ``evaluate`` once per
+        row, so every prism supports the column path.
+
+        Args:
+            frame: A DataFrame, or a mapping of column name to an array-like with one value per row.
+
+        Returns:
+            Dict[str, Any]: 'score' (np.ndarray with one score per row) and 'metrics'
+            (dict of metric name to np.ndarray). The per-row fallback also returns the
+            original per-row results under 'rows'.
+        """
+        rows = [self.evaluate(row) for row in iter_rows(frame)]
+        scores = np.array([row.get("score", np.nan) for row in rows], dtype=float)
+        return {"score": scores, "metrics": {}, "rows": rows}
+
+    def _column_array(self, frame: Any, field: str) -> np.ndarray:
+        """Return a column of the frame as a float array."""
+        try:
+            return np.asarray(frame[field], dtype=float)
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} must be a numeric value between 0 and 1.")
+
+    def _require_columns(self, frame: Any, fields: Iterable[Union[str, InputField]]) -> Dict[str, np.ndarray]:
+        """
+        Fetch columns and check every value against its field.
+
+        Fields given by name are required and must lie between 0 and 1. Fields
+        given as InputFields are checked as declared; an optional one may be
+        absent from the frame or from some rows (NaN in the result), but any
+        value it holds must be valid, as in ``validate_inputs``.
+
+        Failures are logged here, so column kernels only need to let them propagate.
+
+        Raises:
+            ValueError: If a required column is missing or any row holds an invalid value.
+        """
+        schema = tuple(field if isinstance(field, InputField) else InputField(field) for field in fields)
+        try:
+            missing_fields = [field.name for field in schema if field.required and field.name not in frame]
+            if missing_fields:
+                raise ValueError(f"Missing required input data: {', '.join(missing_fields)}")
+
+            checked = compile_schema(schema).validate_columns(frame)
+            # Missing cells of required fields are rejected too
+            rejected = checked.missing | checked.invalid
+            for j, field in enumerate(schema):
+                if rejected[:, j].any():
+                    rows: List[int] = np.flatnonzero(rejected[:, j]).tolist()
+                    raise ValueError(f"{field._range_message().rstrip('.')} (rows {rows}).")
+        except ValueError as ve:
+            logger.error(f"Invalid input for {self.__class__.__name__}: {ve}")
+            raise
+        return {field.name: np.ascontiguousarray(checked.values[:, j]) for j, field in enumerate(schema)}
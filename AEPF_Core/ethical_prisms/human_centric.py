@@ -1,25 +1,36 @@
 from typing import Dict, Any, List, Optional
 import logging
-from .ethical_prism_agent import EthicalPrismAgent
+from .ethical_prism_agent import EthicalPrismAgent, weighted_column_average
+from .input_schema import InputField
 
 class HumanCentricPrism(EthicalPrismAgent):
+    METRIC_WEIGHTS = {
+        'wellbeing_score': 0.25,
+        'autonomy_score': 0.15,
+        'privacy_score': 0.20,
+        'transparency_score': 0.15,
+        'accountability_score': 0.10,
+        'fairness_score': 0.10,
+        'safety_score': 0.05
+    }
+
+    # Every metric is optional; the score averages the ones present
+    INPUT_SCHEMA = tuple(InputField(metric, required=False) for metric in METRIC_WEIGHTS)
+
     def __init__(self):
         """Initialize the prism."""
         self.logger = logging.getLogger(self.__class__.__module__)
 
-    def evaluate(self, metrics: Dict[str, Any]) -> Dict[str, Any]:
-        """Evaluate human-centric ethical considerations."""
+    def evaluate(self, metrics: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
+        """
+        Evaluate human-centric ethical considerations.
+
+        The metrics are returned as given, so there are no narratives to
+        render; ``narratives`` is accepted for the common prism interface.
+        """
         try:
             # Calculate weighted average of human-centric metrics
-            weights = {
-                'wellbeing_score': 0.25,
-                'autonomy_score': 0.15,
-                'privacy_score': 0.20,
-                'transparency_score': 0.15,
-                'accountability_score': 0.10,
-                'fairness_score': 0.10,
-                'safety_score': 0.05
-            }
+            weights = self.METRIC_WEIGHTS
             
             score = 0.0
             total_weight = 0.0
@@ -35,7 +46,7 @@ class HumanCentricPrism(EthicalPrismAgent):
             self.results = {
                 'score': final_score,
                 'metrics': metrics,
-                'weights': weights,
+                'weights': dict(weights),
                 'components': {
                     'wellbeing': metrics.get('wellbeing_score', 0),
                     'privacy': metrics.get('privacy_score', 0),
@@ -54,3 +65,15 @@ class HumanCentricPrism(EthicalPrismAgent):
                 "score": 0.0,
                 "metrics": {}
             }
+
+    def evaluate_columns(self, frame: Any) -> Dict[str, Any]:
+        """Evaluate human-centric considerations for every row of column-oriented input."""
+        try:
+            score, metrics = weighted_column_average(self, frame, self.METRIC_WEIGHTS)
+        except ValueError:
+            # Non-numeric cells: let the per-row path apply its own error handling
+            return super().evaluate_columns(frame)
+        return {
+            "score": score,
+            "metrics": metrics
+        }
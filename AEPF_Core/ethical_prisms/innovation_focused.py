@@ -1,70 +1,76 @@
 from typing import Dict, Any
 import logging
 from .ethical_prism_agent import EthicalPrismAgent
+from .input_schema import InputField
 
 class InnovationFocusedPrism(EthicalPrismAgent):
+    # Risks are inverted into scores, benefits are scored directly
+    RISK_INPUTS = {
+        "financial_risk_score": "financial_risk",
+        "reputational_risk_score": "reputational_risk",
+        "technological_risk_score": "technological_risk",
+    }
+    BENEFIT_INPUTS = {
+        "economic_benefit_score": "economic_benefit",
+        "societal_benefit_score": "societal_benefit",
+    }
+
+    NARRATIVE_TEMPLATES = {
+        "financial_risk_score": "Financial risk score derived from input as {value}.",
+        "reputational_risk_score": "Reputational risk score derived from input as {value}.",
+        "technological_risk_score": "Technological risk score derived from input as {value}.",
+        "economic_benefit_score": "Economic benefit score directly input as {value}.",
+        "societal_benefit_score": "Societal benefit score directly input as {value}.",
+    }
+
+    INPUT_SCHEMA = tuple(
+        InputField(field) for field in list(RISK_INPUTS.values()) + list(BENEFIT_INPUTS.values())
+    )
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def evaluate(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def evaluate(self, input_data: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
         try:
-            # Define required fields
-            required_fields = [
-                "financial_risk",
-                "reputational_risk",
-                "technological_risk",
-                "economic_benefit",
-                "societal_benefit"
-            ]
+            self.validate_inputs(input_data)
+            return self.evaluate_validated(input_data, narratives)
 
-            # Check for missing fields
-            missing_fields = [field for field in required_fields if field not in input_data]
-            if missing_fields:
-                raise ValueError(f"Missing required input data: {', '.join(missing_fields)}")
+        except ValueError:
+            # Already logged by validate_inputs()
+            raise
 
-            # Validate input values
-            for field in required_fields:
-                if not isinstance(input_data[field], (int, float)):
-                    raise ValueError(f"{field} must be a numeric value between 0 and 1.")
-                if not 0 <= input_data[field] <= 1:
-                    raise ValueError(f"{field} must be a numeric value between 0 and 1.")
+        except Exception as e:
+            self.logger.error(f"Unexpected error in InnovationFocusedPrism: {e}")
+            return {"error": str(e)}
 
-            # Compute metrics
-            metrics = {
-                "financial_risk_score": {
-                    "value": 1 - input_data["financial_risk"],
-                    "narrative": f"Financial risk score derived from input as {1 - input_data['financial_risk']}."
-                },
-                "reputational_risk_score": {
-                    "value": 1 - input_data["reputational_risk"],
-                    "narrative": f"Reputational risk score derived from input as {1 - input_data['reputational_risk']}."
-                },
-                "technological_risk_score": {
-                    "value": 1 - input_data["technological_risk"],
-                    "narrative": f"Technological risk score derived from input as {1 - input_data['technological_risk']}."
-                },
-                "economic_benefit_score": {
-                    "value": input_data["economic_benefit"],
-                    "narrative": f"Economic benefit score directly input as {input_data['economic_benefit']}."
-                },
-                "societal_benefit_score": {
-                    "value": input_data["societal_benefit"],
-                    "narrative": f"Societal benefit score directly input as {input_data['societal_benefit']}."
-                },
-            }
+    def evaluate_validated(self, input_data: Dict[str, Any], narratives: bool = True) -> Dict[str, Any]:
+        # Compute metrics
+        metrics = {
+            metric: self._metric(metric, 1 - input_data[field], narratives)
+            for metric, field in self.RISK_INPUTS.items()
+        }
+        metrics.update({
+            metric: self._metric(metric, input_data[field], narratives)
+            for metric, field in self.BENEFIT_INPUTS.items()
+        })
 
-            results = {
-                "metrics": metrics,
-                "score": sum(metric["value"] for metric in metrics.values()) / len(metrics),
-                "prism": "Innovation-Focused"
-            }
+        return {
+            "metrics": metrics,
+            "score": sum(metric["value"] for metric in metrics.values()) / len(metrics),
+            "prism": "Innovation-Focused"
+        }
 
-            return results
+    def evaluate_columns(self, frame: Any) -> Dict[str, Any]:
+        columns = self._require_columns(frame, [field.name for field in self.INPUT_SCHEMA])
 
-        except ValueError as ve:
-            self.logger.error(f"Error in InnovationFocusedPrism: {ve}")
-            raise
+        metrics = {metric: 1 - columns[field] for metric, field in self.RISK_INPUTS.items()}
+        metrics.update({metric: columns[field] for metric, field in self.BENEFIT_INPUTS.items()})
 
-        except Exception as e:
-            self.logger.error(f"Unexpected error in InnovationFocusedPrism: {e}")
-            return {"error": str(e)}
+        total = 0
+        for values in metrics.values():
+            total = total + values
+        return {
+            "metrics": metrics,
+            "score": total / len(metrics),
+            "prism": "Innovation-Focused"
+        }
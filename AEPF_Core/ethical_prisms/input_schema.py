@@ -0,0 +1,176 @@
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+from functools import lru_cache
+import numbers
+import numpy as np
+
+_MISSING = object()
+
+@dataclass(frozen=True)
+class InputField:
+    """One input a prism reads: its name, accepted types and allowed range."""
+    name: str
+    dtype: Union[type, Tuple[type, ...]] = numbers.Real
+    minimum: Optional[float] = 0.0
+    maximum: Optional[float] = 1.0
+    required: bool = True
+
+    def _range_message(self) -> str:
+        if self.minimum is None or self.maximum is None:
+            return f"{self.name} must be a numeric value."
+        return f"{self.name} must be a numeric value between {self.minimum:g} and {self.maximum:g}."
+
+@dataclass(frozen=True)
+class ValidationResult:
+    """
+    Per-row, per-field outcome of validating a batch against a schema.
+
+    All masks have one row per input and one column per schema field, in
+    schema order. ``values`` holds the numeric inputs as floats (NaN where a
+    field is absent or not a number), so callers can use them directly.
+    """
+    schema: Tuple[InputField, ...]
+    present: np.ndarray
+    missing: np.ndarray
+    invalid: np.ndarray
+    values: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.present)
+
+    @property
+    def accepted(self) -> np.ndarray:
+        """
+        Rows that carry at least one schema field (see ``has_inputs``).
+
+        A row with some fields but not all the required ones is accepted and
+        then rejected by ``valid``, so a misspelt field is reported as an
+        error rather than silently skipping the prism.
+        """
+        return self.present.any(axis=1)
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Rows with every required field present and no invalid field."""
+        return ~(self.missing.any(axis=1) | self.invalid.any(axis=1))
+
+    def error(self, row: int) -> Optional[str]:
+        """Return the first problem with a row, worded as ``validate_inputs`` raises it."""
+        missing_fields = [self.schema[j].name for j in np.flatnonzero(self.missing[row])]
+        if missing_fields:
+            return f"Missing required input data: {', '.join(missing_fields)}"
+        invalid_fields = np.flatnonzero(self.invalid[row])
+        if len(invalid_fields):
+            return self.schema[invalid_fields[0]]._range_message()
+        return None
+
+    def errors(self) -> Dict[int, str]:
+        """Return the problem with every rejected row, keyed by row index."""
+        return {int(row): self.error(row) for row in np.flatnonzero(~self.valid)}
+
+class CompiledSchema:
+    """
+    A schema compiled into arrays, so a whole batch is checked in one pass.
+
+    Cells are gathered field by field and the range checks run as array
+    comparisons over the batch; bad rows are reported in the result's masks
+    instead of raising.
+    """
+
+    def __init__(self, schema: Sequence[InputField]):
+        self.schema = tuple(schema)
+        self.required = np.array([field.required for field in self.schema], dtype=bool)
+        self.minimum = np.array([-np.inf if field.minimum is None else field.minimum for field in self.schema])
+        self.maximum = np.array([np.inf if field.maximum is None else field.maximum for field in self.schema])
+
+    def validate_rows(self, rows: Sequence[Dict[str, Any]]) -> ValidationResult:
+        """Validate a batch of input dicts."""
+        columns = [[row.get(field.name, _MISSING) for row in rows] for field in self.schema]
+        return self._validate(len(rows), columns)
+
+    def validate_columns(self, frame: Any) -> ValidationResult:
+        """
+        Validate column-oriented input: a DataFrame or a mapping of column to values.
+
+        Missing cells (NaN or None) count as absent, as in ``iter_rows``.
+        """
+        n_rows = len(frame.index) if hasattr(frame, "index") else next(
+            (len(values) for values in frame.values()), 0
+        )
+        columns = []
+        for field in self.schema:
+            if field.name not in frame:
+                columns.append(None)
+                continue
+            values = np.asarray(frame[field.name])
+            if values.dtype.kind in "biuf":
+                # Plain numeric column: no per-cell type checks needed
+                columns.append(values.astype(float))
+            else:
+                columns.append([
+                    _MISSING if value is None or (isinstance(value, float) and value != value) else value
+                    for value in values.tolist()
+                ])
+        return self._validate(n_rows, columns)
+
+    def _validate(self, n_rows: int, columns: List[Any]) -> ValidationResult:
+        shape = (n_rows, len(self.schema))
+        present = np.zeros(shape, dtype=bool)
+        typed = np.zeros(shape, dtype=bool)
+        real = np.zeros(shape, dtype=bool)
+        values = np.full(shape, np.nan)
+        for j, (field, cells) in enumerate(zip(self.schema, columns)):
+            if cells is None:
+                continue
+            if isinstance(cells, np.ndarray):
+                present[:, j] = typed[:, j] = real[:, j] = ~np.isnan(cells)
+                values[:, j] = cells
+                continue
+            present[:, j] = [cell is not _MISSING for cell in cells]
+            typed[:, j] = [cell is not _MISSING and isinstance(cell, field.dtype) for cell in cells]
+            real[:, j] = [isinstance(cell, numbers.Real) for cell in cells]
+            values[:, j] = [float(cell) if isinstance(cell, numbers.Real) else np.nan for cell in cells]
+
+        # Only numbers have a range. NaN fails both comparisons, so a NaN
+        # given as a value is out of range.
+        in_range = (values >= self.minimum) & (values <= self.maximum)
+        invalid = present & ~(typed & (in_range | ~real))
+        missing = ~present & self.required
+        return ValidationResult(self.schema, present, missing, invalid, values)
+
+@lru_cache(maxsize=None)
+def compile_schema(schema: Tuple[InputField, ...]) -> CompiledSchema:
+    """Return the compiled form of a schema, compiling it once per schema."""
+    return CompiledSchema(schema)
+
+def missing_inputs(schema: Sequence[InputField], input_data: Dict[str, Any]) -> List[str]:
+    """Return the required fields absent from the input."""
+    return [field.name for field in schema if field.required and field.name not in input_data]
+
+def has_inputs(schema: Sequence[InputField], input_data: Dict[str, Any]) -> bool:
+    """
+    Return True if the input carries any of the schema's fields.
+
+    Inputs without any of them are meant for other prisms; inputs with some
+    of them are the prism's to validate, even when a required field is missing.
+    """
+    return any(field.name in input_data for field in schema)
+
+def validate_inputs(schema: Sequence[InputField], input_data: Dict[str, Any]) -> None:
+    """
+    Check the input against the schema.
+
+    Raises:
+        ValueError: If a required field is missing or a present field is invalid.
+    """
+    message = compile_schema(tuple(schema)).validate_rows([input_data]).error(0)
+    if message:
+        raise ValueError(message)
+
+def validate_batch(schema: Sequence[InputField], rows: Iterable[Dict[str, Any]]) -> ValidationResult:
+    """Check a batch of inputs against the schema in one pass, without raising."""
+    return compile_schema(tuple(schema)).validate_rows(list(rows))
+
+def project_inputs(schema: Sequence[InputField], input_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return only the declared fields present in the input."""
+    return {field.name: input_data[field.name] for field in schema if field.name in input_data}
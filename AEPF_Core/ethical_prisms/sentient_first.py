@@ -1,61 +1,53 @@
 import logging
+import numpy as np
 from ethical_prisms.ethical_prism_agent import EthicalPrismAgent
+from ethical_prisms.input_schema import InputField
 
 class SentientFirstPrism(EthicalPrismAgent):
+    INPUT_SCHEMA = (
+        InputField("sentient_welfare"),
+        InputField("empathy_score"),
+        InputField("autonomy_respect"),
+        InputField("sentient_safety"),
+        InputField("organisational_welfare"),
+        # Only used by calculate_score(), which scores 0.0 without it
+        InputField("AI_ethics_score", required=False)
+    )
+    REQUIRED_INPUTS = [field.name for field in INPUT_SCHEMA if field.required]
+
+    NARRATIVE_TEMPLATES = {
+        "sentient_welfare": "Sentient welfare score directly input as {value:.2f}.",
+        "empathy_score": "Empathy score for sentient beings is {value:.2f}.",
+        "autonomy_respect": "Respect for autonomy of sentient beings is {value:.2f}.",
+        "sentient_safety": "Sentient safety measures score is {value:.2f}.",
+        "organisational_welfare": "Organisational welfare impact score is {value:.2f}.",
+    }
+
     def __init__(self):
         self.prism_name = "Sentient-First"
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def evaluate(self, input_data):
+    def evaluate(self, input_data, narratives=True):
         """
         Evaluate the sentient-first prism with provided input data.
 
         Args:
             input_data (dict): Input data containing scores for evaluation.
+            narratives (bool): Whether to render metric narratives. They can be
+                added later with render_narratives().
 
         Returns:
             dict: Evaluated metrics and their narratives.
         """
-        self.logger.debug(f"Evaluating {self.prism_name} with input: {input_data}")
-        required_inputs = [
-            "sentient_welfare",
-            "empathy_score",
-            "autonomy_respect",
-            "sentient_safety",
-            "organisational_welfare"
-        ]
-
-        # Validate input data
-        for key in required_inputs:
-            if key not in input_data:
-                self.logger.error(f"Missing required input data: {key}")
-                raise ValueError(f"Missing required input data: {key}")
-            if not isinstance(input_data[key], (int, float)) or not (0 <= input_data[key] <= 1):
-                self.logger.error(f"{key} must be a numeric value between 0 and 1.")
-                raise ValueError(f"{key} must be a numeric value between 0 and 1.")
+        self.validate_inputs(input_data)
+        return self.evaluate_validated(input_data, narratives)
 
+    def evaluate_validated(self, input_data, narratives=True):
+        """Evaluate input data that has passed validate_inputs()."""
         # Process metrics
         metrics = {
-            "sentient_welfare": {
-                "value": input_data["sentient_welfare"],
-                "narrative": f"Sentient welfare score directly input as {input_data['sentient_welfare']:.2f}."
-            },
-            "empathy_score": {
-                "value": input_data["empathy_score"],
-                "narrative": f"Empathy score for sentient beings is {input_data['empathy_score']:.2f}."
-            },
-            "autonomy_respect": {
-                "value": input_data["autonomy_respect"],
-                "narrative": f"Respect for autonomy of sentient beings is {input_data['autonomy_respect']:.2f}."
-            },
-            "sentient_safety": {
-                "value": input_data["sentient_safety"],
-                "narrative": f"Sentient safety measures score is {input_data['sentient_safety']:.2f}."
-            },
-            "organisational_welfare": {
-                "value": input_data["organisational_welfare"],
-                "narrative": f"Organisational welfare impact score is {input_data['organisational_welfare']:.2f}."
-            },
+            key: self._metric(key, input_data[key], narratives)
+            for key in self.REQUIRED_INPUTS
         }
 
         # Calculate the score
@@ -70,7 +62,6 @@ class SentientFirstPrism(EthicalPrismAgent):
         }
 
     def calculate_score(self, input_data):
-        self.logger.debug(f"Calculating score for {self.prism_name} with input: {input_data}")
         try:
             score = (input_data['AI_ethics_score'] + input_data['sentient_welfare'] +
                      input_data['empathy_score'] + input_data['autonomy_respect'] +
@@ -80,3 +71,31 @@ class SentientFirstPrism(EthicalPrismAgent):
         except KeyError as e:
             self.logger.error(f"Missing key in input data: {e}")
             return 0.0
+
+    def evaluate_columns(self, frame):
+        """
+        Evaluate the sentient-first prism for every row of column-oriented input.
+
+        Args:
+            frame: DataFrame or mapping of input field to per-row values.
+
+        Returns:
+            dict: Per-row score array and per-metric value arrays.
+        """
+        # The whole schema, so an AI_ethics_score is checked just as in evaluate()
+        columns = self._require_columns(frame, self.INPUT_SCHEMA)
+        ai_ethics = columns.pop("AI_ethics_score")
+        metrics = columns
+
+        # Same summation order as calculate_score(); rows without an
+        # AI_ethics_score fall back to 0.0 just like the per-row KeyError path.
+        score = (ai_ethics + metrics["sentient_welfare"] + metrics["empathy_score"] +
+                 metrics["autonomy_respect"] + metrics["sentient_safety"] +
+                 metrics["organisational_welfare"]) / 6
+        score = np.where(np.isnan(ai_ethics), 0.0, score)
+
+        return {
+            "prism": self.prism_name,
+            "metrics": metrics,
+            "score": score
+        }
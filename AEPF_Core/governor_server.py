@@ -0,0 +1,264 @@
+"""
+Long-running Ethical Governor server.
+
+One warm EthicalGovernor is built per process when the server starts and is
+reused by every request, so construction (history store, prisms, plugin
+imports, causal model) is paid once instead of per call. The server speaks
+JSON over HTTP on a TCP port or a Unix socket:
+
+* ``POST /evaluate`` - ``{"input": {...}}`` returns ``{"report": {...}}``;
+  ``{"inputs": [...]}`` returns ``{"reports": [...]}`` via ``evaluate_batch``.
+* ``POST /reload`` - ``{"plugins": true, "causal_model": true}`` hot-reloads
+  changed plugins (every plugin with ``"force": true``) and/or the saved causal
+  model without a restart.
+* ``GET /health`` - liveness and the number of loaded plugins.
+* ``GET /metrics`` - cold start time, and request latency with the first
+  (cold) request reported separately from warm requests.
+
+Run several processes behind a load balancer to use more cores; each one
+keeps its own warm governor:
+
+    python governor_server.py --port 8080
+    python governor_server.py --unix-socket /tmp/aepf.sock
+"""
+
+from typing import Dict, Any, Callable, List, Optional, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingUnixStreamServer
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from ethical_governor import EthicalGovernor
+
+logger = logging.getLogger(__name__)
+
+def _json_default(value: Any) -> Any:
+    """Encode NumPy arrays and scalars found in reports."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+class GovernorService:
+    """A warm governor plus request metrics, independent of the transport."""
+
+    def __init__(self, governor: Optional[EthicalGovernor] = None,
+                 governor_factory: Callable[..., EthicalGovernor] = EthicalGovernor,
+                 **governor_kwargs: Any):
+        """
+        Args:
+            governor (EthicalGovernor, optional): A ready governor to serve.
+            governor_factory (Callable): Builds the governor when none is given.
+            governor_kwargs: Passed to ``governor_factory``.
+        """
+        start = time.perf_counter()
+        self.governor = governor if governor is not None else governor_factory(**governor_kwargs)
+        self.cold_start_seconds = time.perf_counter() - start
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._first_request_seconds: Optional[float] = None
+        self._latencies: Dict[str, List[float]] = {}
+        self._errors = 0
+
+    def _record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            if self._first_request_seconds is None:
+                self._first_request_seconds = seconds
+                return
+            samples = self._latencies.setdefault(endpoint, [])
+            samples.append(seconds)
+            if len(samples) > 4096:
+                del samples[:2048]
+
+    def evaluate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Evaluate one decision or a batch.
+
+        Raises:
+            ValueError: If the payload has neither an "input" object nor an "inputs" list.
+        """
+        start = time.perf_counter()
+        # Reports are built without narrative text; it is rendered only here,
+        # for the JSON response
+        render = self.governor.render_narratives
+        if isinstance(payload.get("inputs"), list):
+            result = {"reports": [render(report) for report in self.governor.evaluate_batch(payload["inputs"])]}
+        elif isinstance(payload.get("input"), dict):
+            result = {"report": render(self.governor.evaluate(payload["input"]))}
+        else:
+            raise ValueError("Expected an 'input' object or an 'inputs' list.")
+        self._record("evaluate", time.perf_counter() - start)
+        return result
+
+    def reload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Reload plugins and/or the causal model, one reload at a time."""
+        result = {}
+        with self._reload_lock:
+            if payload.get("plugins", True):
+                result["plugins"] = self.governor.reload_plugins(force=bool(payload.get("force", False)))
+            if payload.get("causal_model", True):
+                result["causal_model"] = self.governor.reload_causal_model()
+        return result
+
+    def health(self) -> Dict[str, Any]:
+        return {
+            "status": "ok",
+            "pid": os.getpid(),
+            "plugins": len(self.governor.plugin_manager.get_plugins()),
+            "uptime_seconds": time.time() - self.started_at
+        }
+
+    def metrics(self) -> Dict[str, Any]:
+        """Cold start and first-request cost, and warm latency per endpoint."""
+        with self._lock:
+            warm = {}
+            for endpoint, samples in self._latencies.items():
+                ordered = sorted(samples)
+                warm[endpoint] = {
+                    "count": len(ordered),
+                    "mean_seconds": sum(ordered) / len(ordered),
+                    "p50_seconds": _percentile(ordered, 0.5),
+                    "p95_seconds": _percentile(ordered, 0.95),
+                    "max_seconds": ordered[-1]
+                }
+            return {
+                "cold_start_seconds": self.cold_start_seconds,
+                "first_request_seconds": self._first_request_seconds,
+                "warm": warm,
+                "errors": self._errors,
+                "causal_cache": self.governor.causal_cache_stats()
+            }
+
+    def handle(self, method: str, path: str, payload: Optional[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Route a request.
+
+        Returns:
+            Tuple[int, Dict[str, Any]]: HTTP status and JSON body.
+        """
+        routes = {
+            ("POST", "/evaluate"): self.evaluate,
+            ("POST", "/reload"): self.reload,
+            ("GET", "/health"): lambda _: self.health(),
+            ("GET", "/metrics"): lambda _: self.metrics(),
+        }
+        route = routes.get((method, path.split("?", 1)[0]))
+        if route is None:
+            return 404, {"error": f"No route for {method} {path}"}
+        try:
+            return 200, route(payload or {})
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except Exception as e:
+            logger.exception(f"Request {method} {path} failed")
+            with self._lock:
+                self._errors += 1
+            return 500, {"error": str(e)}
+
+class GovernorRequestHandler(BaseHTTPRequestHandler):
+    """JSON-over-HTTP front end for the server's GovernorService."""
+
+    protocol_version = "HTTP/1.1"
+
+    def _read_payload(self) -> Optional[Dict[str, Any]]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        payload = json.loads(self.rfile.read(length))
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object.")
+        return payload
+
+    def _respond(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, default=_json_default).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _dispatch(self, method: str) -> None:
+        try:
+            payload = self._read_payload()
+        except ValueError as e:
+            self._respond(400, {"error": f"Invalid JSON body: {e}"})
+            return
+        self._respond(*self.server.service.handle(method, self.path, payload))
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+class GovernorHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], service: GovernorService):
+        super().__init__(address, GovernorRequestHandler)
+        self.service = service
+
+class GovernorUnixServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: GovernorService):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, GovernorRequestHandler)
+        self.service = service
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+def create_server(service: GovernorService, host: str = "127.0.0.1", port: int = 8080,
+                  unix_socket: Optional[str] = None):
+    """
+    Create the HTTP server for a service, on a Unix socket when one is given.
+
+    Returns:
+        The server; call ``serve_forever()`` to run it.
+    """
+    if unix_socket:
+        return GovernorUnixServer(unix_socket, service)
+    return GovernorHTTPServer((host, port), service)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a warm Ethical Governor over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--unix-socket", help="Listen on this Unix socket instead of TCP.")
+    parser.add_argument("--executor-mode", default="serial", choices=("serial", "thread", "process"))
+    parser.add_argument("--plugin-timeout", type=float)
+    args = parser.parse_args(argv)
+
+    service = GovernorService(executor_mode=args.executor_mode, plugin_timeout=args.plugin_timeout)
+    logger.info(f"Governor ready in {service.cold_start_seconds:.3f}s.")
+    server = create_server(service, args.host, args.port, args.unix_socket)
+    logger.info(f"Serving on {args.unix_socket or f'{args.host}:{args.port}'}.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.governor.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+from typing import Dict, Any, Iterable, Iterator, Optional, Union
+from abc import ABC, abstractmethod
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+import logging
+import pickle
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+class HistoryStore(ABC):
+    """Append-only storage backend for the Ethical Governor decision history."""
+
+    @abstractmethod
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Append a single decision record.
+
+        Args:
+            record (Dict[str, Any]): The decision record to persist.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append several decision records.
+
+        Args:
+            records (Iterable[Dict[str, Any]]): The decision records to persist.
+        """
+        for record in records:
+            self.append(record)
+
+    @abstractmethod
+    def iter_records(self, start: Optional[Union[str, datetime]] = None,
+                     end: Optional[Union[str, datetime]] = None,
+                     scenario: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream decision records in insertion order.
+
+        Args:
+            start: Only yield records with a timestamp at or after this time.
+            end: Only yield records with a timestamp at or before this time.
+            scenario: Only yield records for this scenario name.
+
+        Returns:
+            Iterator[Dict[str, Any]]: Matching records, read lazily.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def tail(self, count: int) -> Iterator[Dict[str, Any]]:
+        """
+        Return the most recent records, oldest first.
+
+        Args:
+            count (int): Maximum number of records to return.
+        """
+        return iter(deque(self.iter_records(), maxlen=count))
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+        pass
+
+def scenario_name(scenario: Any) -> Optional[str]:
+    """Return the scenario name from a detect_scenario() result."""
+    if isinstance(scenario, tuple):
+        scenario = scenario[0] if scenario else None
+    return None if scenario is None else str(scenario)
+
+def _format_timestamp(value: Optional[Union[str, datetime]]) -> Optional[str]:
+    if isinstance(value, datetime):
+        return value.strftime(TIMESTAMP_FORMAT)
+    return value
+
+class SQLiteHistoryStore(HistoryStore):
+    """
+    History store backed by an SQLite database in WAL mode.
+
+    Every decision is a single row insert, so the cost of recording a decision
+    does not depend on how much history already exists. Records are indexed by
+    timestamp and scenario name and are streamed back lazily.
+    """
+
+    def __init__(self, path: Union[str, Path], fetch_size: int = 256):
+        """
+        Open (or create) the history database.
+
+        Args:
+            path (Union[str, Path]): Location of the SQLite database file.
+            fetch_size (int): Number of rows fetched per round trip when streaming.
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.path = Path(path)
+        self.fetch_size = fetch_size
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS decisions ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "timestamp TEXT, "
+            "scenario TEXT, "
+            "payload BLOB NOT NULL)"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_decisions_timestamp ON decisions (timestamp)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_decisions_scenario ON decisions (scenario)")
+        connection.commit()
+        return connection
+
+    @staticmethod
+    def _row(record: Dict[str, Any]) -> tuple:
+        return (
+            record.get("timestamp"),
+            scenario_name(record.get("scenario")),
+            pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+    def append(self, record: Dict[str, Any]) -> None:
+        self.extend([record])
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        rows = [self._row(record) for record in records]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO decisions (timestamp, scenario, payload) VALUES (?, ?, ?)", rows
+            )
+
+    def iter_records(self, start: Optional[Union[str, datetime]] = None,
+                     end: Optional[Union[str, datetime]] = None,
+                     scenario: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        clauses, params = [], []
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(_format_timestamp(start))
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(_format_timestamp(end))
+        if scenario is not None:
+            clauses.append("scenario = ?")
+            params.append(scenario)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        # Page through the table by primary key so concurrent appends never
+        # hold a read cursor open across writes.
+        last_id = 0
+        while True:
+            page_where = f"{where} AND id > ?" if where else " WHERE id > ?"
+            with self._lock:
+                rows = self._connection.execute(
+                    f"SELECT id, payload FROM decisions{page_where} ORDER BY id LIMIT ?",
+                    (*params, last_id, self.fetch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row_id, payload in rows:
+                yield pickle.loads(payload)
+            last_id = rows[-1][0]
+
+    def tail(self, count: int) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT payload FROM decisions ORDER BY id DESC LIMIT ?", (count,)
+            ).fetchall()
+        return (pickle.loads(payload) for (payload,) in reversed(rows))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM decisions").fetchone()[0]
+
+    def compact(self, keep_last: Optional[int] = None,
+                before: Optional[Union[str, datetime]] = None) -> int:
+        """
+        Drop old records and reclaim the space they used.
+
+        Args:
+            keep_last (int, optional): Keep only this many of the newest records.
+            before: Drop records with a timestamp strictly earlier than this time.
+
+        Returns:
+            int: The number of records removed.
+        """
+        removed = 0
+        with self._lock:
+            with self._connection:
+                if before is not None:
+                    removed += self._connection.execute(
+                        "DELETE FROM decisions WHERE timestamp < ?", (_format_timestamp(before),)
+                    ).rowcount
+                if keep_last is not None:
+                    removed += self._connection.execute(
+                        "DELETE FROM decisions WHERE id NOT IN "
+                        "(SELECT id FROM decisions ORDER BY id DESC LIMIT ?)", (keep_last,)
+                    ).rowcount
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._connection.execute("VACUUM")
+        self.logger.info(f"Compacted decision history, removed {removed} records.")
+        return removed
+
+    def rotate(self, archive_path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Move the current database aside and start a new, empty one.
+
+        Args:
+            archive_path (Union[str, Path], optional): Where to move the current
+                database. Defaults to a timestamped file next to it.
+
+        Returns:
+            Path: The location of the archived database.
+        """
+        if archive_path is None:
+            stamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+            archive_path = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}")
+        archive_path = Path(archive_path)
+        with self._lock:
+            self._connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._connection.close()
+            self.path.replace(archive_path)
+            self._connection = self._connect()
+        self.logger.info(f"Rotated decision history to {archive_path}.")
+        return archive_path
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+def import_pickle_history(pickle_path: Union[str, Path], store: HistoryStore) -> int:
+    """
+    Import a legacy pickled decision history list into a history store.
+
+    Args:
+        pickle_path (Union[str, Path]): Path to the legacy ``.pkl`` history file.
+        store (HistoryStore): The store to append the records to.
+
+    Returns:
+        int: The number of records imported.
+    """
+    pickle_path = Path(pickle_path)
+    if not pickle_path.exists():
+        logger.warning(f"Legacy history file '{pickle_path}' not found.")
+        return 0
+    with open(pickle_path, "rb") as f:
+        records = pickle.load(f)
+    store.extend(records)
+    logger.info(f"Imported {len(records)} decision records from {pickle_path}.")
+    return len(records)
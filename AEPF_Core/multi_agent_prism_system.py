@@ -18,21 +18,86 @@ Running the Tests:
 3. Check the Output: The test results will indicate whether the system is functioning as expected.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple, Union
+import numpy as np
 from AEPF_Core.ecocentric_agent import EcocentricAgent
+from AEPF_Core.ethical_prisms.ethical_prism_agent import call_evaluate, column_count, iter_rows
+from AEPF_Core.prism_agreement import PrismAgreementMatrix
 from AEPF_Core.reinforcement_learning_manager import ReinforcementLearningManager
+from AEPF_Core.weight_checkpoints import WeightCheckpointer, WeightCheckpointStore
+
+def _rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Turn input dicts into one array per field, NaN where a row lacks the field."""
+    fields = list(dict.fromkeys(field for row in rows for field in row))
+    columns = {}
+    for field in fields:
+        values = [row.get(field, np.nan) for row in rows]
+        try:
+            columns[field] = np.array(values, dtype=float)
+        except (TypeError, ValueError):
+            columns[field] = np.array(values, dtype=object)
+    return columns
 
 class MultiAgentPrismSystem:
-    def __init__(self, rl_manager: ReinforcementLearningManager, agents: List[EcocentricAgent]):
+    def __init__(self, rl_manager: ReinforcementLearningManager, agents: List[EcocentricAgent],
+                 agreement: Optional[PrismAgreementMatrix] = None,
+                 checkpoints: Optional[WeightCheckpointStore] = None, checkpoint_every: int = 100):
         """
         Initialize the MultiAgentPrismSystem.
 
         Args:
             rl_manager (ReinforcementLearningManager): The RL manager to manage weights.
             agents (List[EcocentricAgent]): A list of ethical agents to evaluate input data.
+            agreement (PrismAgreementMatrix, optional): Running agreement between the agents'
+                scores, updated by every evaluation. Pass the governor's to share one.
+            checkpoints (WeightCheckpointStore, optional): Where to checkpoint the RL weights.
+                The latest checkpoint is loaded into ``rl_manager`` at startup, and
+                ``refine_system`` saves a new one every ``checkpoint_every`` weight changes.
+            checkpoint_every (int): Weight changes between checkpoints.
         """
         self.rl_manager = rl_manager
         self.agents = agents
+        self.agreement = agreement if agreement is not None else PrismAgreementMatrix(
+            type(agent).__name__ for agent in agents
+        )
+        self.checkpointer = None
+        if checkpoints is not None:
+            checkpoints.restore(rl_manager)
+            self.checkpointer = WeightCheckpointer(rl_manager, checkpoints, every=checkpoint_every)
+
+    @property
+    def agents(self) -> List[EcocentricAgent]:
+        return self._agents
+
+    @agents.setter
+    def agents(self, agents: List[EcocentricAgent]) -> None:
+        self._agents = agents
+        # Resolved once: agent i always reads weight i of the weight vector
+        self.agent_names = [type(agent).__name__ for agent in agents]
+        self._weight_cache: Optional[Tuple[Any, Any, np.ndarray]] = None
+
+    def weight_vector(self) -> np.ndarray:
+        """
+        Return the RL weights as a vector aligned with ``agents``.
+
+        The vector is rebuilt only when the RL manager's ``version`` changes or
+        it hands out a different weights object; agents without a weight get 0.
+        Managers that publish immutable snapshots are read through one
+        ``snapshot()`` call, so the weights and their version always match even
+        while another thread runs ``refine_system``. Treat the result as read-only.
+        """
+        if hasattr(self.rl_manager, "snapshot"):
+            snapshot = self.rl_manager.snapshot()
+            weights, version = snapshot.weights, snapshot.version
+        else:
+            weights = self.rl_manager.get_current_weights()
+            version = getattr(self.rl_manager, "version", None)
+        cached = self._weight_cache
+        if cached is None or cached[0] is not weights or cached[1] != version:
+            vector = np.array([weights.get(name, 0) for name in self.agent_names], dtype=float)
+            vector.setflags(write=False)
+            self._weight_cache = cached = (weights, version, vector)
+        return cached[2]
 
     def evaluate_all(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -44,19 +109,61 @@ class MultiAgentPrismSystem:
         Returns:
             Dict[str, Any]: Aggregated evaluation results.
         """
-        current_weights = self.rl_manager.get_current_weights()
+        current_weights = self.weight_vector()
         aggregated_score = 0.0
         metrics = {}
+        scores = {}
 
-        for agent in self.agents:
+        for agent, agent_name, weight in zip(self.agents, self.agent_names, current_weights):
             result = agent.evaluate(input_data)
-            agent_name = type(agent).__name__
             score = result['score']
-            aggregated_score += score * current_weights.get(agent_name, 0)
+            aggregated_score += score * weight
             metrics[agent_name] = result['metrics']
+            scores[agent_name] = score
 
+        self.agreement.update(scores)
         return {"aggregated_score": aggregated_score, "metrics": metrics}
 
+    def evaluate_batch(self, inputs: Union[Iterable[Dict[str, Any]], Any]) -> Dict[str, Any]:
+        """
+        Evaluate many inputs with all agents and aggregate them in one product.
+
+        Agents with a column kernel (``evaluate_columns``) score the whole batch
+        at once; other agents are called once per input. The N x A score matrix
+        is then aggregated with a single matrix-vector product against the
+        cached RL weight vector.
+
+        Args:
+            inputs: A list of input dicts, or a DataFrame / mapping of columns with
+                one input per row.
+
+        Returns:
+            Dict[str, Any]: 'agents' (column names), 'scores' (N x A matrix) and
+            'aggregated_scores' (N vector, each equal to evaluate_all's
+            'aggregated_score' for that input up to rounding).
+        """
+        if isinstance(inputs, (list, tuple)) or not hasattr(inputs, "keys"):
+            rows = list(inputs)
+            frame = _rows_to_columns(rows)
+            n_rows = len(rows)
+        else:
+            frame, rows = inputs, None
+            n_rows = column_count(frame)
+
+        scores = np.empty((n_rows, len(self.agents)))
+        for j, agent in enumerate(self.agents):
+            if hasattr(agent, "evaluate_columns"):
+                scores[:, j] = agent.evaluate_columns(frame)["score"]
+            else:
+                if rows is None:
+                    rows = list(iter_rows(frame))
+                # Only the scores are kept, so skip rendering narratives
+                scores[:, j] = [call_evaluate(agent.evaluate, row, False)["score"] for row in rows]
+
+        aggregated_scores = scores @ self.weight_vector()
+        self.agreement.update_batch(self.agent_names, scores)
+        return {"agents": list(self.agent_names), "scores": scores, "aggregated_scores": aggregated_scores}
+
     def refine_system(self, evaluation_result: Dict[str, Any], reward: float) -> None:
         """
         Refine the system by updating the RL manager with the evaluation result and reward.
@@ -65,4 +172,6 @@ class MultiAgentPrismSystem:
             evaluation_result (Dict[str, Any]): The result from the evaluation.
             reward (float): The reward signal received from the environment/feedback.
         """
-        self.rl_manager.update(evaluation_result, reward) 
\ No newline at end of file
+        self.rl_manager.update(evaluation_result, reward)
+        if self.checkpointer is not None:
+            self.checkpointer.maybe_save()
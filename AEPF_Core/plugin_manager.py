@@ -1,49 +1,294 @@
 import os
-import importlib
+import sys
+import hashlib
+import importlib.util
 import logging
-from typing import List
+import threading
+import time
+from dataclasses import dataclass
+from importlib import metadata
+from typing import Any, Dict, List, Optional, Tuple
 from ethical_prisms.ethical_prism_agent import EthicalPrismAgent
 
 logger = logging.getLogger(__name__)
 
+ENTRY_POINT_GROUP = "aepf.plugins"
+
+@dataclass
+class PluginRecord:
+    """A loaded plugin and what it was loaded from."""
+    name: str
+    plugin: Optional[EthicalPrismAgent]
+    source: str  # "file" or "entry_point"
+    origin: str  # file path, or "module:attr" for entry points
+    mtime_ns: int = 0
+    size: int = 0
+    digest: str = ""
+    load_seconds: float = 0.0
+    loads: int = 0
+
+class PluginRegistry:
+    """
+    Process-wide cache of loaded plugins.
+
+    Plugin files are keyed by (path, mtime, content hash): a file whose mtime
+    and size are unchanged is served from the cache without being read, and a
+    file that was touched but whose content hash is unchanged is not
+    re-imported. Only files whose content changed are executed again. Files
+    that could not be loaded are cached too, so they are not retried until
+    they change.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._files: Dict[str, PluginRecord] = {}
+        self._entry_points: Dict[Tuple[str, str], PluginRecord] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def load_directory(self, plugins_dir: str, force: bool = False) -> List[EthicalPrismAgent]:
+        """
+        Return the plugins defined in a directory, loading only new or changed files.
+
+        Args:
+            plugins_dir (str): The plugins directory.
+            force (bool): Re-execute every plugin file, even unchanged ones.
+
+        Returns:
+            List[EthicalPrismAgent]: The valid plugins, in file name order.
+        """
+        filenames = sorted(
+            filename for filename in os.listdir(plugins_dir)
+            if filename.endswith(".py") and not filename.startswith("_")
+        )
+        plugins = []
+        with self._lock:
+            seen = set()
+            for filename in filenames:
+                path = os.path.abspath(os.path.join(plugins_dir, filename))
+                seen.add(path)
+                record = self._load_file(plugins_dir, filename, path, force)
+                if record.plugin is not None:
+                    plugins.append(record.plugin)
+            # Forget plugins whose files were deleted
+            directory = os.path.abspath(plugins_dir)
+            for path in [p for p in self._files if os.path.dirname(p) == directory and p not in seen]:
+                del self._files[path]
+        return plugins
+
+    def _load_file(self, plugins_dir: str, filename: str, path: str, force: bool) -> PluginRecord:
+        stat = os.stat(path)
+        record = self._files.get(path)
+        if not force and record and (record.mtime_ns, record.size) == (stat.st_mtime_ns, stat.st_size):
+            self.cache_hits += 1
+            return record
+
+        with open(path, "rb") as f:
+            source = f.read()
+        digest = hashlib.sha256(source).hexdigest()
+        if not force and record and record.digest == digest:
+            # Touched but not edited
+            record.mtime_ns, record.size = stat.st_mtime_ns, stat.st_size
+            self.cache_hits += 1
+            return record
+
+        self.cache_misses += 1
+        module_name = filename[:-3]
+        start = time.perf_counter()
+        plugin = self._execute(plugins_dir, module_name, path, source)
+        new_record = PluginRecord(
+            name=module_name,
+            plugin=plugin,
+            source="file",
+            origin=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            digest=digest,
+            load_seconds=time.perf_counter() - start,
+            loads=(record.loads if record else 0) + 1
+        )
+        self._files[path] = new_record
+        return new_record
+
+    @staticmethod
+    def _module_path(plugins_dir: str, module_name: str) -> str:
+        package = os.path.normpath(plugins_dir).replace(os.sep, ".")
+        if not all(part.isidentifier() for part in package.split(".")):
+            # Directories that are not importable names get a stable private package name
+            package = "_aepf_plugins_" + hashlib.sha1(os.path.abspath(plugins_dir).encode()).hexdigest()[:8]
+        return f"{package}.{module_name}"
+
+    def _execute(self, plugins_dir: str, module_name: str, path: str, source: bytes) -> Optional[EthicalPrismAgent]:
+        """Execute a plugin file from the source that was hashed and return its plugin."""
+        module_path = self._module_path(plugins_dir, module_name)
+        try:
+            spec = importlib.util.spec_from_file_location(module_path, path)
+            module = importlib.util.module_from_spec(spec)
+            # Compile the bytes we hashed rather than trusting a cached .pyc,
+            # which can be stale when a file is rewritten within the same second
+            code = compile(source, path, "exec")
+            sys.modules[module_path] = module
+            exec(code, module.__dict__)
+        except Exception as e:
+            sys.modules.pop(module_path, None)
+            logger.error(f"Failed to load plugin '{module_name}': {e}")
+            return None
+
+        if not hasattr(module, "plugin"):
+            logger.error(f"Module {module_name} does not define a 'plugin' instance.")
+            return None
+        plugin_instance = getattr(module, "plugin")
+        if not isinstance(plugin_instance, EthicalPrismAgent):
+            logger.error(f"Plugin {module_name} does not implement EthicalPrismAgent.")
+            return None
+        logger.info(f"Loaded plugin: {module_name}")
+        return plugin_instance
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> List[EthicalPrismAgent]:
+        """
+        Return the plugins advertised by installed packages under an entry point group.
+
+        An entry point may refer to an EthicalPrismAgent instance or to a subclass,
+        which is instantiated with no arguments.
+
+        Args:
+            group (str): The entry point group name.
+
+        Returns:
+            List[EthicalPrismAgent]: The valid plugins, in entry point name order.
+        """
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            entry_points = entry_points.select(group=group)
+        else:
+            entry_points = entry_points.get(group, [])
+
+        plugins = []
+        with self._lock:
+            for entry_point in sorted(entry_points, key=lambda ep: ep.name):
+                key = (entry_point.name, entry_point.value)
+                record = self._entry_points.get(key)
+                if record is None:
+                    self.cache_misses += 1
+                    start = time.perf_counter()
+                    plugin = self._load_entry_point(entry_point)
+                    record = PluginRecord(
+                        name=entry_point.name,
+                        plugin=plugin,
+                        source="entry_point",
+                        origin=entry_point.value,
+                        load_seconds=time.perf_counter() - start,
+                        loads=1
+                    )
+                    self._entry_points[key] = record
+                else:
+                    self.cache_hits += 1
+                if record.plugin is not None:
+                    plugins.append(record.plugin)
+        return plugins
+
+    @staticmethod
+    def _load_entry_point(entry_point: Any) -> Optional[EthicalPrismAgent]:
+        try:
+            obj = entry_point.load()
+            if isinstance(obj, type) and issubclass(obj, EthicalPrismAgent):
+                obj = obj()
+        except Exception as e:
+            logger.error(f"Failed to load plugin entry point '{entry_point.name}': {e}")
+            return None
+        if not isinstance(obj, EthicalPrismAgent):
+            logger.error(f"Plugin entry point {entry_point.name} does not implement EthicalPrismAgent.")
+            return None
+        logger.info(f"Loaded plugin entry point: {entry_point.name}")
+        return obj
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return cache counters and the load time of every known plugin."""
+        with self._lock:
+            records = list(self._files.values()) + list(self._entry_points.values())
+            return {
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "plugins": {
+                    record.origin: {
+                        "name": record.name,
+                        "source": record.source,
+                        "loaded": record.plugin is not None,
+                        "load_seconds": record.load_seconds,
+                        "loads": record.loads
+                    }
+                    for record in records
+                }
+            }
+
+    def clear(self) -> None:
+        """Forget every cached plugin."""
+        with self._lock:
+            self._files.clear()
+            self._entry_points.clear()
+
+_registry = PluginRegistry()
+
+def get_registry() -> PluginRegistry:
+    """Return the process-wide plugin registry."""
+    return _registry
+
 class PluginManager:
-    def __init__(self, plugins_dir: str = "plugins", create_if_missing: bool = False):
+    def __init__(self, plugins_dir: str = "plugins", create_if_missing: bool = False,
+                 entry_point_group: Optional[str] = None, registry: Optional[PluginRegistry] = None):
+        """
+        Args:
+            plugins_dir (str): Directory scanned for plugin files.
+            create_if_missing (bool): Create the directory if it does not exist.
+            entry_point_group (str, optional): Also load plugins advertised by installed
+                packages under this entry point group, e.g. ``ENTRY_POINT_GROUP``.
+            registry (PluginRegistry, optional): Plugin cache. Defaults to the process-wide registry.
+        """
         self.plugins_dir = plugins_dir
         self.plugins: List[EthicalPrismAgent] = []
         self.create_if_missing = create_if_missing
+        self.entry_point_group = entry_point_group
+        self.registry = registry if registry is not None else get_registry()
 
-    def load_plugins(self) -> None:
+    def load_plugins(self, reload: bool = False) -> None:
         """
         Discover and load plugins from the specified plugins directory.
+
+        Files that have not changed since they were last loaded in this process
+        come from the plugin registry instead of being imported again.
+
+        Args:
+            reload (bool): Re-execute every plugin file, even unchanged ones.
         """
+        plugins = []
         if not os.path.isdir(self.plugins_dir):
             if self.create_if_missing:
                 os.makedirs(self.plugins_dir)
                 logger.info(f"Plugins directory '{self.plugins_dir}' created.")
             else:
                 logger.warning(f"Plugins directory '{self.plugins_dir}' not found.")
-                return
-
-        for filename in os.listdir(self.plugins_dir):
-            if filename.endswith(".py") and not filename.startswith("_"):
-                module_name = filename[:-3]
-                module_path = f"{self.plugins_dir}.{module_name}"
-                try:
-                    module = importlib.import_module(module_path)
-                    if hasattr(module, "plugin"):
-                        plugin_instance = getattr(module, "plugin")
-                        if isinstance(plugin_instance, EthicalPrismAgent):
-                            self.plugins.append(plugin_instance)
-                            logger.info(f"Loaded plugin: {module_name}")
-                        else:
-                            logger.error(f"Plugin {module_name} does not implement EthicalPrismAgent.")
-                    else:
-                        logger.error(f"Module {module_name} does not define a 'plugin' instance.")
-                except Exception as e:
-                    logger.error(f"Failed to load plugin '{module_name}': {e}")
+        else:
+            plugins.extend(self.registry.load_directory(self.plugins_dir, force=reload))
+
+        if self.entry_point_group:
+            plugins.extend(self.registry.load_entry_points(self.entry_point_group))
+        self.plugins = plugins
+
+    def refresh(self) -> bool:
+        """
+        Hot-reload plugin files whose content changed on disk.
+
+        Unchanged plugins keep their instances; only edited files are executed again.
+
+        Returns:
+            bool: True if the set of plugin instances changed.
+        """
+        previous = [id(plugin) for plugin in self.plugins]
+        self.load_plugins()
+        return [id(plugin) for plugin in self.plugins] != previous
 
     def get_plugins(self) -> List[EthicalPrismAgent]:
         """
         Return the list of loaded plugins.
         """
-        return self.plugins
\ No newline at end of file
+        return self.plugins
@@ -0,0 +1,222 @@
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import threading
+import numpy as np
+
+def prism_scores(prism_results: Dict[str, Any]) -> Dict[str, float]:
+    """Accept either plain scores or prism results carrying a 'score'."""
+    scores = {}
+    for name, result in prism_results.items():
+        score = result.get("score") if isinstance(result, dict) else result
+        if isinstance(score, (int, float)) and score == score:
+            scores[name] = float(score)
+    return scores
+
+class PrismAgreementMatrix:
+    """
+    Online covariance and correlation of prism scores.
+
+    Every decision updates pairwise Welford accumulators held in N x N NumPy
+    arrays, so the agreement between any two prisms is available at any time
+    without revisiting past decisions. A decision only updates the pairs of
+    prisms it scored; prisms that were not evaluated (skipped, failed) leave
+    their pairs untouched. New prisms, such as plugins, grow the matrix.
+
+    Accumulators, for the decisions in which both prism i and prism j scored:
+
+    * ``counts[i, j]`` - number of such decisions;
+    * ``means[i, j]`` - mean score of prism i;
+    * ``m2[i, j]`` - sum of squared deviations of prism i's score;
+    * ``comoments[i, j]`` - sum of the products of both deviations.
+    """
+
+    def __init__(self, prisms: Iterable[str] = ()):
+        """
+        Args:
+            prisms (Iterable[str]): Prism names to give the first rows and columns,
+                in order. Other prisms are added as they are first seen.
+        """
+        self._lock = threading.Lock()
+        self._index: Dict[str, int] = {}
+        self.counts = np.zeros((0, 0))
+        self.means = np.zeros((0, 0))
+        self.m2 = np.zeros((0, 0))
+        self.comoments = np.zeros((0, 0))
+        self.updates = 0
+        self._agreement: Optional[Tuple[List[str], np.ndarray]] = None
+        self._grow(list(prisms))
+
+    @property
+    def prisms(self) -> List[str]:
+        """Prism names in matrix order."""
+        return list(self._index)
+
+    def _grow(self, names: List[str]) -> None:
+        new = [name for name in dict.fromkeys(names) if name not in self._index]
+        if not new:
+            return
+        for name in new:
+            self._index[name] = len(self._index)
+        size = len(self._index)
+        for attr in ("counts", "means", "m2", "comoments"):
+            old = getattr(self, attr)
+            grown = np.zeros((size, size))
+            grown[:old.shape[0], :old.shape[1]] = old
+            setattr(self, attr, grown)
+
+    def update(self, prism_results: Dict[str, Any]) -> None:
+        """
+        Add one decision's prism scores.
+
+        Args:
+            prism_results (Dict[str, Any]): Prism name to score, or to a result dict
+                with a 'score', as in a governor report.
+        """
+        scores = prism_scores(prism_results)
+        if not scores:
+            return
+        with self._lock:
+            self._grow(list(scores))
+            x = np.full(len(self._index), np.nan)
+            for name, score in scores.items():
+                x[self._index[name]] = score
+            present = ~np.isnan(x)
+            both = np.outer(present, present)
+            x = np.where(present, x, 0.0)
+
+            self.counts += both
+            rows = x[:, None]  # prism i's score, broadcast along row i
+            delta = np.where(both, rows - self.means, 0.0)
+            self.means += np.divide(delta, self.counts, out=np.zeros_like(delta), where=both)
+            delta_after = np.where(both, rows - self.means, 0.0)
+            self.m2 += delta * delta_after
+            # Welford co-moment: old deviation of i times new deviation of j
+            self.comoments += delta * delta_after.T
+            self.updates += 1
+            self._agreement = None
+
+    def update_many(self, results: Iterable[Dict[str, Any]]) -> None:
+        """Add several decisions, oldest first."""
+        for prism_results in results:
+            self.update(prism_results)
+
+    def update_batch(self, prisms: List[str], scores: np.ndarray) -> None:
+        """
+        Add a batch of decisions given as a score matrix.
+
+        The batch's pairwise statistics are computed with matrix products and
+        merged into the running ones (Chan et al.'s parallel update), so the
+        cost does not grow with a Python loop over rows.
+
+        Args:
+            prisms (List[str]): Prism name of each column.
+            scores (np.ndarray): One row per decision, one column per prism; NaN
+                where a prism did not score the decision.
+        """
+        scores = np.asarray(scores, dtype=float)
+        if scores.ndim != 2 or not len(scores):
+            return
+        with self._lock:
+            self._grow(list(prisms))
+            index = np.array([self._index[name] for name in prisms])
+            x = np.full((len(scores), len(self._index)), np.nan)
+            x[:, index] = scores
+            present = ~np.isnan(x)
+            mask = present.astype(float)
+            # Covariance is shift invariant; centring first keeps the sums of
+            # squares from cancelling catastrophically
+            shift = np.zeros(x.shape[1])
+            seen = present.any(axis=0)
+            shift[seen] = np.nanmean(x[:, seen], axis=0)
+            x = np.where(present, x - shift, 0.0)
+
+            n_b = mask.T @ mask
+            sums = x.T @ mask  # sums[i, j]: prism i's scores where j also scored
+            mean_b = np.divide(sums, n_b, out=np.zeros_like(sums), where=n_b > 0)
+            m2_b = (x * x).T @ mask - n_b * mean_b ** 2
+            comoment_b = x.T @ x - n_b * mean_b * mean_b.T
+            mean_b += shift[:, None]
+
+            n_a = self.counts
+            n = n_a + n_b
+            delta = mean_b - self.means
+            weight = np.divide(n_a * n_b, n, out=np.zeros_like(n), where=n > 0)
+            self.means += np.divide(delta * n_b, n, out=np.zeros_like(n), where=n > 0)
+            self.m2 += m2_b + delta ** 2 * weight
+            self.comoments += comoment_b + delta * delta.T * weight
+            self.counts = n
+            self.updates += len(scores)
+            self._agreement = None
+
+    def covariance_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Return the sample covariance of every prism pair.
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Prism names and the N x N covariance,
+            NaN for pairs scored together fewer than twice.
+        """
+        with self._lock:
+            counts = self.counts.copy()
+            comoments = self.comoments.copy()
+            names = self.prisms
+        covariance = np.divide(comoments, counts - 1, out=np.full(counts.shape, np.nan), where=counts > 1)
+        return names, covariance
+
+    def agreement_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Return the Pearson correlation of every prism pair.
+
+        Values near 1 mean the prisms move together (harmonious), values near
+        -1 that one rises when the other falls (conflicted).
+
+        The matrix is computed once per update and then served as is, so
+        repeated reads between decisions are free.
+
+        Returns:
+            Tuple[List[str], np.ndarray]: Prism names and the read-only N x N
+            correlation, NaN for pairs scored together fewer than twice or
+            without variance.
+        """
+        with self._lock:
+            if self._agreement is None:
+                spread = self.m2 * self.m2.T
+                valid = (self.counts > 1) & (spread > 0)
+                correlation = np.divide(self.comoments, np.sqrt(spread),
+                                        out=np.full(self.counts.shape, np.nan), where=valid)
+                np.clip(correlation, -1.0, 1.0, out=correlation, where=valid)
+                correlation.setflags(write=False)
+                self._agreement = (self.prisms, correlation)
+            return self._agreement
+
+    def agreement(self, prism_a: str, prism_b: str) -> float:
+        """Return the correlation of two prisms, NaN if it is not known yet."""
+        names, correlation = self.agreement_matrix()
+        if prism_a not in names or prism_b not in names:
+            return float("nan")
+        return float(correlation[names.index(prism_a), names.index(prism_b)])
+
+    def pairs(self, threshold: float = 0.5) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Return the harmonious and conflicted prism pairs.
+
+        Args:
+            threshold (float): Pairs correlated above ``threshold`` are harmonious,
+                pairs below ``-threshold`` are conflicted.
+        """
+        names, correlation = self.agreement_matrix()
+        pairs = {"harmonious": [], "conflicted": []}
+        for i, j in zip(*np.triu_indices(len(names), k=1)):
+            value = correlation[i, j]
+            if value > threshold:
+                pairs["harmonious"].append((names[i], names[j]))
+            elif value < -threshold:
+                pairs["conflicted"].append((names[i], names[j]))
+        return pairs
+
+    def reset(self) -> None:
+        """Forget every recorded decision, keeping the known prisms."""
+        with self._lock:
+            for attr in ("counts", "means", "m2", "comoments"):
+                getattr(self, attr).fill(0.0)
+            self.updates = 0
+            self._agreement = None
@@ -0,0 +1,205 @@
+"""
+Fan-out execution of prism plugins for the Ethical Governor.
+
+Plugins can run one after another ("serial"), on a thread pool ("thread",
+for plugins that release the GIL or wait on I/O) or on a process pool
+("process", for CPU-bound Python plugins). In the pooled modes every plugin
+gets a timeout, so decision latency is bounded by the slowest plugin (or its
+timeout) rather than by the sum of all plugins. A plugin that raises or times
+out is reported as an error instead of failing the whole decision.
+
+Plugins that declare an INPUT_SCHEMA are validated here, once, before they
+run: a plugin none of whose inputs are present is skipped, one whose inputs
+are incomplete or invalid is reported as an error, and the others receive only the fields they
+declared.
+"""
+
+from typing import Dict, Any, List, NamedTuple, Optional, Sequence, Tuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeout
+import logging
+import threading
+import time
+from ethical_prisms.ethical_prism_agent import EthicalPrismAgent, call_evaluate
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ("serial", "thread", "process")
+
+class PrismRun(NamedTuple):
+    """The outcome of running the plugins against one input, keyed by plugin class name."""
+    results: Dict[str, Any]
+    errors: Dict[str, str]
+    skipped: List[str]
+
+def _evaluate_plugin(plugin: EthicalPrismAgent, input_data: Dict[str, Any],
+                     narratives: bool = False) -> Dict[str, Any]:
+    # Module-level so the process pool can pickle it
+    evaluate = getattr(plugin, "evaluate_validated", plugin.evaluate)
+    return call_evaluate(evaluate, input_data, narratives)
+
+def _describe_error(name: str, error: BaseException) -> str:
+    logger.error(f"Plugin {name} failed: {error}")
+    return f"{type(error).__name__}: {error}"
+
+def prepare_batch(plugins: Sequence[EthicalPrismAgent], rows: Sequence[Dict[str, Any]]
+                  ) -> List[Tuple[List[Tuple[EthicalPrismAgent, Dict[str, Any]]], Dict[str, str], List[str]]]:
+    """
+    Validate a batch of inputs against each plugin's schema and project them.
+
+    Every plugin's schema is checked once over the whole batch; rows with bad
+    inputs are excluded from that plugin without raising.
+
+    Returns:
+        For every row: the (plugin, projected input) pairs to run, the plugins
+        whose inputs are incomplete or invalid with their errors, and the names of
+        the plugins skipped because none of their inputs are present.
+    """
+    prepared = [([], {}, []) for _ in rows]
+    for plugin in plugins:
+        name = plugin.__class__.__name__
+        if not getattr(plugin, "INPUT_SCHEMA", ()):
+            for (runnable, _, _), input_data in zip(prepared, rows):
+                runnable.append((plugin, input_data))
+            continue
+        checked = plugin.validate_batch(rows)
+        accepted, valid = checked.accepted, checked.valid
+        rejected = 0
+        for i, ((runnable, errors, skipped), input_data) in enumerate(zip(prepared, rows)):
+            if not accepted[i]:
+                skipped.append(name)
+            elif not valid[i]:
+                errors[name] = f"ValueError: {checked.error(i)}"
+                rejected += 1
+            else:
+                runnable.append((plugin, plugin.project(input_data)))
+        if rejected:
+            logger.error(f"Plugin {name}: {rejected} of {len(rows)} inputs are invalid and were excluded.")
+    return prepared
+
+def prepare_plugins(plugins: Sequence[EthicalPrismAgent], input_data: Dict[str, Any]
+                    ) -> Tuple[List[Tuple[EthicalPrismAgent, Dict[str, Any]]], Dict[str, str], List[str]]:
+    """Validate one input against each plugin's schema and project it; see ``prepare_batch``."""
+    return prepare_batch(plugins, [input_data])[0]
+
+class PrismExecutor:
+    """Runs prism plugins against one input, serially or on a worker pool."""
+
+    def __init__(self, mode: str = "serial", max_workers: Optional[int] = None,
+                 timeout: Optional[float] = None, narratives: bool = False):
+        """
+        Args:
+            mode (str): "serial", "thread" or "process".
+            max_workers (int, optional): Pool size for the thread and process modes.
+            timeout (float, optional): Seconds each plugin may take in the pooled modes.
+                A plugin can override it with a ``timeout`` attribute. Serial mode
+                cannot interrupt a plugin, so it does not enforce timeouts.
+            narratives (bool): Whether plugins render their metric narratives. Off by
+                default: the text is only needed when a report is shown, see
+                ``EthicalPrismAgent.render_narratives``.
+
+        Raises:
+            ValueError: If the mode is not one of EXECUTOR_MODES.
+        """
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode: {mode}")
+        self.mode = mode
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.narratives = narratives
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> Executor:
+        with self._lock:
+            if self._pool is None:
+                pool_class = ThreadPoolExecutor if self.mode == "thread" else ProcessPoolExecutor
+                self._pool = pool_class(max_workers=self.max_workers)
+            return self._pool
+
+    def _plugin_timeout(self, plugin: EthicalPrismAgent) -> Optional[float]:
+        return getattr(plugin, "timeout", None) or self.timeout
+
+    def run(self, plugins: Sequence[EthicalPrismAgent], input_data: Dict[str, Any]) -> PrismRun:
+        """
+        Evaluate every plugin against the input data.
+
+        Args:
+            plugins (Sequence[EthicalPrismAgent]): The plugins to run.
+            input_data (Dict[str, Any]): The input data for evaluation.
+
+        Returns:
+            PrismRun: Results, errors and skipped plugins, keyed by the plugin class
+            name. Results keep the plugin order.
+        """
+        return self._run_prepared(*prepare_plugins(plugins, input_data))
+
+    def run_batch(self, plugins: Sequence[EthicalPrismAgent],
+                  rows: Sequence[Dict[str, Any]]) -> List[PrismRun]:
+        """
+        Evaluate every plugin against each input of a batch.
+
+        Inputs are validated for the whole batch up front; a row with invalid
+        inputs only loses the plugins whose inputs are invalid.
+
+        Returns:
+            List[PrismRun]: One run per input, in input order.
+        """
+        return [self._run_prepared(*prepared) for prepared in prepare_batch(plugins, rows)]
+
+    def _run_prepared(self, runnable: Sequence[Tuple[EthicalPrismAgent, Dict[str, Any]]],
+                      errors: Dict[str, str], skipped: List[str]) -> PrismRun:
+        # A lone plugin without a timeout, its own or the executor's, gains
+        # nothing from a pool
+        if self.mode == "serial" or not runnable or (
+                len(runnable) == 1 and not self._plugin_timeout(runnable[0][0])):
+            results = self._run_serial(runnable, errors)
+        else:
+            results = self._run_pooled(runnable, errors)
+        return PrismRun(results, errors, skipped)
+
+    def _run_serial(self, runnable: Sequence[Tuple[EthicalPrismAgent, Dict[str, Any]]],
+                    errors: Dict[str, str]) -> Dict[str, Any]:
+        results = {}
+        for plugin, plugin_input in runnable:
+            name = plugin.__class__.__name__
+            try:
+                results[name] = _evaluate_plugin(plugin, plugin_input, self.narratives)
+            except Exception as e:
+                errors[name] = _describe_error(name, e)
+        return results
+
+    def _run_pooled(self, runnable: Sequence[Tuple[EthicalPrismAgent, Dict[str, Any]]],
+                    errors: Dict[str, str]) -> Dict[str, Any]:
+        pool = self._get_pool()
+        start = time.monotonic()
+        pending: List[Tuple[str, Any, Optional[float]]] = []
+        for plugin, plugin_input in runnable:
+            name = plugin.__class__.__name__
+            pending.append((name, pool.submit(_evaluate_plugin, plugin, plugin_input, self.narratives), self._plugin_timeout(plugin)))
+
+        outcomes: Dict[str, Tuple[bool, Any]] = {}
+        # Collect the plugins with the earliest deadline first so every plugin
+        # gets its full timeout measured from the fan-out
+        for name, future, timeout in sorted(pending, key=lambda p: float("inf") if p[2] is None else p[2]):
+            remaining = None if timeout is None else max(0.0, start + timeout - time.monotonic())
+            try:
+                outcomes[name] = (True, future.result(timeout=remaining))
+            except FutureTimeout:
+                future.cancel()
+                logger.error(f"Plugin {name} timed out after {timeout}s.")
+                outcomes[name] = (False, f"TimeoutError: timed out after {timeout}s")
+            except Exception as e:
+                outcomes[name] = (False, _describe_error(name, e))
+
+        results = {}
+        for name, _, _ in pending:
+            succeeded, value = outcomes[name]
+            (results if succeeded else errors)[name] = value
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool, if one was started."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait, cancel_futures=True)
+                self._pool = None
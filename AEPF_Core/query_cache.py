@@ -0,0 +1,101 @@
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import threading
+import time
+
+_MISSING = object()
+
+def canonical_evidence(evidence: Dict[str, Any]) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """
+    Turn an evidence dict into a hashable, order-independent cache key.
+
+    Returns:
+        Optional[tuple]: The sorted evidence items, or None if a value is unhashable.
+    """
+    try:
+        key = tuple(sorted(evidence.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+class LRUQueryCache:
+    """Thread-safe LRU cache with an optional time-to-live and hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            maxsize (int): Maximum number of entries kept before the least recently used is evicted.
+            ttl (float, optional): Seconds an entry stays valid. None keeps entries until evicted.
+            clock (Callable[[], float]): Time source, overridable for tests.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """
+        Look up a key, counting the hit or miss.
+
+        Returns:
+            The cached value, or ``default`` when the key is absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl is None or self.clock() - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def empty_copy(self) -> "LRUQueryCache":
+        """Return an empty cache with the same settings, continuing this cache's counters."""
+        cache = LRUQueryCache(self.maxsize, self.ttl, self.clock)
+        with self._lock:
+            cache.hits, cache.misses, cache.evictions = self.hits, self.misses, self.evictions
+        return cache
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-import random
-from typing import Dict, Any
+from typing import Dict, NamedTuple, Tuple
+import threading
+import numpy as np
 
 class RLManager(ABC):
     @abstractmethod
@@ -11,38 +12,168 @@ class RLManager(ABC):
 class ExampleRLManager(RLManager):
     def __init__(self, initial_weights):
         self.weights = initial_weights
+        # Bumped whenever the weights change, so consumers can cache derived values
+        self.version = 0
 
     def update_weights(self, feedback):
         # Implement weight update logic
         self.weights = {k: v + 0.01 for k, v in self.weights.items()}
+        self.version += 1
         return self.weights 
 
+class WeightSnapshot(NamedTuple):
+    """
+    Immutable view of the weights at one version.
+
+    ``vector`` is read-only and ``weights`` must be treated as read-only: a
+    snapshot is shared by every reader and never changes once published.
+    """
+    version: int
+    agents: Tuple[str, ...]
+    agent_index: Dict[str, int]
+    vector: np.ndarray
+    weights: Dict[str, float]
+
 class ReinforcementLearningManager:
-    def __init__(self, initial_weights=None, learning_rate=0.1, epsilon=0.1):
-        self.weights = initial_weights if initial_weights is not None else {}
+    """
+    Epsilon-greedy prism weight learner backed by a NumPy vector.
+
+    Weights are stored in one float array indexed by ``agents`` (a stable
+    name order fixed by the initial weights). All randomness comes from a
+    seeded ``np.random.Generator``, so replaying the same updates with the
+    same seed gives the same weights, and a batch of updates
+    (``update_batch``) gives the same weights as applying them one by one.
+
+    Readers and the learner never share mutable state: every update computes
+    a new vector and publishes it as a new WeightSnapshot with a single
+    reference assignment. Evaluator threads read ``snapshot()`` (or the
+    properties derived from it) without a lock and always see one complete,
+    normalized set of weights. Updates are serialized with a lock that only
+    writers take.
+    """
+
+    def __init__(self, initial_weights=None, learning_rate=0.1, epsilon=0.1, seed=None, rng=None):
+        """
+        Args:
+            initial_weights (dict, optional): Agent name to starting weight.
+            learning_rate (float): Step size towards the reward.
+            epsilon (float): Probability of exploring each weight in select_action().
+            seed (int, optional): Seed of the random generator, for reproducible runs.
+            rng (np.random.Generator, optional): Generator to use instead of seeding one.
+        """
         self.learning_rate = learning_rate
         self.epsilon = epsilon
+        self.seed = seed
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self._update_lock = threading.Lock()
+        self._snapshot = WeightSnapshot(0, (), {}, np.zeros(0), {})
+        self.weights = initial_weights if initial_weights is not None else {}
+
+    def snapshot(self):
+        """Return the current weights as one consistent, immutable snapshot."""
+        return self._snapshot
+
+    def _publish(self, vector, steps=1, agents=None, agent_index=None):
+        current = self._snapshot
+        agents = current.agents if agents is None else agents
+        vector.setflags(write=False)
+        self._snapshot = WeightSnapshot(
+            current.version + steps,
+            agents,
+            current.agent_index if agent_index is None else agent_index,
+            vector,
+            dict(zip(agents, vector.tolist()))
+        )
+
+    @property
+    def version(self):
+        """Bumped whenever the weights change, so consumers can cache derived values."""
+        return self._snapshot.version
+
+    @property
+    def agents(self):
+        return list(self._snapshot.agents)
+
+    @property
+    def agent_index(self):
+        return self._snapshot.agent_index
+
+    @property
+    def weight_vector(self):
+        """The current weight vector (read-only)."""
+        return self._snapshot.vector
+
+    @property
+    def weights(self):
+        """The current weights as a dict (treat as read-only)."""
+        return self._snapshot.weights
+
+    @weights.setter
+    def weights(self, weights):
+        agents = tuple(weights)
+        with self._update_lock:
+            self._publish(np.array([weights[name] for name in agents], dtype=float),
+                          agents=agents, agent_index={name: i for i, name in enumerate(agents)})
 
     def get_current_weights(self):
         return self.weights
 
-    def select_action(self):
-        # Implement epsilon-greedy action selection logic
-        for key in self.weights:
-            if random.random() < self.epsilon:
-                self.weights[key] += random.uniform(-0.01, 0.01)
+    @staticmethod
+    def _normalize(vector):
         # Normalize weights to sum to 1
-        total = sum(self.weights.values())
-        self.weights = {k: v / total for k, v in self.weights.items()}
+        return vector / vector.sum()
+
+    def select_action(self):
+        # Epsilon-greedy exploration: nudge each weight with probability epsilon
+        with self._update_lock:
+            vector = self.weight_vector
+            size = len(vector)
+            explore = self.rng.random(size) < self.epsilon
+            self._publish(self._normalize(vector + np.where(explore, self.rng.uniform(-0.01, 0.01, size), 0.0)))
         return self.weights
 
     def update(self, decision_result, reward):
-        # Implement weight update logic based on decision result and reward
-        for key in self.weights:
-            # Update weights based on reward
-            self.weights[key] += self.learning_rate * (reward - self.weights[key])
-            # Introduce a small perturbation to ensure change
-            self.weights[key] += random.uniform(-0.001, 0.001)
-        # Normalize weights to sum to 1
-        total = sum(self.weights.values())
-        self.weights = {k: v / total for k, v in self.weights.items()} 
\ No newline at end of file
+        """Move every weight towards the reward, with a small perturbation to ensure change."""
+        with self._update_lock:
+            vector = self.weight_vector
+            vector = vector + self.learning_rate * (reward - vector)
+            vector += self.rng.uniform(-0.001, 0.001, len(vector))
+            self._publish(self._normalize(vector))
+
+    def update_batch(self, decision_results, rewards):
+        """
+        Apply many updates in one call.
+
+        Equivalent to calling update() for each (result, reward) pair in order,
+        including the random perturbations drawn. Normalizing divides by a sum
+        that does not depend on the weights themselves, so the whole sequence
+        reduces to one linear recurrence, solved here with cumulative products.
+
+        Args:
+            decision_results: One decision result per reward (unused by the update rule), or None.
+            rewards (array-like): One reward per update, oldest first.
+        """
+        rewards = np.asarray(rewards, dtype=float).reshape(-1)
+        steps = len(rewards)
+        if not steps:
+            return
+        with self._update_lock:
+            self._publish(self._solve_updates(self.weight_vector, rewards), steps=steps)
+
+    def _solve_updates(self, vector, rewards):
+        steps = len(rewards)
+        size = len(vector)
+        lr = self.learning_rate
+        noise = self.rng.uniform(-0.001, 0.001, (steps, size))
+
+        # Step t: w <- ((1 - lr) * w + b_t) / z_t, with z_t = (1 - lr) * sum(w) + sum(b_t),
+        # and sum(w) == 1 after the first step
+        offsets = lr * rewards[:, None] + noise
+        totals = offsets.sum(axis=1) + (1 - lr)
+        totals[0] += (1 - lr) * (vector.sum() - 1)
+        decay = (1 - lr) / totals
+        offsets /= totals[:, None]
+        # later[t] = product of the decays applied after step t
+        later = np.ones(steps)
+        later[:-1] = np.cumprod(decay[::-1])[::-1][1:]
+        return vector * np.prod(decay) + later @ offsets
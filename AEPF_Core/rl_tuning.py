@@ -0,0 +1,292 @@
+"""
+Offline tuning of the RL prism weights against the recorded decision history.
+
+The harness replays labelled decisions from the history store (or a legacy
+pickle history) through ReinforcementLearningManager for a grid of
+hyperparameter configurations, in parallel across a process pool:
+
+    python rl_tuning.py --history history/ethical_governor_history.db \\
+        --learning-rates 0.01 0.05 0.1 --epsilons 0.0 0.1 --seeds 0 1 2 \\
+        --checkpoint-dir tuning_checkpoints
+
+Each decision needs a reward label, read from the record's ``reward`` key by
+default. A configuration's loss is the mean squared error between the
+weighted prism scores and the rewards over the whole replay; it is recorded
+after every chunk of updates to give a convergence curve. Runs are
+reproducible for a given seed, and with a checkpoint directory an
+interrupted run resumes where its last checkpoint left off.
+"""
+
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Optional, Sequence, Union
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import product
+from pathlib import Path
+import argparse
+import json
+import logging
+import os
+import pickle
+import numpy as np
+from history_store import SQLiteHistoryStore
+from reinforcement_learning_manager import ReinforcementLearningManager
+from weight_checkpoints import WeightCheckpointStore
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+@dataclass(frozen=True)
+class TuningConfig:
+    """One hyperparameter configuration of the RL manager."""
+    learning_rate: float
+    epsilon: float
+    seed: int
+
+    @property
+    def key(self) -> str:
+        return f"lr{self.learning_rate:g}_eps{self.epsilon:g}_seed{self.seed}"
+
+@dataclass
+class Replay:
+    """Labelled decisions: one row of prism scores (NaN if absent) and one reward per decision."""
+    agents: List[str]
+    scores: np.ndarray
+    rewards: np.ndarray
+
+    def __post_init__(self):
+        # Sufficient statistics of the squared error, so a loss costs O(agents^2)
+        # instead of a pass over the replay
+        scores = np.nan_to_num(self.scores)
+        count = max(len(self.rewards), 1)
+        self._gram = scores.T @ scores / count
+        self._cross = scores.T @ self.rewards / count
+        self._reward_power = float(self.rewards @ self.rewards) / count
+
+    def __len__(self) -> int:
+        return len(self.rewards)
+
+    def loss(self, weights: np.ndarray) -> float:
+        """Mean squared error between the weighted prism scores and the rewards."""
+        return float(weights @ self._gram @ weights - 2 * weights @ self._cross + self._reward_power)
+
+@dataclass
+class TuningResult:
+    config: TuningConfig
+    weights: Dict[str, float]
+    loss: float
+    curve: List[float] = field(default_factory=list)
+    steps: int = 0
+
+def grid(learning_rates: Iterable[float], epsilons: Iterable[float],
+         seeds: Iterable[int]) -> List[TuningConfig]:
+    """Return every combination of the given hyperparameters."""
+    return [TuningConfig(lr, eps, seed) for lr, eps, seed in product(learning_rates, epsilons, seeds)]
+
+def iter_history(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream decision records from a history database or a legacy pickle history.
+
+    Raises:
+        FileNotFoundError: If there is no history at the path. Opening the store
+            would otherwise create an empty database and tune on nothing.
+    """
+    path = Path(path)
+    if not path.is_file():
+        raise FileNotFoundError(f"No decision history at {path}")
+    if path.suffix == ".pkl":
+        with open(path, "rb") as f:
+            yield from pickle.load(f)
+        return
+    store = SQLiteHistoryStore(path)
+    try:
+        yield from store.iter_records()
+    finally:
+        store.close()
+
+def load_replay(records: Iterable[Dict[str, Any]], agents: Optional[Sequence[str]] = None,
+                reward_key: str = "reward",
+                reward_fn: Optional[Callable[[Dict[str, Any]], Optional[float]]] = None) -> Replay:
+    """
+    Build a replay from decision records.
+
+    Args:
+        records: Decision records, oldest first.
+        agents (Sequence[str], optional): Prism names, in weight order. Defaults to every
+            prism found in the records, in order of appearance.
+        reward_key (str): Record key holding the reward label.
+        reward_fn (Callable, optional): Computes the reward of a record instead.
+
+    Returns:
+        Replay: The labelled decisions. Records without a reward are left out.
+    """
+    rows, rewards = [], []
+    for record in records:
+        reward = reward_fn(record) if reward_fn else record.get(reward_key)
+        if reward is None:
+            continue
+        rows.append({
+            name: result.get("score") if isinstance(result, dict) else result
+            for name, result in record.get("prism_results", {}).items()
+        })
+        rewards.append(float(reward))
+    if agents is None:
+        agents = list(dict.fromkeys(name for row in rows for name in row))
+    scores = np.array([[_score(row.get(name)) for name in agents] for row in rows], dtype=float)
+    return Replay(list(agents), scores.reshape(len(rows), len(agents)), np.array(rewards, dtype=float))
+
+def _score(value: Any) -> float:
+    return float(value) if isinstance(value, (int, float)) else np.nan
+
+def _checkpoint_path(checkpoint_dir: Union[str, Path], config: TuningConfig) -> Path:
+    return Path(checkpoint_dir) / f"{config.key}.npz"
+
+def _save_checkpoint(path: Path, manager: ReinforcementLearningManager, position: int,
+                     curve: List[float], fingerprint: Dict[str, Any]) -> None:
+    state = {
+        "version": CHECKPOINT_VERSION,
+        "position": position,
+        "rng": manager.rng.bit_generator.state,
+        "fingerprint": fingerprint,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, weights=manager.weight_vector, curve=np.array(curve, dtype=float),
+                 state=np.array(json.dumps(state)))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _load_checkpoint(path: Path, manager: ReinforcementLearningManager,
+                     fingerprint: Dict[str, Any]) -> Optional[tuple]:
+    if not path.exists():
+        return None
+    with np.load(path, allow_pickle=False) as data:
+        state = json.loads(str(data["state"]))
+        if state.get("version") != CHECKPOINT_VERSION or state.get("fingerprint") != fingerprint:
+            logger.warning(f"Ignoring checkpoint {path}: it was written for a different run.")
+            return None
+        manager.weights = dict(zip(manager.agents, data["weights"].tolist()))
+        curve = data["curve"].tolist()
+    manager.rng.bit_generator.state = state["rng"]
+    return state["position"], curve
+
+def run_config(config: TuningConfig, replay: Replay, initial_weights: Optional[Dict[str, float]] = None,
+               epochs: int = 1, chunk_size: int = 256, checkpoint_dir: Optional[Union[str, Path]] = None,
+               checkpoint_every: int = 16, stop_after: Optional[int] = None) -> TuningResult:
+    """
+    Replay the decisions through one RL manager configuration.
+
+    Each chunk of ``chunk_size`` decisions performs one exploration step
+    (``select_action``) followed by one batched update, then records the loss.
+
+    Args:
+        config (TuningConfig): The hyperparameters and seed.
+        replay (Replay): The labelled decisions.
+        initial_weights (Dict[str, float], optional): Starting weights; uniform by default.
+        epochs (int): Passes over the replay.
+        chunk_size (int): Decisions per update batch and per curve point.
+        checkpoint_dir (optional): Where to save and resume checkpoints.
+        checkpoint_every (int): Chunks between checkpoints.
+        stop_after (int, optional): Process at most this many chunks in this call, e.g.
+            for time-boxed jobs; a later call resumes from the checkpoint.
+
+    Returns:
+        TuningResult: Final weights, loss and the loss after every chunk.
+    """
+    if initial_weights is None:
+        initial_weights = {name: 1.0 / len(replay.agents) for name in replay.agents}
+    manager = ReinforcementLearningManager(
+        {name: initial_weights.get(name, 0.0) for name in replay.agents},
+        learning_rate=config.learning_rate, epsilon=config.epsilon, seed=config.seed
+    )
+    total = len(replay) * epochs
+    fingerprint = {"steps": total, "chunk_size": chunk_size, "agents": replay.agents}
+    path = _checkpoint_path(checkpoint_dir, config) if checkpoint_dir else None
+
+    position, curve = 0, [replay.loss(manager.weight_vector)]
+    restored = _load_checkpoint(path, manager, fingerprint) if path else None
+    if restored:
+        position, curve = restored
+        logger.info(f"Resuming {config.key} at step {position} of {total}.")
+
+    chunks, saved = 0, position
+    while position < total and (stop_after is None or chunks < stop_after):
+        start = position % len(replay)
+        stop = min(start + chunk_size, len(replay), start + total - position)
+        manager.select_action()
+        manager.update_batch(None, replay.rewards[start:stop])
+        position += stop - start
+        curve.append(replay.loss(manager.weight_vector))
+        chunks += 1
+        if path and chunks % checkpoint_every == 0:
+            _save_checkpoint(path, manager, position, curve, fingerprint)
+            saved = position
+    # The end of the run, or of this call's share of it, unless just saved
+    if path and position != saved:
+        _save_checkpoint(path, manager, position, curve, fingerprint)
+
+    return TuningResult(config, manager.get_current_weights(), curve[-1], curve, position)
+
+def tune(configs: Sequence[TuningConfig], replay: Replay, workers: Optional[int] = None,
+         **run_kwargs: Any) -> List[TuningResult]:
+    """
+    Run every configuration, in parallel when ``workers`` is not 1.
+
+    Args:
+        configs (Sequence[TuningConfig]): The configurations to try.
+        replay (Replay): The labelled decisions.
+        workers (int, optional): Process pool size; 1 runs in this process.
+        run_kwargs: Passed to ``run_config``.
+
+    Returns:
+        List[TuningResult]: Results ordered from lowest to highest loss.
+    """
+    run = partial(run_config, replay=replay, **run_kwargs)
+    if workers == 1 or len(configs) <= 1:
+        results = [run(config) for config in configs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run, configs))
+    return sorted(results, key=lambda result: result.loss)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Tune the RL prism weights on recorded decisions.")
+    parser.add_argument("--history", default="history/ethical_governor_history.db",
+                        help="History database, or a legacy .pkl history.")
+    parser.add_argument("--reward-key", default="reward")
+    parser.add_argument("--learning-rates", type=float, nargs="+", default=[0.01, 0.05, 0.1])
+    parser.add_argument("--epsilons", type=float, nargs="+", default=[0.0, 0.1])
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0])
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--checkpoint-dir")
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--save-best", metavar="DIR",
+                        help="Save the best weights as a checkpoint named after its configuration.")
+    args = parser.parse_args(argv)
+
+    if not Path(args.history).is_file():
+        parser.error(f"No decision history at {args.history}.")
+    replay = load_replay(iter_history(args.history), reward_key=args.reward_key)
+    if not len(replay):
+        parser.error(f"No decisions with a '{args.reward_key}' label in {args.history}.")
+    results = tune(grid(args.learning_rates, args.epsilons, args.seeds), replay, workers=args.workers,
+                   epochs=args.epochs, chunk_size=args.chunk_size, checkpoint_dir=args.checkpoint_dir)
+    if args.save_best:
+        WeightCheckpointStore(args.save_best).save_weights(results[0].weights, name=results[0].config.key)
+    print(json.dumps([
+        {
+            "config": result.config.key,
+            "loss": result.loss,
+            "weights": result.weights,
+            "curve": result.curve
+        }
+        for result in results[:args.top]
+    ], indent=2))
+
+if __name__ == "__main__":
+    main()
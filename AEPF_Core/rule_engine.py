@@ -1,36 +1,58 @@
 from experta import *
+from compiled_rules import THRESHOLD_RULES, OPERATORS, RuleOutcome, ThresholdRule
 
 class EthicalContext(Fact):
     """Information about the ethical context."""
     pass
 
 class EthicalGovernorRules(KnowledgeEngine):
-    @Rule(EthicalContext(bias_reduction=P(lambda x: x > 0.7), fairness_score=P(lambda x: x > 0.8)))
-    def increase_human_centric_weight(self):
-        print("Rule triggered: Increase human_centric weight")
-        self.declare(Fact(human_centric_weight=1.1))
-
-    @Rule(EthicalContext(sentient_welfare=P(lambda x: x < 0.5)))
-    def decrease_sentient_first_weight(self):
-        print("Rule triggered: Decrease sentient_first weight")
-        self.declare(Fact(sentient_first_weight=0.9))
-
-    # New Rule: Increase equity_focused weight if equity_score is high
-    @Rule(EthicalContext(equity_score=P(lambda x: x > 0.8)))
-    def increase_equity_focused_weight(self):
-        print("Rule triggered: Increase equity_focused weight")
-        self.declare(Fact(equity_focused_weight=1.2))
-
-    # New Rule: Decrease innovation_focused weight if financial_risk is high
-    @Rule(EthicalContext(financial_risk=P(lambda x: x > 0.7)))
-    def decrease_innovation_focused_weight(self):
-        print("Rule triggered: Decrease innovation_focused weight")
-        self.declare(Fact(innovation_focused_weight=0.8))
-
-    # New Rule: Increase ecocentric weight if carbon_footprint is low
-    @Rule(EthicalContext(carbon_footprint=P(lambda x: x < 0.3)))
-    def increase_ecocentric_weight(self):
-        print("Rule triggered: Increase ecocentric weight")
-        self.declare(Fact(ecocentric_weight=1.2))
-
-    # Add more rules for other prisms as needed 
\ No newline at end of file
+    """
+    experta backend for the governor rules.
+
+    The threshold rules are generated from THRESHOLD_RULES in compiled_rules.py,
+    which CompiledRuleEngine evaluates without Rete. Subclass this engine to add
+    rules that are too complex to express as thresholds.
+    """
+
+    def reset(self, **kwargs):
+        self.fired_rules = []
+        super().reset(**kwargs)
+
+    def evaluate(self, input_data) -> RuleOutcome:
+        """
+        Run the rules against one input and collect what they declared.
+
+        Args:
+            input_data (dict): The input facts.
+
+        Returns:
+            RuleOutcome: The fired rules and the weight facts they declared.
+        """
+        self.reset()
+        self.declare(EthicalContext(**input_data))
+        self.run()
+
+        facts = {}
+        for fact in self.facts.values():
+            if type(fact) is Fact:
+                facts.update(fact.as_dict())
+        order = {rule.name: i for i, rule in enumerate(THRESHOLD_RULES)}
+        fired = sorted(self.fired_rules, key=lambda name: order.get(name, len(order)))
+        return RuleOutcome(tuple(fired), facts)
+
+def _threshold_rule(rule: ThresholdRule):
+    conditions = {
+        field: P(lambda x, compare=OPERATORS[op], threshold=threshold: compare(x, threshold))
+        for field, op, threshold in rule.conditions
+    }
+
+    @Rule(EthicalContext(**conditions))
+    def fire(self):
+        print(f"Rule triggered: {rule.description}")
+        self.fired_rules.append(rule.name)
+        self.declare(Fact(**dict([rule.fact])))
+
+    return fire
+
+for _rule in THRESHOLD_RULES:
+    setattr(EthicalGovernorRules, _rule.name, _threshold_rule(_rule))
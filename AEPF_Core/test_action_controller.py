@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+
+from action_controller import InMemoryHostAIController, QueuedActionDispatcher
+
+def report(i: int) -> dict:
+    return {"summary": {"final_score": i / 10}}
+
+class BlockingHost(InMemoryHostAIController):
+    """Host whose calls wait until released, to hold reports in the queue."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def apply_decisions(self, decision_reports):
+        self.release.wait(5)
+        super().apply_decisions(decision_reports)
+
+class TestQueuedActionDispatcher(unittest.TestCase):
+    def make_dispatcher(self, host, **kwargs):
+        dispatcher = QueuedActionDispatcher(host, **kwargs)
+        self.addCleanup(dispatcher.close, 5)
+        return dispatcher
+
+    def test_apply_decision_does_not_wait_for_host(self):
+        host = InMemoryHostAIController(latency=0.2)
+        dispatcher = self.make_dispatcher(host)
+        start = time.monotonic()
+        dispatcher.apply_decision(report(1))
+        self.assertLess(time.monotonic() - start, 0.05)
+        self.assertTrue(dispatcher.flush(timeout=2))
+        self.assertEqual(host.applied, [report(1)])
+
+    def test_queued_reports_are_coalesced_in_order(self):
+        host = BlockingHost()
+        dispatcher = self.make_dispatcher(host, batch_size=4)
+        dispatcher.apply_decision(report(0))
+        while dispatcher.metrics()["queue_depth"]:
+            time.sleep(0.005)
+        for i in range(1, 9):
+            dispatcher.apply_decision(report(i))
+        host.release.set()
+        self.assertTrue(dispatcher.flush(timeout=2))
+        self.assertEqual(host.applied, [report(i) for i in range(9)])
+        # Report 0 is in flight alone; the eight queued behind it go out in batches of 4
+        self.assertEqual([len(batch) for batch in host.batches], [1, 4, 4])
+        self.assertEqual(dispatcher.metrics()["batches"], 3)
+
+    def test_failed_host_calls_are_retried(self):
+        host = InMemoryHostAIController(fail_times=2)
+        dispatcher = self.make_dispatcher(host, backoff_base=0.01)
+        dispatcher.apply_decision(report(1))
+        self.assertTrue(dispatcher.flush(timeout=2))
+        self.assertEqual(host.applied, [report(1)])
+        metrics = dispatcher.metrics()
+        self.assertEqual((metrics["retries"], metrics["failed"], metrics["dispatched"]), (2, 0, 1))
+
+    def test_batch_is_given_up_after_max_retries(self):
+        failures = []
+        host = InMemoryHostAIController(fail_times=10)
+        dispatcher = self.make_dispatcher(host, max_retries=1, backoff_base=0.01,
+                                          on_failure=lambda reports, error: failures.append(reports))
+        dispatcher.apply_decision(report(1))
+        self.assertTrue(dispatcher.flush(timeout=2))
+        self.assertEqual(failures, [[report(1)]])
+        self.assertEqual(dispatcher.metrics()["failed"], 1)
+
+    def test_overflow_policies(self):
+        for policy, expected in (("drop_newest", [0, 1, 2]), ("drop_oldest", [0, 3, 4])):
+            with self.subTest(policy=policy):
+                host = BlockingHost()
+                dispatcher = self.make_dispatcher(host, max_queue_size=2, batch_size=1, overflow=policy)
+                dispatcher.apply_decision(report(0))
+                # Wait for the worker to take report 0 so the queue holds exactly two
+                while dispatcher.metrics()["queue_depth"]:
+                    time.sleep(0.005)
+                accepted = [dispatcher.apply_decision(report(i)) for i in range(1, 5)]
+                host.release.set()
+                self.assertTrue(dispatcher.flush(timeout=2))
+                self.assertEqual(host.applied, [report(i) for i in expected])
+                self.assertEqual(dispatcher.metrics()["dropped"], 2)
+                if policy == "drop_newest":
+                    self.assertEqual(accepted, [True, True, False, False])
+
+    def test_block_policy_times_out(self):
+        host = BlockingHost()
+        dispatcher = self.make_dispatcher(host, max_queue_size=1, batch_size=1, block_timeout=0.05)
+        dispatcher.apply_decision(report(0))
+        while dispatcher.metrics()["queue_depth"]:
+            time.sleep(0.005)
+        self.assertTrue(dispatcher.apply_decision(report(1)))
+        self.assertFalse(dispatcher.apply_decision(report(2)))
+        host.release.set()
+
+    def test_metrics_report_latency_and_depth(self):
+        host = InMemoryHostAIController()
+        dispatcher = self.make_dispatcher(host)
+        for i in range(3):
+            dispatcher.apply_decision(report(i))
+        dispatcher.flush(timeout=2)
+        metrics = dispatcher.metrics()
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertEqual(metrics["enqueued"], 3)
+        self.assertGreaterEqual(metrics["latency_max"], metrics["latency_mean"])
+
+    def test_unknown_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            QueuedActionDispatcher(InMemoryHostAIController(), overflow="spill")
+
+if __name__ == '__main__':
+    unittest.main()
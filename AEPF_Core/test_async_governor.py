@@ -0,0 +1,111 @@
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+from async_governor import AsyncEthicalGovernor
+from ethical_governor import EthicalGovernor
+from history_store import SQLiteHistoryStore
+from ethical_prisms.ethical_prism_agent import EthicalPrismAgent
+from ethical_prisms.ecocentric import EcocentricPrism
+from ethical_prisms.innovation_focused import InnovationFocusedPrism
+
+class AsyncPrism(EthicalPrismAgent):
+    """A plugin backed by an async scoring service."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+
+    def evaluate(self, input_data):
+        return {"score": 0.4, "metrics": {}}
+
+    async def evaluate_async(self, input_data):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(self.delay)
+        self.active -= 1
+        return self.evaluate(input_data)
+
+class RecordingController:
+    def __init__(self):
+        self.reports = []
+
+    async def apply_decision(self, report):
+        self.reports.append(report)
+
+class SyncRecordingController:
+    def __init__(self):
+        self.reports = []
+
+    def apply_decision(self, report):
+        self.reports.append(report)
+
+INPUT = {
+    "environmental_impact": 0.5,
+    "biodiversity_preservation": 0.6,
+    "carbon_neutrality": 0.7,
+    "water_conservation": 0.8,
+    "renewable_resource_use": 0.9,
+    "financial_risk": 0.3,
+    "reputational_risk": 0.2,
+    "technological_risk": 0.4,
+    "economic_benefit": 0.7,
+    "societal_benefit": 0.6,
+}
+
+class TestAsyncEthicalGovernor(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_store = SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db")
+        self.controller = RecordingController()
+        self.async_prism = AsyncPrism()
+        self.governor = EthicalGovernor(history_store=self.history_store, action_controller=self.controller)
+        self.governor.plugin_manager.plugins = [EcocentricPrism(), self.async_prism, InnovationFocusedPrism()]
+        self.async_governor = AsyncEthicalGovernor(self.governor, max_concurrency=2)
+
+    async def asyncTearDown(self):
+        await self.async_governor.close()
+        self.tmp_dir.cleanup()
+
+    async def test_report_matches_sync_governor(self):
+        report = await self.async_governor.evaluate(INPUT)
+        self.assertEqual(list(report["full_report"]["prism_results"]),
+                         ["EcocentricPrism", "AsyncPrism", "InnovationFocusedPrism"])
+
+        sync_store = SQLiteHistoryStore(Path(self.tmp_dir.name) / "sync_history.db")
+        sync_controller = SyncRecordingController()
+        sync_governor = EthicalGovernor(history_store=sync_store, action_controller=sync_controller)
+        sync_governor.plugin_manager.plugins = self.governor.plugin_manager.plugins
+        try:
+            self.assertEqual(report, sync_governor.evaluate(INPUT))
+            self.assertEqual(sync_controller.reports, [report])
+        finally:
+            sync_governor.close()
+
+    def test_sync_governor_refuses_async_controller(self):
+        with self.assertLogs(self.governor.logger, level="ERROR"):
+            self.governor.evaluate(INPUT)
+        self.assertEqual(self.controller.reports, [])
+
+    async def test_history_and_decisions_are_handled_in_background(self):
+        reports = await self.async_governor.evaluate_many([INPUT] * 5)
+        await self.async_governor.flush()
+        self.assertEqual(len(self.history_store), 5)
+        self.assertEqual(len(self.governor.decision_history), 5)
+        self.assertEqual(self.controller.reports, reports)
+
+    async def test_concurrency_is_limited(self):
+        await self.async_governor.evaluate_many([INPUT] * 6)
+        self.assertEqual(self.async_prism.max_active, 2)
+
+    async def test_async_plugin_timeout_is_reported(self):
+        self.governor.prism_executor.timeout = 0.05
+        self.async_prism.delay = 1.0
+        report = await self.async_governor.evaluate(INPUT)
+        self.assertNotIn("AsyncPrism", report["full_report"]["prism_results"])
+        self.assertTrue(report["full_report"]["prism_errors"]["AsyncPrism"].startswith("TimeoutError"))
+
+if __name__ == '__main__':
+    unittest.main()
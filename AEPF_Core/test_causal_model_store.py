@@ -0,0 +1,108 @@
+import json
+import pickle
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+from pgmpy.models import BayesianNetwork
+from pgmpy.inference import VariableElimination
+from pgmpy.factors.discrete import TabularCPD
+
+from causal_model_store import (
+    FORMAT_VERSION, CausalModelSpec, load_causal_model, migrate_pickle_model, save_causal_model
+)
+from ethical_governor import EthicalGovernor
+from history_store import SQLiteHistoryStore
+
+def make_model() -> BayesianNetwork:
+    model = BayesianNetwork([('prism1', 'final_score'), ('prism2', 'final_score')])
+    model.add_cpds(
+        TabularCPD('prism1', 2, [[0.6], [0.4]], state_names={'prism1': ['low', 'high']}),
+        TabularCPD('prism2', 2, [[0.7], [0.3]]),
+        TabularCPD(
+            'final_score', 2, [[0.9, 0.6, 0.5, 0.2], [0.1, 0.4, 0.5, 0.8]],
+            evidence=['prism1', 'prism2'], evidence_card=[2, 2],
+            state_names={'final_score': [0, 1], 'prism1': ['low', 'high'], 'prism2': [0, 1]}
+        ),
+    )
+    model.check_model()
+    return model
+
+class TestCausalModelStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.model_dir = Path(self.tmp_dir.name) / "causal_model"
+        self.model = make_model()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip_preserves_inference(self):
+        save_causal_model(self.model, self.model_dir)
+        restored = load_causal_model(self.model_dir).to_model()
+        self.assertEqual(set(restored.edges()), set(self.model.edges()))
+        evidence = {'prism1': 'high'}
+        expected = VariableElimination(self.model).query(['final_score'], evidence=evidence, show_progress=False)
+        actual = VariableElimination(restored).query(['final_score'], evidence=evidence, show_progress=False)
+        np.testing.assert_allclose(actual.values, expected.values)
+
+    def test_manifest_is_versioned_json(self):
+        manifest_path = save_causal_model(CausalModelSpec.from_model(self.model), self.model_dir)
+        manifest = json.loads(manifest_path.read_text())
+        self.assertEqual(manifest["version"], FORMAT_VERSION)
+        self.assertIn(["prism1", "final_score"], manifest["edges"])
+
+    def test_manifest_is_the_commit_point(self):
+        first = json.loads(save_causal_model(self.model, self.model_dir).read_text())["arrays"]
+        spec = CausalModelSpec.from_model(self.model)
+        spec.cpds[0].values = np.array([[0.1], [0.9]])
+        second = json.loads(save_causal_model(spec, self.model_dir).read_text())["arrays"]
+        self.assertNotEqual(first, second)
+        # A reader that read the previous manifest can still open its arrays
+        self.assertTrue((self.model_dir / first).exists())
+        np.testing.assert_allclose(load_causal_model(self.model_dir).cpds[0].values, [[0.1], [0.9]])
+
+        save_causal_model(self.model, self.model_dir)
+        self.assertFalse((self.model_dir / first).exists())
+        self.assertEqual(len(list(self.model_dir.glob("cpds*.npz"))), 2)
+
+    def test_newer_format_version_is_rejected(self):
+        manifest_path = save_causal_model(self.model, self.model_dir)
+        manifest = json.loads(manifest_path.read_text())
+        manifest["version"] = FORMAT_VERSION + 1
+        manifest_path.write_text(json.dumps(manifest))
+        with self.assertRaises(ValueError):
+            load_causal_model(self.model_dir)
+
+    def test_migrate_pickle_model(self):
+        pickle_path = Path(self.tmp_dir.name) / "causal_model.pkl"
+        with open(pickle_path, "wb") as f:
+            pickle.dump(self.model, f)
+        self.assertIsNotNone(migrate_pickle_model(pickle_path, self.model_dir))
+        self.assertEqual(len(load_causal_model(self.model_dir).cpds), 3)
+
+class TestGovernorLazyCausalModel(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_store = SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db")
+        self.governor = EthicalGovernor(history_store=self.history_store)
+        self.governor.causal_model_dir = Path(self.tmp_dir.name) / "causal_model"
+        save_causal_model(make_model(), self.governor.causal_model_dir)
+
+    def tearDown(self):
+        self.history_store.close()
+        self.tmp_dir.cleanup()
+
+    def test_model_is_loaded_on_first_query(self):
+        self.assertIsNone(self.governor.inference)
+        prediction = self.governor.predict_causal_impact({'prism1': 'high', 'prism2': 1})
+        self.assertIsNotNone(self.governor.inference)
+        np.testing.assert_allclose(prediction, [0.2, 0.8])
+
+    def test_load_causal_model_prefers_versioned_format(self):
+        model = self.governor.load_causal_model()
+        self.assertEqual(set(model.nodes()), {'prism1', 'prism2', 'final_score'})
+
+if __name__ == '__main__':
+    unittest.main()
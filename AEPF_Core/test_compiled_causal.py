@@ -0,0 +1,95 @@
+import itertools
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+from pgmpy.models import BayesianNetwork
+from pgmpy.inference import VariableElimination
+from pgmpy.factors.discrete import TabularCPD
+
+from compiled_causal import CompiledCausalTable
+from ethical_governor import EthicalGovernor
+from history_store import SQLiteHistoryStore
+
+PARENTS = ['human_centric', 'sentient_first', 'ecocentric', 'innovation_focused', 'equity_focused']
+
+def random_distribution(rng: np.random.Generator, card: int, columns: int) -> np.ndarray:
+    values = rng.random((card, columns))
+    return values / values.sum(axis=0)
+
+def make_model(seed: int = 0) -> BayesianNetwork:
+    rng = np.random.default_rng(seed)
+    cards = [2, 3, 2, 2, 3]
+    model = BayesianNetwork([(parent, 'final_score') for parent in PARENTS])
+    for parent, card in zip(PARENTS, cards):
+        model.add_cpds(TabularCPD(parent, card, random_distribution(rng, card, 1)))
+    model.add_cpds(TabularCPD(
+        'final_score', 3, random_distribution(rng, 3, int(np.prod(cards))),
+        evidence=PARENTS, evidence_card=cards
+    ))
+    model.check_model()
+    return model
+
+class TestCompiledCausalTable(unittest.TestCase):
+    def setUp(self):
+        self.model = make_model()
+        self.table = CompiledCausalTable.compile(self.model, 'final_score')
+        self.inference = VariableElimination(self.model)
+
+    def test_matches_variable_elimination_for_every_evidence_subset(self):
+        cards = {parent: self.model.get_cardinality(parent) for parent in PARENTS}
+        for size in range(len(PARENTS) + 1):
+            for observed in itertools.combinations(PARENTS, size):
+                for states in itertools.product(*(range(cards[p]) for p in observed)):
+                    evidence = dict(zip(observed, states))
+                    expected = self.inference.query(['final_score'], evidence=evidence, show_progress=False).values
+                    np.testing.assert_allclose(self.table.query(evidence), expected, atol=1e-12)
+
+    def test_supports_only_known_parent_states(self):
+        self.assertTrue(self.table.supports({'human_centric': 1}))
+        self.assertFalse(self.table.supports({'human_centric': 5}))
+        self.assertFalse(self.table.supports({'final_score': 0}))
+        self.assertFalse(self.table.supports({'unknown': 0}))
+        self.assertFalse(self.table.supports({'human_centric': {'score': 1}}))
+
+    def test_non_root_parents_are_not_compiled(self):
+        model = BayesianNetwork([('a', 'b'), ('b', 'final_score')])
+        model.add_cpds(
+            TabularCPD('a', 2, [[0.5], [0.5]]),
+            TabularCPD('b', 2, [[0.9, 0.2], [0.1, 0.8]], evidence=['a'], evidence_card=[2]),
+            TabularCPD('final_score', 2, [[0.3, 0.6], [0.7, 0.4]], evidence=['b'], evidence_card=[2]),
+        )
+        self.assertIsNone(CompiledCausalTable.compile(model, 'final_score'))
+
+class TestGovernorCompiledInference(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_store = SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db")
+        self.model = make_model()
+        self.governor = EthicalGovernor(
+            [(parent, 'final_score') for parent in PARENTS], history_store=self.history_store
+        )
+        self.governor.update_causal_model({cpd.variable: cpd for cpd in self.model.get_cpds()})
+
+    def tearDown(self):
+        self.history_store.close()
+        self.tmp_dir.cleanup()
+
+    def test_compiled_table_replaces_variable_elimination(self):
+        self.assertIsNotNone(self.governor.compiled_causal)
+        evidence = {'human_centric': 1, 'equity_focused': 2}
+        with mock.patch.object(self.governor.inference, 'query') as query:
+            prediction = self.governor.predict_causal_impact(evidence)
+            query.assert_not_called()
+        expected = VariableElimination(self.model).query(['final_score'], evidence=evidence, show_progress=False).values
+        np.testing.assert_allclose(prediction, expected, atol=1e-12)
+
+    def test_unsupported_evidence_falls_back_to_variable_elimination(self):
+        with mock.patch.object(self.governor.inference, 'query', side_effect=ValueError("bad evidence")) as query:
+            self.assertEqual(self.governor.predict_causal_impact({'human_centric': 0.5}), {})
+            query.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import random
+import unittest
+
+from compiled_rules import CompiledRuleEngine, RuleOutcome, ThresholdRule, THRESHOLD_RULES
+from rule_engine import EthicalGovernorRules
+
+class TestCompiledRuleEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = CompiledRuleEngine()
+        rng = random.Random(7)
+        self.inputs = [
+            {field: round(rng.random(), 2) for field in self.engine.fields if rng.random() < 0.8}
+            for _ in range(200)
+        ]
+
+    def test_matches_experta_backend(self):
+        experta_engine = EthicalGovernorRules()
+        for input_data in self.inputs:
+            with self.subTest(input_data=input_data):
+                self.assertEqual(self.engine.evaluate(input_data), experta_engine.evaluate(input_data))
+
+    def test_batch_matches_row_evaluation(self):
+        self.assertEqual(
+            self.engine.evaluate_batch(self.inputs),
+            [self.engine.evaluate(input_data) for input_data in self.inputs]
+        )
+
+    def test_fired_rules_and_facts(self):
+        outcome = self.engine.evaluate({
+            "bias_reduction": 0.75,
+            "fairness_score": 0.85,
+            "sentient_welfare": 0.4,
+            "carbon_footprint": 0.5
+        })
+        self.assertEqual(outcome.fired, ("increase_human_centric_weight", "decrease_sentient_first_weight"))
+        self.assertEqual(outcome.facts, {"human_centric_weight": 1.1, "sentient_first_weight": 0.9})
+
+    def test_missing_and_non_numeric_fields_never_fire(self):
+        inputs = [{}, {"equity_score": "high"}, {"equity_score": {"value": 0.9}}]
+        self.assertEqual(self.engine.evaluate_batch(inputs), [RuleOutcome()] * 3)
+
+    def test_fired_matrix_shape(self):
+        matrix = self.engine.fired_matrix(self.inputs)
+        self.assertEqual(matrix.shape, (len(self.inputs), len(THRESHOLD_RULES)))
+        self.assertEqual(self.engine.fired_matrix([]).shape, (0, len(THRESHOLD_RULES)))
+
+    def test_unsupported_operator_raises(self):
+        with self.assertRaises(ValueError):
+            CompiledRuleEngine([ThresholdRule("bad", (("risk", "!=", 0.5),), ("risk_weight", 1.0))])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from Context_manager import ContextEngine, ScenarioTemplate
+
+def reference_detect(engine, parameters):
+    """Reference: the per-template scan the index replaces."""
+    scores = {
+        name: sum(1 for param, threshold in template.detection_thresholds.items()
+                  if parameters.get(param, 0) >= threshold) / len(template.detection_thresholds)
+        for name, template in engine.scenario_templates.items()
+    }
+    best = max(scores.items(), key=lambda x: x[1])
+    if best[1] >= 0.7:
+        template = engine.scenario_templates[best[0]]
+        return template.name, template.weight_adjustments
+    return None, {key: 1.0 for key in engine.scenario_templates['high_risk'].weight_adjustments}
+
+def make_template(i, params):
+    return ScenarioTemplate(
+        name=f"custom_{i}",
+        description="Generated scenario",
+        weight_adjustments={'human_centric': 1.0 + i / 1000},
+        detection_thresholds={param: 0.5 + (i % 5) / 10 for param in params}
+    )
+
+class TestScenarioIndex(unittest.TestCase):
+    def setUp(self):
+        self.engine = ContextEngine()
+        rng = np.random.default_rng(0)
+        params = list(self.engine.scenario_index.params)
+        self.inputs = [
+            {param: float(value) for param, value in zip(params, rng.random(len(params))) if value > 0.2}
+            for _ in range(300)
+        ]
+        self.inputs.append({'risk_level': 0.9, 'impact_severity': 0.8, 'region': 'EU'})
+
+    def test_detection_matches_template_scan(self):
+        for parameters in self.inputs:
+            self.assertEqual(self.engine.detect_scenario(parameters), reference_detect(self.engine, parameters))
+
+    def test_batch_matches_single_detection(self):
+        expected = [self.engine.detect_scenario(parameters) for parameters in self.inputs]
+        self.assertEqual(self.engine.detect_scenarios(self.inputs), expected)
+        self.assertEqual(self.engine.detect_scenarios(pd.DataFrame(self.inputs)), expected)
+        self.assertEqual(self.engine.detect_scenarios([]), [])
+
+    def test_string_values_match_single_detection(self):
+        inputs = [
+            {param: "0.9" for param in self.engine.scenario_index.params},
+            {'risk_level': "0.9", 'impact_severity': 0.8},
+            {'risk_level': 0.9, 'impact_severity': None},
+            {'human_impact': 0.9, 'social_significance': 0.8, 'region': 'EU'},
+        ]
+        expected = [self.engine.detect_scenario(parameters) for parameters in inputs]
+        self.assertEqual(expected[0], (None, self.engine.scenario_index.neutral_adjustments))
+        self.assertEqual(self.engine.detect_scenarios(inputs), expected)
+        self.assertEqual(self.engine.detect_scenarios(inputs[:1]), expected[:1])
+        self.assertEqual(self.engine.detect_scenarios(pd.DataFrame(inputs[:2])), expected[:2])
+
+    def test_sequence_values_match_single_detection(self):
+        inputs = [
+            {'risk_level': [1], 'impact_severity': 0.8, 'human_impact': 0.9, 'social_significance': 0.9},
+            {'risk_level': 0.9, 'impact_severity': 0.8},
+            {'risk_level': (0.9, 0.9), 'impact_severity': {'value': 0.8}},
+        ]
+        expected = [self.engine.detect_scenario(parameters) for parameters in inputs]
+        self.assertEqual(expected[0][0], 'human_centered')
+        self.assertEqual(self.engine.detect_scenarios(inputs), expected)
+        same_length = [{'risk_level': [1, 1], 'impact_severity': [1, 1]}] * 2
+        self.assertEqual(self.engine.detect_scenarios(same_length),
+                         [self.engine.detect_scenario(parameters) for parameters in same_length])
+        columns = {'risk_level': [[1], 0.9], 'impact_severity': [0.8, 0.8]}
+        self.assertEqual(self.engine.detect_scenarios(columns), [
+            self.engine.detect_scenario({'risk_level': [1], 'impact_severity': 0.8}),
+            self.engine.detect_scenario({'risk_level': 0.9, 'impact_severity': 0.8}),
+        ])
+
+    def test_index_rebuilds_when_templates_change(self):
+        parameters = {'crowd_density': 0.95}
+        self.assertIsNone(self.engine.detect_scenario(parameters)[0])
+        self.engine.scenario_templates['crowded'] = ScenarioTemplate(
+            "crowded", "Dense crowds", {'human_centric': 1.4}, {'crowd_density': 0.9}
+        )
+        self.assertEqual(self.engine.detect_scenario(parameters), ("crowded", {'human_centric': 1.4}))
+        del self.engine.scenario_templates['crowded']
+        self.assertIsNone(self.engine.detect_scenario(parameters)[0])
+
+    def test_many_custom_templates(self):
+        params = [f"signal_{j}" for j in range(40)]
+        for i in range(300):
+            template = make_template(i, params[i % 37: i % 37 + 3])
+            self.engine.scenario_templates[template.name] = template
+        rng = np.random.default_rng(1)
+        inputs = [dict(zip(params, rng.random(len(params)).tolist())) for _ in range(50)]
+        self.assertEqual(self.engine.detect_scenarios(inputs),
+                         [reference_detect(self.engine, parameters) for parameters in inputs])
+
+    def test_confidence_uses_indexed_parameters(self):
+        result = self.engine.analyze_context({'risk_level': 0.9, 'impact_severity': 0.7, 'note': 'text'})
+        self.assertEqual(result['detected_scenario'], 'high_risk')
+        self.assertEqual(result['analysis_confidence'], round((2 / 6 + 0.8) / 2, 2))
+
+if __name__ == '__main__':
+    unittest.main()
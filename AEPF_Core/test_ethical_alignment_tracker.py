@@ -0,0 +1,91 @@
+import unittest
+from collections import Counter
+from itertools import combinations
+
+from ethical_alignment_tracker import EthicalAlignmentTracker
+
+AGREE = {"ecocentric": 0.8, "equity_focused": 0.75, "human_centric": 0.2}
+SPLIT = {"ecocentric": 0.9, "equity_focused": 0.1, "human_centric": 0.5}
+
+def rescanned_counts(history, status):
+    """Reference: recount the whole window from scratch."""
+    return Counter(pair for entry in history for pair in entry["patterns"][status])
+
+class TestEthicalAlignmentTracker(unittest.TestCase):
+    def test_pairs_are_classified(self):
+        patterns = EthicalAlignmentTracker().classify(AGREE)
+        self.assertEqual(patterns["harmonious"], [("ecocentric", "equity_focused")])
+        self.assertEqual(sorted(patterns["conflicted"]), [
+            ("ecocentric", "human_centric"), ("equity_focused", "human_centric")
+        ])
+
+    def test_report_results_are_accepted(self):
+        tracker = EthicalAlignmentTracker()
+        tracker.record_decision({name: {"score": score, "metrics": {}} for name, score in AGREE.items()})
+        self.assertEqual(tracker.pair_counts("harmonious"), {("ecocentric", "equity_focused"): 1.0})
+
+    def test_recurring_patterns(self):
+        tracker = EthicalAlignmentTracker()
+        tracker.record_decision(AGREE)
+        self.assertEqual(tracker.get_recurring_patterns(), {"harmonious": [], "conflicted": []})
+        tracker.record_decision(AGREE)
+        recurring = tracker.get_recurring_patterns()
+        self.assertEqual(recurring["harmonious"], [("ecocentric", "equity_focused")])
+        self.assertEqual(len(recurring["conflicted"]), 2)
+
+    def test_sliding_window_matches_rescan(self):
+        tracker = EthicalAlignmentTracker(window=5)
+        for i in range(23):
+            tracker.record_decision(AGREE if i % 3 else SPLIT)
+            for status in ("harmonious", "conflicted"):
+                self.assertEqual(tracker.pair_counts(status),
+                                 dict(rescanned_counts(tracker.get_alignment_history(), status)))
+        self.assertEqual(len(tracker.get_alignment_history()), 5)
+        self.assertEqual(tracker.decisions, 23)
+
+    def test_decayed_window_matches_direct_sum(self):
+        decay = 0.9
+        tracker = EthicalAlignmentTracker(window=10, decay=decay)
+        decisions = [AGREE if i % 4 else SPLIT for i in range(50)]
+        for decision in decisions:
+            tracker.record_decision(decision)
+
+        expected = Counter()
+        for age, decision in enumerate(reversed(decisions)):
+            for pair in tracker.classify(decision)["conflicted"]:
+                expected[pair] += decay ** age
+        counts = tracker.pair_counts("conflicted")
+        self.assertEqual(set(counts), set(expected))
+        for pair, weight in expected.items():
+            self.assertAlmostEqual(counts[pair], weight)
+
+    def test_decayed_counts_survive_long_runs(self):
+        tracker = EthicalAlignmentTracker(window=3, decay=0.5)
+        for _ in range(2000):
+            tracker.record_decision(AGREE)
+        # Geometric series: 1 + 0.5 + 0.25 + ... = 2
+        self.assertAlmostEqual(tracker.pair_counts("harmonious")[("ecocentric", "equity_focused")], 2.0)
+
+    def test_evaluate_alignment(self):
+        tracker = EthicalAlignmentTracker()
+        self.assertEqual(tracker.evaluate_alignment(), 1.0)
+        tracker.record_decision(AGREE)
+        self.assertAlmostEqual(tracker.evaluate_alignment(), 1 / 3)
+
+    def test_alignment_patterns_lists_window(self):
+        tracker = EthicalAlignmentTracker(window=2)
+        for _ in range(3):
+            tracker.record_decision(SPLIT)
+        pairs = list(combinations(sorted(SPLIT), 2))
+        self.assertEqual(len(tracker.alignment_patterns["conflicted"]), 2 * len(
+            [pair for pair in pairs if pair in tracker.pair_counts("conflicted")]
+        ))
+
+    def test_invalid_configuration_is_rejected(self):
+        with self.assertRaises(ValueError):
+            EthicalAlignmentTracker(window=0)
+        with self.assertRaises(ValueError):
+            EthicalAlignmentTracker(decay=1.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,9 @@
 import sys
 import os
+import tempfile
 import unittest
+from unittest import mock
+from pathlib import Path
 import pandas as pd
 from pgmpy.factors.discrete import TabularCPD
 
@@ -9,6 +12,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import logging
 from ethical_governor import EthicalGovernor
+from history_store import SQLiteHistoryStore
+from weight_checkpoints import WeightCheckpointStore
+from ethical_prisms.ecocentric import EcocentricPrism
+from ethical_prisms.innovation_focused import InnovationFocusedPrism
 
 # Set up logging to print to console
 logging.basicConfig(level=logging.INFO)
@@ -112,6 +119,226 @@ class TestEthicalGovernor(unittest.TestCase):
         # Since adjust_weights is a placeholder, we just ensure no exceptions are raised
         self.assertTrue(True)
 
+class TestCausalQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_store = SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db")
+        self.governor = EthicalGovernor(
+            [('prism1', 'final_score'), ('prism2', 'final_score')],
+            history_store=self.history_store
+        )
+        self.governor.update_causal_model(self.make_cpds(0.9))
+
+    def tearDown(self):
+        self.history_store.close()
+        self.tmp_dir.cleanup()
+
+    @staticmethod
+    def make_cpds(high_score: float) -> dict:
+        return {
+            'prism1': TabularCPD(variable='prism1', variable_card=2, values=[[0.6], [0.4]]),
+            'prism2': TabularCPD(variable='prism2', variable_card=2, values=[[0.7], [0.3]]),
+            'final_score': TabularCPD(
+                variable='final_score',
+                variable_card=2,
+                values=[[0.5, 0.5, 0.5, 1 - high_score],
+                        [0.5, 0.5, 0.5, high_score]],
+                evidence=['prism1', 'prism2'],
+                evidence_card=[2, 2]
+            )
+        }
+
+    def test_repeated_evidence_is_served_from_cache(self):
+        first = self.governor.predict_causal_impact({'prism1': 1, 'prism2': 1})
+        second = self.governor.predict_causal_impact({'prism2': 1, 'prism1': 1})
+        self.assertEqual(list(first), list(second))
+        stats = self.governor.causal_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+
+    def test_cached_result_cannot_be_mutated(self):
+        first = self.governor.predict_causal_impact({'prism1': 1, 'prism2': 1})
+        first[0] = -1
+        second = self.governor.predict_causal_impact({'prism1': 1, 'prism2': 1})
+        self.assertAlmostEqual(second[0], 0.1)
+
+    def test_update_causal_model_invalidates_cache(self):
+        before = self.governor.predict_causal_impact({'prism1': 1, 'prism2': 1})
+        self.governor.update_causal_model(self.make_cpds(0.2))
+        after = self.governor.predict_causal_impact({'prism1': 1, 'prism2': 1})
+        self.assertAlmostEqual(before[1], 0.9)
+        self.assertAlmostEqual(after[1], 0.2)
+
+    def test_query_finishing_after_model_update_does_not_cache_stale_result(self):
+        evidence = {'prism1': 1, 'prism2': 1}
+        old_table = self.governor.compiled_causal
+        old_query = old_table.query
+
+        def query_during_update(query_evidence):
+            result = old_query(query_evidence)
+            self.governor.update_causal_model(self.make_cpds(0.2))
+            return result
+
+        with mock.patch.object(old_table, 'query', side_effect=query_during_update):
+            in_flight = self.governor.predict_causal_impact(evidence)
+        self.assertAlmostEqual(in_flight[1], 0.9)
+        self.assertAlmostEqual(self.governor.predict_causal_impact(evidence)[1], 0.2)
+        self.assertEqual(self.governor.causal_cache_stats()['misses'], 2)
+
+    def test_failed_queries_are_not_cached(self):
+        self.assertEqual(self.governor.predict_causal_impact({'unknown': 1}), {})
+        self.assertEqual(self.governor.causal_cache_stats()['size'], 0)
+
+    def test_batch_groups_identical_evidence(self):
+        evidence = [{'prism1': 1, 'prism2': 1}, {'prism1': 0, 'prism2': 1}, {'prism2': 1, 'prism1': 1}]
+        predictions = self.governor.predict_causal_impact_batch(evidence)
+        self.assertEqual(len(predictions), 3)
+        self.assertEqual(list(predictions[0]), list(predictions[2]))
+        self.assertEqual(list(predictions[1]), list(self.governor.predict_causal_impact(evidence[1])))
+        # Two distinct evidence sets, each queried once
+        self.assertEqual(self.governor.causal_cache_stats()['misses'], 2)
+
+class TestEvaluateBatch(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_store = SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db")
+        self.governor = EthicalGovernor(history_store=self.history_store)
+        self.governor.plugin_manager.plugins = [EcocentricPrism(), InnovationFocusedPrism()]
+        self.inputs = [
+            {
+                "environmental_impact": 0.5 + i / 100,
+                "biodiversity_preservation": 0.6,
+                "carbon_neutrality": 0.7,
+                "water_conservation": 0.8,
+                "renewable_resource_use": 0.9,
+                "financial_risk": 0.1 * i,
+                "reputational_risk": 0.2,
+                "technological_risk": 0.4,
+                "economic_benefit": 0.7,
+                "societal_benefit": 0.6,
+                "sentient_welfare": 0.4,
+            }
+            for i in range(5)
+        ]
+
+    def tearDown(self):
+        self.history_store.close()
+        self.tmp_dir.cleanup()
+
+    def test_batch_matches_single_evaluation(self):
+        single_reports = [self.governor.evaluate(row) for row in self.inputs]
+        batch_reports = self.governor.evaluate_batch(self.inputs)
+        self.assertEqual(batch_reports, single_reports)
+
+    def test_batch_accepts_dataframe(self):
+        batch_reports = self.governor.evaluate_batch(pd.DataFrame(self.inputs))
+        self.assertEqual(batch_reports, self.governor.evaluate_batch(self.inputs))
+
+    def test_batch_persists_history_once(self):
+        writes = []
+        original_extend = self.history_store.extend
+        self.history_store.extend = lambda records: writes.append(1) or original_extend(records)
+        self.governor.evaluate_batch(self.inputs)
+        self.assertEqual(len(writes), 1)
+        self.assertEqual(len(self.history_store), len(self.inputs))
+        self.assertEqual(len(self.governor.decision_history), len(self.inputs))
+
+    def test_experta_backend_matches_compiled_backend(self):
+        experta_governor = EthicalGovernor(history_store=self.history_store, rule_backend="experta")
+        experta_governor.plugin_manager.plugins = self.governor.plugin_manager.plugins
+        self.assertEqual(experta_governor.evaluate_batch(self.inputs), self.governor.evaluate_batch(self.inputs))
+
+    def test_empty_batch(self):
+        self.assertEqual(self.governor.evaluate_batch([]), [])
+
+class TestRuleWeightAdjustments(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_store = SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db")
+        self.governor = EthicalGovernor(history_store=self.history_store)
+
+    def tearDown(self):
+        self.history_store.close()
+        self.tmp_dir.cleanup()
+
+    def expected_weights(self, multipliers):
+        weights = {k: v * multipliers.get(k, 1.0) for k, v in self.governor.base_weights.items()}
+        total = sum(weights.values())
+        return {k: v / total for k, v in weights.items()}
+
+    def test_adjust_weights_returns_multipliers(self):
+        multipliers = self.governor.adjust_weights({
+            'fact1': {'human_centric_weight': 1.1},
+            'fact2': {'sentient_first_weight': 0.9},
+            'fact3': 'invalid_fact'
+        })
+        self.assertEqual(multipliers, {'human_centric': 1.1, 'sentient_first': 0.9})
+
+    def test_rule_facts_are_applied(self):
+        report = self.governor.evaluate({"sentient_welfare": 0.4, "equity_score": 0.9})
+        weights = report["full_report"]["weight_adjustments"]
+        expected = self.expected_weights({'sentient_first': 0.9, 'equity_focused': 1.2})
+        for prism, weight in expected.items():
+            self.assertAlmostEqual(weights[prism], weight)
+
+    def test_scenario_adjustments_are_applied(self):
+        report = self.governor.evaluate({"risk_level": 0.9, "impact_severity": 0.8})
+        scenario_name, adjustments = report["summary"]["scenario"]
+        self.assertEqual(scenario_name, "high_risk")
+        expected = self.expected_weights(adjustments)
+        for prism, weight in expected.items():
+            self.assertAlmostEqual(report["full_report"]["weight_adjustments"][prism], weight)
+
+    def test_region_adjustments_are_applied(self):
+        base = self.governor.evaluate({})["full_report"]["weight_adjustments"]
+        regional = self.governor.evaluate({"region": "EU"})["full_report"]["weight_adjustments"]
+        self.assertGreater(regional['human_centric'], base['human_centric'])
+
+    def test_weights_are_memoized_per_combination(self):
+        first = self.governor.evaluate({"sentient_welfare": 0.4})["full_report"]["weight_adjustments"]
+        second = self.governor.evaluate({"sentient_welfare": 0.3})["full_report"]["weight_adjustments"]
+        self.governor.evaluate({"sentient_welfare": 0.9})
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.governor._weight_cache), 2)
+
+    def test_weights_hot_swap_from_checkpoint(self):
+        store = WeightCheckpointStore(Path(self.tmp_dir.name) / "weights")
+        self.assertFalse(self.governor.load_weights())
+        before = self.governor.evaluate({})["full_report"]["weight_adjustments"]
+        store.save_weights({prism: 0.2 for prism in self.governor.base_weights})
+
+        self.governor.weight_checkpoints = store
+        self.assertTrue(self.governor.load_weights())
+        self.assertEqual(len(self.governor._weight_cache), 0)
+        after = self.governor.evaluate({})["full_report"]["weight_adjustments"]
+        self.assertNotEqual(before, after)
+        for weight in after.values():
+            self.assertAlmostEqual(weight, 0.2)
+
+        restarted = EthicalGovernor(history_store=self.history_store, weight_checkpoints=store)
+        self.assertEqual(restarted.base_weights, self.governor.base_weights)
+
+    def test_checkpoint_with_other_keys_is_rejected(self):
+        store = WeightCheckpointStore(Path(self.tmp_dir.name) / "weights")
+        class_names = {
+            prism: ''.join(part.title() for part in prism.split('_')) + "Prism"
+            for prism in self.governor.base_weights
+        }
+        store.save_weights({name: 0.2 for name in class_names.values()})
+        self.governor.weight_checkpoints = store
+        before = self.governor.base_weights
+
+        with self.assertLogs(self.governor.logger, level="ERROR"):
+            self.assertFalse(self.governor.load_weights())
+        self.assertIs(self.governor.base_weights, before)
+
+        self.assertTrue(self.governor.load_weights(key_map={name: prism for prism, name in class_names.items()}))
+        self.assertEqual(self.governor.base_weights, {prism: 0.2 for prism in before})
+
+        store.save_weights({prism: 0.2 for prism in list(before)[1:]})
+        with self.assertLogs(self.governor.logger, level="ERROR"):
+            self.assertFalse(self.governor.load_weights())
+
 def test_ethical_governor():
     # Initialize the Ethical Governor
     eg = EthicalGovernor()
@@ -0,0 +1,116 @@
+import http.client
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from governor_server import GovernorService, create_server
+from ethical_governor import EthicalGovernor
+from history_store import SQLiteHistoryStore
+from ethical_prisms.ecocentric import EcocentricPrism
+
+INPUT = {
+    "environmental_impact": 0.5,
+    "biodiversity_preservation": 0.6,
+    "carbon_neutrality": 0.7,
+    "water_conservation": 0.8,
+    "renewable_resource_use": 0.9,
+}
+
+class TestGovernorServer(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        governor = EthicalGovernor(history_store=SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db"))
+        governor.plugin_manager.plugins = [EcocentricPrism()]
+        governor.plugin_manager.plugins_dir = os.path.join(self.tmp_dir.name, "plugins")
+        governor.causal_model_dir = Path(self.tmp_dir.name) / "causal_model"
+        self.service = GovernorService(governor)
+        self.server = create_server(self.service, port=0)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.service.governor.close()
+        self.tmp_dir.cleanup()
+
+    def request(self, method, path, body=None):
+        connection = http.client.HTTPConnection(*self.server.server_address, timeout=10)
+        try:
+            connection.request(method, path, body=None if body is None else json.dumps(body),
+                               headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def test_single_and_batch_evaluation(self):
+        status, body = self.request("POST", "/evaluate", {"input": INPUT})
+        self.assertEqual(status, 200)
+        self.assertIn("EcocentricPrism", body["report"]["full_report"]["prism_results"])
+
+        metrics = body["report"]["full_report"]["prism_results"]["EcocentricPrism"]["metrics"]
+        self.assertEqual(metrics["carbon_score"]["narrative"], "Carbon neutrality score: 0.7")
+
+        status, body = self.request("POST", "/evaluate", {"inputs": [INPUT, INPUT]})
+        self.assertEqual(status, 200)
+        self.assertEqual(len(body["reports"]), 2)
+        self.assertIn("narrative", body["reports"][1]["full_report"]["prism_results"]["EcocentricPrism"]
+                      ["metrics"]["water_score"])
+        self.assertEqual(body["reports"][0]["summary"]["final_score"],
+                         body["reports"][1]["summary"]["final_score"])
+
+    def test_bad_requests(self):
+        self.assertEqual(self.request("POST", "/evaluate", {"unexpected": 1})[0], 400)
+        self.assertEqual(self.request("GET", "/missing")[0], 404)
+
+    def test_metrics_separate_cold_and_warm_requests(self):
+        for _ in range(3):
+            self.request("POST", "/evaluate", {"input": INPUT})
+        status, metrics = self.request("GET", "/metrics")
+        self.assertEqual(status, 200)
+        self.assertIsNotNone(metrics["first_request_seconds"])
+        self.assertEqual(metrics["warm"]["evaluate"]["count"], 2)
+        self.assertGreater(metrics["cold_start_seconds"], 0)
+
+    def test_reload_keeps_serving(self):
+        status, body = self.request("POST", "/reload", {"plugins": True, "causal_model": True})
+        self.assertEqual(status, 200)
+        self.assertEqual(body, {"plugins": 0, "causal_model": False})
+        status, health = self.request("GET", "/health")
+        self.assertEqual((status, health["status"], health["plugins"]), (200, "ok", 0))
+
+class TestGovernorUnixServer(unittest.TestCase):
+    def test_evaluate_over_unix_socket(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            governor = EthicalGovernor(history_store=SQLiteHistoryStore(Path(tmp_dir) / "history.db"))
+            governor.plugin_manager.plugins = [EcocentricPrism()]
+            socket_path = os.path.join(tmp_dir, "governor.sock")
+            server = create_server(GovernorService(governor), unix_socket=socket_path)
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            try:
+                body = json.dumps({"input": INPUT}).encode()
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                    client.connect(socket_path)
+                    client.sendall(
+                        b"POST /evaluate HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                    )
+                    response = b""
+                    while chunk := client.recv(65536):
+                        response += chunk
+                self.assertTrue(response.startswith(b"HTTP/1.1 200"))
+                report = json.loads(response.split(b"\r\n\r\n", 1)[1])["report"]
+                self.assertIn("EcocentricPrism", report["full_report"]["prism_results"])
+            finally:
+                server.shutdown()
+                server.server_close()
+                governor.close()
+            self.assertFalse(os.path.exists(socket_path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import pickle
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+from history_store import SQLiteHistoryStore, import_pickle_history
+
+def make_record(timestamp: str, scenario, total_score: float) -> dict:
+    return {
+        'timestamp': timestamp,
+        'scenario': scenario,
+        'weights': {'human_centric': 1.0},
+        'prism_results': {},
+        'total_score': total_score
+    }
+
+class TestSQLiteHistoryStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmp_dir.name) / "history.db"
+        self.store = SQLiteHistoryStore(self.db_path, fetch_size=2)
+        self.records = [
+            make_record("20250101_120000", (None, {'human_centric': 1.0}), 0.1),
+            make_record("20250102_120000", ("high_risk", {'human_centric': 1.2}), 0.2),
+            make_record("20250103_120000", "synthetic_scenario", 0.3),
+            make_record("20250104_120000", ("high_risk", {'human_centric': 1.2}), 0.4),
+            make_record("20250105_120000", None, 0.5),
+        ]
+        self.store.extend(self.records)
+
+    def tearDown(self):
+        self.store.close()
+        self.tmp_dir.cleanup()
+
+    def test_round_trip_preserves_records(self):
+        self.assertEqual(len(self.store), 5)
+        self.assertEqual(list(self.store.iter_records()), self.records)
+
+    def test_filter_by_time_range(self):
+        records = list(self.store.iter_records(start="20250102_000000", end=datetime(2025, 1, 4, 12)))
+        self.assertEqual([r['total_score'] for r in records], [0.2, 0.3, 0.4])
+
+    def test_filter_by_scenario(self):
+        records = list(self.store.iter_records(scenario="high_risk"))
+        self.assertEqual([r['total_score'] for r in records], [0.2, 0.4])
+
+    def test_tail_returns_newest_records_oldest_first(self):
+        self.assertEqual([r['total_score'] for r in self.store.tail(2)], [0.4, 0.5])
+
+    def test_compact_keeps_newest_records(self):
+        removed = self.store.compact(keep_last=2)
+        self.assertEqual(removed, 3)
+        self.assertEqual([r['total_score'] for r in self.store.iter_records()], [0.4, 0.5])
+
+    def test_rotate_starts_empty_store(self):
+        archive = self.store.rotate()
+        self.assertTrue(archive.exists())
+        self.assertEqual(len(self.store), 0)
+        self.store.append(self.records[0])
+        self.assertEqual(len(self.store), 1)
+
+        archived = SQLiteHistoryStore(archive)
+        self.assertEqual(len(archived), 5)
+        archived.close()
+
+    def test_reopen_keeps_records(self):
+        self.store.close()
+        self.store = SQLiteHistoryStore(self.db_path)
+        self.assertEqual(list(self.store.iter_records()), self.records)
+
+class TestImportPickleHistory(unittest.TestCase):
+    def test_import_legacy_pickle(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pickle_path = os.path.join(tmp_dir, "ethical_governor_history.pkl")
+            records = [make_record("20250212_082132", None, 0.21)]
+            with open(pickle_path, "wb") as f:
+                pickle.dump(records, f)
+
+            store = SQLiteHistoryStore(Path(tmp_dir) / "history.db")
+            self.assertEqual(import_pickle_history(pickle_path, store), 1)
+            self.assertEqual(list(store.iter_records()), records)
+            store.close()
+
+    def test_import_missing_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = SQLiteHistoryStore(Path(tmp_dir) / "history.db")
+            self.assertEqual(import_pickle_history(Path(tmp_dir) / "missing.pkl", store), 0)
+            store.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 import unittest
+import numpy as np
 from multi_agent_prism_system import MultiAgentPrismSystem
 from reinforcement_learning_manager import ReinforcementLearningManager
 from ethical_prisms.ecocentric import EcocentricPrism
+from ethical_prisms.innovation_focused import InnovationFocusedPrism
+from ecocentric_agent import EcocentricAgent
 
 class TestMultiAgentPrismSystem(unittest.TestCase):
     def setUp(self):
@@ -50,5 +53,52 @@ class TestMultiAgentPrismSystem(unittest.TestCase):
             self.assertIn("score", result["detailed_report"][agent])
             self.assertIn("metrics", result["detailed_report"][agent])
 
+class TestBatchedMultiAgentPrismSystem(unittest.TestCase):
+    FIELDS = [
+        "environmental_impact", "biodiversity_preservation", "carbon_neutrality",
+        "water_conservation", "renewable_resource_use", "financial_risk", "reputational_risk",
+        "technological_risk", "economic_benefit", "societal_benefit", "carbon_footprint",
+    ]
+
+    def setUp(self):
+        self.rl_manager = ReinforcementLearningManager(initial_weights={
+            "EcocentricPrism": 0.5, "InnovationFocusedPrism": 0.3, "EcocentricAgent": 0.2
+        })
+        self.system = MultiAgentPrismSystem(
+            rl_manager=self.rl_manager,
+            agents=[EcocentricPrism(), InnovationFocusedPrism(), EcocentricAgent()]
+        )
+        rng = np.random.default_rng(3)
+        self.rows = [{field: float(rng.random()) for field in self.FIELDS} for _ in range(50)]
+
+    def test_batch_matches_single_evaluations(self):
+        expected = [self.system.evaluate_all(row)["aggregated_score"] for row in self.rows]
+        result = self.system.evaluate_batch(self.rows)
+        self.assertEqual(result["agents"], ["EcocentricPrism", "InnovationFocusedPrism", "EcocentricAgent"])
+        self.assertEqual(result["scores"].shape, (50, 3))
+        np.testing.assert_allclose(result["aggregated_scores"], expected, rtol=0, atol=1e-12)
+
+    def test_batch_accepts_columns(self):
+        columns = {field: np.array([row[field] for row in self.rows]) for field in self.FIELDS}
+        np.testing.assert_allclose(
+            self.system.evaluate_batch(columns)["aggregated_scores"],
+            self.system.evaluate_batch(self.rows)["aggregated_scores"]
+        )
+
+    def test_weight_vector_follows_rl_manager_version(self):
+        vector = self.system.weight_vector()
+        np.testing.assert_array_equal(vector, [0.5, 0.3, 0.2])
+        self.assertIs(self.system.weight_vector(), vector)
+        self.rl_manager.update({}, reward=1.0)
+        updated = self.system.weight_vector()
+        self.assertIsNot(updated, vector)
+        np.testing.assert_allclose(updated, [
+            self.rl_manager.get_current_weights()[name] for name in self.system.agent_names
+        ])
+
+    def test_batch_feeds_agreement(self):
+        self.system.evaluate_batch(self.rows)
+        self.assertEqual(self.system.agreement.updates, 50)
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -1,7 +1,8 @@
 import unittest
 import os
 import shutil
-from AEPF_Core.plugin_manager import PluginManager
+from unittest import mock
+from AEPF_Core.plugin_manager import PluginManager, PluginRegistry
 from ethical_prisms.ethical_prism_agent import EthicalPrismAgent
 
 # Dummy plugin for testing
@@ -53,5 +54,110 @@ class TestPluginManager(unittest.TestCase):
         plugins = manager.get_plugins()
         self.assertEqual(len(plugins), 1)  # Only the valid plugin should be loaded
 
+def scored_plugin_code(score: float) -> str:
+    return f"""
+from ethical_prisms.ethical_prism_agent import EthicalPrismAgent
+
+class ScoredPrism(EthicalPrismAgent):
+    def evaluate(self, input_data: dict) -> dict:
+        return {{"score": {score}, "metrics": {{}}}}
+
+plugin = ScoredPrism()
+"""
+
+class EntryPointPrism(EthicalPrismAgent):
+    def evaluate(self, input_data: dict) -> dict:
+        return {"score": 0.1, "metrics": {}}
+
+class FakeEntryPoint:
+    def __init__(self, name, obj):
+        self.name = name
+        self.value = f"fake:{name}"
+        self.obj = obj
+
+    def load(self):
+        return self.obj
+
+class FakeEntryPoints(list):
+    def select(self, group):
+        return self if group == "aepf.plugins" else []
+
+class TestPluginRegistry(unittest.TestCase):
+    def setUp(self):
+        self.plugins_dir = "test_registry_plugins"
+        os.makedirs(self.plugins_dir, exist_ok=True)
+        self.write("scored_plugin.py", scored_plugin_code(0.5))
+        with open(os.path.join(self.plugins_dir, "dummy_plugin.py"), "w") as f:
+            f.write(dummy_plugin_code)
+        self.registry = PluginRegistry()
+
+    def tearDown(self):
+        shutil.rmtree(self.plugins_dir)
+
+    def write(self, filename, code, mtime_offset=0):
+        path = os.path.join(self.plugins_dir, filename)
+        with open(path, "w") as f:
+            f.write(code)
+        if mtime_offset:
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset))
+
+    def manager(self):
+        manager = PluginManager(plugins_dir=self.plugins_dir, registry=self.registry)
+        manager.load_plugins()
+        return manager
+
+    def test_unchanged_plugins_are_served_from_cache(self):
+        first = self.manager().get_plugins()
+        second = self.manager().get_plugins()
+        self.assertEqual([id(p) for p in first], [id(p) for p in second])
+        self.assertEqual((self.registry.cache_misses, self.registry.cache_hits), (2, 2))
+
+    def test_only_changed_plugins_are_reloaded(self):
+        manager = self.manager()
+        dummy, scored = manager.get_plugins()
+        # Same second, same size: only the content hash can tell the edit apart
+        self.write("scored_plugin.py", scored_plugin_code(0.7), mtime_offset=1)
+        self.assertTrue(manager.refresh())
+        new_dummy, new_scored = manager.get_plugins()
+        self.assertIs(new_dummy, dummy)
+        self.assertIsNot(new_scored, scored)
+        self.assertEqual(new_scored.evaluate({})["score"], 0.7)
+
+    def test_touched_file_is_not_reloaded(self):
+        manager = self.manager()
+        scored = manager.get_plugins()[1]
+        self.write("scored_plugin.py", scored_plugin_code(0.5), mtime_offset=10**9)
+        self.assertFalse(manager.refresh())
+        self.assertIs(manager.get_plugins()[1], scored)
+
+    def test_deleted_plugin_is_dropped(self):
+        manager = self.manager()
+        os.remove(os.path.join(self.plugins_dir, "scored_plugin.py"))
+        self.assertTrue(manager.refresh())
+        self.assertEqual(len(manager.get_plugins()), 1)
+
+    def test_load_metrics(self):
+        self.manager()
+        metrics = self.registry.metrics()
+        self.assertEqual(len(metrics["plugins"]), 2)
+        for entry in metrics["plugins"].values():
+            self.assertEqual((entry["source"], entry["loaded"], entry["loads"]), ("file", True, 1))
+            self.assertGreaterEqual(entry["load_seconds"], 0.0)
+
+    def test_entry_point_discovery(self):
+        entry_points = FakeEntryPoints([
+            FakeEntryPoint("by_class", EntryPointPrism),
+            FakeEntryPoint("not_a_prism", object()),
+        ])
+        with mock.patch("AEPF_Core.plugin_manager.metadata.entry_points", return_value=entry_points):
+            manager = PluginManager(plugins_dir=self.plugins_dir, registry=self.registry,
+                                    entry_point_group="aepf.plugins")
+            manager.load_plugins()
+            again = self.registry.load_entry_points("aepf.plugins")
+        self.assertIsInstance(manager.get_plugins()[-1], EntryPointPrism)
+        self.assertEqual(len(manager.get_plugins()), 3)
+        self.assertIs(again[0], manager.get_plugins()[-1])
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
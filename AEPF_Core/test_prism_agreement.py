@@ -0,0 +1,113 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from prism_agreement import PrismAgreementMatrix
+from ethical_alignment_tracker import EthicalAlignmentTracker
+from ethical_governor import EthicalGovernor
+from history_store import SQLiteHistoryStore
+from ethical_prisms.ecocentric import EcocentricPrism
+from ethical_prisms.innovation_focused import InnovationFocusedPrism
+
+NAMES = ["ecocentric", "equity_focused", "human_centric", "innovation_focused", "sentient_first"]
+
+class TestPrismAgreementMatrix(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        base = rng.random(200)
+        self.scores = np.column_stack([
+            base,
+            base * 0.5 + rng.random(200) * 0.1,
+            1 - base,
+            rng.random(200),
+            base + rng.normal(0, 0.2, 200),
+        ])
+
+    def test_matches_batch_statistics(self):
+        matrix = PrismAgreementMatrix()
+        matrix.update_many(dict(zip(NAMES, row)) for row in self.scores)
+        names, correlation = matrix.agreement_matrix()
+        self.assertEqual(names, NAMES)
+        np.testing.assert_allclose(correlation, np.corrcoef(self.scores, rowvar=False), atol=1e-10)
+        _, covariance = matrix.covariance_matrix()
+        np.testing.assert_allclose(covariance, np.cov(self.scores, rowvar=False), atol=1e-12)
+
+    def test_pairs(self):
+        matrix = PrismAgreementMatrix()
+        matrix.update_many(dict(zip(NAMES, row)) for row in self.scores)
+        pairs = matrix.pairs(threshold=0.9)
+        self.assertIn(("ecocentric", "equity_focused"), pairs["harmonious"])
+        self.assertIn(("ecocentric", "human_centric"), pairs["conflicted"])
+        self.assertNotIn(("ecocentric", "innovation_focused"), pairs["harmonious"] + pairs["conflicted"])
+
+    def test_missing_prisms_only_skip_their_pairs(self):
+        matrix = PrismAgreementMatrix()
+        full = self.scores[:, :3]
+        for i, row in enumerate(full):
+            scores = dict(zip(NAMES[:3], row))
+            if i % 2:
+                del scores["human_centric"]
+            matrix.update(scores)
+        names, correlation = matrix.agreement_matrix()
+        np.testing.assert_allclose(correlation[0, 1], np.corrcoef(full[:, 0], full[:, 1])[0, 1])
+        even = full[::2]
+        np.testing.assert_allclose(correlation[0, 2], np.corrcoef(even[:, 0], even[:, 2])[0, 1])
+        self.assertEqual(matrix.counts[0, 2], len(even))
+
+    def test_new_prisms_grow_the_matrix(self):
+        matrix = PrismAgreementMatrix(["a", "b"])
+        matrix.update({"a": 0.1, "b": 0.2})
+        matrix.update({"a": 0.3, "b": 0.1, "plugin": {"score": 0.5}})
+        names, correlation = matrix.agreement_matrix()
+        self.assertEqual(names, ["a", "b", "plugin"])
+        self.assertEqual(correlation.shape, (3, 3))
+        self.assertTrue(np.isnan(correlation[0, 2]))
+        self.assertAlmostEqual(matrix.agreement("a", "b"), -1.0)
+
+    def test_matrix_is_cached_between_updates(self):
+        matrix = PrismAgreementMatrix()
+        matrix.update_many(dict(zip(NAMES, row)) for row in self.scores[:10])
+        first = matrix.agreement_matrix()
+        self.assertIs(matrix.agreement_matrix(), first)
+        matrix.update(dict(zip(NAMES, self.scores[10])))
+        self.assertIsNot(matrix.agreement_matrix(), first)
+
+    def test_tracker_feeds_agreement(self):
+        tracker = EthicalAlignmentTracker()
+        for row in self.scores[:20]:
+            tracker.record_decision(dict(zip(NAMES, row)))
+        self.assertEqual(tracker.agreement.updates, 20)
+
+class TestGovernorPrismAgreement(unittest.TestCase):
+    def test_evaluations_update_agreement(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            governor = EthicalGovernor(history_store=SQLiteHistoryStore(Path(tmp_dir) / "history.db"))
+            governor.plugin_manager.plugins = [EcocentricPrism(), InnovationFocusedPrism()]
+            inputs = [
+                {
+                    "environmental_impact": value, "biodiversity_preservation": value,
+                    "carbon_neutrality": value, "water_conservation": value,
+                    "renewable_resource_use": value, "financial_risk": value,
+                    "reputational_risk": value, "technological_risk": value,
+                    "economic_benefit": value, "societal_benefit": value,
+                }
+                for value in (0.1, 0.5, 0.9)
+            ]
+            try:
+                governor.evaluate(inputs[0])
+                governor.evaluate_batch(inputs[1:])
+                names, correlation = governor.prism_agreement.agreement_matrix()
+                # Ecocentric rises with the inputs, innovation falls (risks are inverted)
+                self.assertEqual(names, ["EcocentricPrism", "InnovationFocusedPrism"])
+                self.assertAlmostEqual(correlation[0, 1], -1.0)
+
+                # A new governor on the same store starts from the recorded window
+                restarted = EthicalGovernor(history_store=governor.history_store)
+                self.assertEqual(restarted.prism_agreement.updates, 3)
+            finally:
+                governor.close()
+
+if __name__ == '__main__':
+    unittest.main()
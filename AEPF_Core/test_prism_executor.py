@@ -0,0 +1,261 @@
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from prism_executor import PrismExecutor
+from ethical_governor import EthicalGovernor
+from history_store import SQLiteHistoryStore
+from ethical_prisms.ethical_prism_agent import EthicalPrismAgent
+from ethical_prisms.ecocentric import EcocentricPrism
+from ethical_prisms.innovation_focused import InnovationFocusedPrism
+from ethical_prisms.sentient_first import SentientFirstPrism
+from ethical_prisms.input_schema import InputField, compile_schema, has_inputs, validate_batch, validate_inputs
+import numpy as np
+import pandas as pd
+
+class SlowPrism(EthicalPrismAgent):
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def evaluate(self, input_data):
+        time.sleep(self.delay)
+        return {"score": 0.5, "metrics": {}}
+
+class OtherSlowPrism(SlowPrism):
+    pass
+
+class FailingPrism(EthicalPrismAgent):
+    def evaluate(self, input_data):
+        raise RuntimeError("scoring model unavailable")
+
+class RecordingPrism(EthicalPrismAgent):
+    INPUT_SCHEMA = (InputField("carbon_neutrality"), InputField("water_conservation", required=False))
+
+    def __init__(self):
+        self.seen = []
+
+    def evaluate(self, input_data):
+        self.seen.append(input_data)
+        return {"score": input_data["carbon_neutrality"], "metrics": {}}
+
+INPUT = {
+    "environmental_impact": 0.5,
+    "biodiversity_preservation": 0.6,
+    "carbon_neutrality": 0.7,
+    "water_conservation": 0.8,
+    "renewable_resource_use": 0.9,
+    "financial_risk": 0.3,
+    "reputational_risk": 0.2,
+    "technological_risk": 0.4,
+    "economic_benefit": 0.7,
+    "societal_benefit": 0.6,
+}
+
+class TestPrismExecutor(unittest.TestCase):
+    def run_mode(self, mode, plugins, **kwargs):
+        executor = PrismExecutor(mode, **kwargs)
+        try:
+            return executor.run(plugins, INPUT)
+        finally:
+            executor.shutdown()
+
+    def test_pooled_modes_match_serial(self):
+        plugins = [EcocentricPrism(), InnovationFocusedPrism()]
+        expected = self.run_mode("serial", plugins)
+        for mode in ("thread", "process"):
+            with self.subTest(mode=mode):
+                self.assertEqual(self.run_mode(mode, plugins), expected)
+
+    def test_failures_are_isolated(self):
+        for mode in ("serial", "thread"):
+            with self.subTest(mode=mode):
+                results, errors, _ = self.run_mode(mode, [FailingPrism(), EcocentricPrism()])
+                self.assertEqual(list(results), ["EcocentricPrism"])
+                self.assertEqual(errors, {"FailingPrism": "RuntimeError: scoring model unavailable"})
+
+    def test_latency_is_bounded_by_slowest_plugin(self):
+        start = time.monotonic()
+        results, errors, _ = self.run_mode("thread", [SlowPrism(0.3), OtherSlowPrism(0.3)])
+        self.assertLess(time.monotonic() - start, 0.55)
+        self.assertEqual(set(results), {"SlowPrism", "OtherSlowPrism"})
+        self.assertEqual(errors, {})
+
+    def test_slow_plugin_times_out(self):
+        executor = PrismExecutor("thread", timeout=0.1)
+        start = time.monotonic()
+        results, errors, _ = executor.run([SlowPrism(1.0), EcocentricPrism()], INPUT)
+        self.assertLess(time.monotonic() - start, 0.5)
+        executor.shutdown(wait=False)
+        self.assertIn("EcocentricPrism", results)
+        self.assertTrue(errors["SlowPrism"].startswith("TimeoutError"))
+
+    def test_lone_plugin_timeout_is_enforced(self):
+        executor = PrismExecutor("thread")
+        slow = SlowPrism(1.0)
+        slow.timeout = 0.1
+        start = time.monotonic()
+        results, errors, _ = executor.run([slow], INPUT)
+        self.assertLess(time.monotonic() - start, 0.5)
+        executor.shutdown(wait=False)
+        self.assertEqual(results, {})
+        self.assertTrue(errors["SlowPrism"].startswith("TimeoutError"))
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            PrismExecutor("fibers")
+
+class TestGovernorPrismErrors(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.governor = EthicalGovernor(
+            history_store=SQLiteHistoryStore(Path(self.tmp_dir.name) / "history.db"),
+            executor_mode="thread"
+        )
+        self.governor.plugin_manager.plugins = [FailingPrism(), EcocentricPrism()]
+
+    def tearDown(self):
+        self.governor.close()
+        self.tmp_dir.cleanup()
+
+    def test_failing_plugin_is_reported_not_raised(self):
+        report = self.governor.evaluate(INPUT)
+        self.assertEqual(list(report["full_report"]["prism_results"]), ["EcocentricPrism"])
+        self.assertIn("FailingPrism", report["full_report"]["prism_errors"])
+
+class TestInputSchema(unittest.TestCase):
+    def test_validate_inputs(self):
+        schema = RecordingPrism.INPUT_SCHEMA
+        validate_inputs(schema, {"carbon_neutrality": 0.5})
+        with self.assertRaisesRegex(ValueError, "Missing required input data: carbon_neutrality"):
+            validate_inputs(schema, {"water_conservation": 0.5})
+        for value in (1.5, -0.1, "high", None):
+            with self.subTest(value=value), self.assertRaisesRegex(ValueError, "between 0 and 1"):
+                validate_inputs(schema, {"carbon_neutrality": 0.5, "water_conservation": value})
+
+    def test_batch_reports_bad_rows_in_a_mask(self):
+        rows = [
+            {"carbon_neutrality": 0.5},
+            {"carbon_neutrality": 1.5},
+            {"water_conservation": 0.5},
+            {"carbon_neutrality": float("nan")},
+            {"carbon_neutrality": 0.2, "water_conservation": "low"},
+        ]
+        checked = validate_batch(RecordingPrism.INPUT_SCHEMA, rows)
+        self.assertEqual(checked.valid.tolist(), [True, False, False, False, False])
+        self.assertEqual(checked.accepted.tolist(), [True, True, True, True, True])
+        self.assertEqual(checked.invalid[:, 1].tolist(), [False, False, False, False, True])
+        self.assertEqual(checked.errors()[2], "Missing required input data: carbon_neutrality")
+        for i, row in enumerate(rows):
+            with self.subTest(row=i):
+                try:
+                    validate_inputs(RecordingPrism.INPUT_SCHEMA, row)
+                    message = None
+                except ValueError as e:
+                    message = str(e)
+                self.assertEqual(checked.error(i), message)
+
+    def test_columns_are_checked_without_per_cell_work(self):
+        frame = pd.DataFrame({"carbon_neutrality": [0.1, 2.0, np.nan]})
+        checked = compile_schema(RecordingPrism.INPUT_SCHEMA).validate_columns(frame)
+        self.assertEqual(checked.valid.tolist(), [True, False, False])
+        self.assertEqual(checked.missing[:, 0].tolist(), [False, False, True])
+        np.testing.assert_array_equal(checked.values[:2, 0], [0.1, 2.0])
+
+    def test_optional_schema_needs_one_field(self):
+        schema = (InputField("a", required=False), InputField("b", required=False))
+        self.assertFalse(has_inputs(schema, {"c": 0.5}))
+        self.assertTrue(has_inputs(schema, {"b": 0.5}))
+
+    def test_plugins_receive_only_their_fields(self):
+        prism = RecordingPrism()
+        results, errors, skipped = PrismExecutor().run([prism], INPUT)
+        self.assertEqual(prism.seen, [{"carbon_neutrality": 0.7, "water_conservation": 0.8}])
+        self.assertEqual(results["RecordingPrism"]["score"], 0.7)
+        self.assertEqual((errors, skipped), ({}, []))
+
+    def test_plugins_without_inputs_are_skipped(self):
+        results, errors, skipped = PrismExecutor().run([SentientFirstPrism(), EcocentricPrism()], INPUT)
+        self.assertEqual(list(results), ["EcocentricPrism"])
+        self.assertEqual(skipped, ["SentientFirstPrism"])
+        self.assertEqual(errors, {})
+
+    def test_misspelt_field_is_an_error_not_a_skip(self):
+        row = dict(INPUT)
+        row["renewable_resourse_use"] = row.pop("renewable_resource_use")
+        with self.assertLogs("prism_executor", level="ERROR"):
+            results, errors, skipped = PrismExecutor().run([EcocentricPrism()], row)
+        self.assertEqual((results, skipped), ({}, []))
+        self.assertEqual(errors, {
+            "EcocentricPrism": "ValueError: Missing required input data: renewable_resource_use"
+        })
+        with self.assertRaisesRegex(ValueError, "Missing required input data: renewable_resource_use"):
+            EcocentricPrism().evaluate(row)
+
+    def test_invalid_inputs_are_errors(self):
+        for mode in ("serial", "thread"):
+            with self.subTest(mode=mode):
+                executor = PrismExecutor(mode)
+                results, errors, _ = executor.run(
+                    [EcocentricPrism(), InnovationFocusedPrism()], dict(INPUT, carbon_neutrality=1.5)
+                )
+                executor.shutdown()
+                self.assertEqual(list(results), ["InnovationFocusedPrism"])
+                self.assertEqual(errors, {
+                    "EcocentricPrism": "ValueError: carbon_neutrality must be a numeric value between 0 and 1."
+                })
+
+    def test_batch_excludes_only_bad_rows(self):
+        rows = [INPUT, dict(INPUT, carbon_neutrality=1.5), INPUT]
+        runs = PrismExecutor().run_batch([EcocentricPrism(), InnovationFocusedPrism()], rows)
+        self.assertEqual([list(run.results) for run in runs], [
+            ["EcocentricPrism", "InnovationFocusedPrism"],
+            ["InnovationFocusedPrism"],
+            ["EcocentricPrism", "InnovationFocusedPrism"],
+        ])
+        self.assertEqual(list(runs[1].errors), ["EcocentricPrism"])
+        self.assertEqual(runs[0], PrismExecutor().run([EcocentricPrism(), InnovationFocusedPrism()], INPUT))
+
+    def test_validated_result_matches_evaluate(self):
+        prism = EcocentricPrism()
+        results, _, _ = PrismExecutor().run([prism], INPUT)
+        self.assertEqual(results["EcocentricPrism"], prism.evaluate(INPUT, narratives=False))
+
+    def test_narratives_are_rendered_only_on_request(self):
+        class LegacyPrism(EthicalPrismAgent):
+            def evaluate(self, input_data):
+                return {"score": 0.5, "metrics": {}}
+
+        results, errors, _ = PrismExecutor().run([EcocentricPrism(), LegacyPrism()], INPUT)
+        self.assertEqual(errors, {})
+        self.assertNotIn("narrative", results["EcocentricPrism"]["metrics"]["carbon_score"])
+        eager, _, _ = PrismExecutor(narratives=True).run([EcocentricPrism()], INPUT)
+        self.assertEqual(eager["EcocentricPrism"], EcocentricPrism().evaluate(INPUT))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            governor = EthicalGovernor(history_store=SQLiteHistoryStore(Path(tmp_dir) / "history.db"))
+            governor.plugin_manager.plugins = [EcocentricPrism(), LegacyPrism()]
+            try:
+                report = governor.evaluate_batch([INPUT])[0]
+                rendered = governor.render_narratives(report)
+            finally:
+                governor.close()
+        self.assertEqual(rendered["full_report"]["prism_results"]["EcocentricPrism"],
+                         EcocentricPrism().evaluate(INPUT))
+        self.assertNotIn("narrative", report["full_report"]["prism_results"]["EcocentricPrism"]
+                         ["metrics"]["carbon_score"])
+        self.assertEqual(rendered["summary"], report["summary"])
+
+    def test_governor_reports_skipped_plugins(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            governor = EthicalGovernor(history_store=SQLiteHistoryStore(Path(tmp_dir) / "history.db"))
+            governor.plugin_manager.plugins = [SentientFirstPrism(), EcocentricPrism()]
+            try:
+                report = governor.evaluate(INPUT)
+            finally:
+                governor.close()
+        self.assertEqual(list(report["full_report"]["prism_results"]), ["EcocentricPrism"])
+        self.assertEqual(report["full_report"]["prism_skipped"], ["SentientFirstPrism"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,9 @@ from ethical_prisms.ecocentric import EcocentricPrism
 from ethical_prisms.equity_focused import EquityFocusedPrism
 from ethical_prisms.human_centric import HumanCentricPrism
 from ethical_prisms.innovation_focused import InnovationFocusedPrism
+from ethical_prisms.sentient_first import SentientFirstPrism
+from ethical_prisms.ethical_prism_agent import EthicalPrismAgent
+import pandas as pd
 
 class TestPrisms(unittest.TestCase):
 
@@ -65,5 +68,152 @@ class TestPrisms(unittest.TestCase):
         self.assertIn('metrics', result)
         self.assertIsInstance(result['score'], float)
 
+class TestPrismColumnEvaluation(unittest.TestCase):
+    def setUp(self):
+        self.rows = [
+            {
+                'environmental_impact': 0.1 * i,
+                'biodiversity_preservation': 0.7,
+                'carbon_neutrality': 0.9,
+                'water_conservation': 0.6,
+                'renewable_resource_use': 0.85,
+                'financial_risk': 0.2,
+                'reputational_risk': 0.1 * i,
+                'technological_risk': 0.4,
+                'economic_benefit': 0.9,
+                'societal_benefit': 0.85,
+                'AI_ethics_score': 0.7,
+                'sentient_welfare': 0.6,
+                'empathy_score': 0.05 * i,
+                'autonomy_respect': 0.7,
+                'sentient_safety': 0.8,
+                'organisational_welfare': 0.9,
+                'wellbeing_score': 0.8,
+                'privacy_score': 0.1 * i,
+                'bias_mitigation_score': 0.8,
+                'representation_score': 0.1 * i,
+            }
+            for i in range(10)
+        ]
+        self.frame = pd.DataFrame(self.rows)
+
+    def assert_matches_row_path(self, prism: EthicalPrismAgent, frame):
+        column_result = prism.evaluate_columns(frame)
+        row_scores = [prism.evaluate(row)['score'] for row in self.rows]
+        self.assertEqual(column_result['score'].tolist(), row_scores)
+        return column_result
+
+    def test_native_kernels_match_row_path(self):
+        prisms = [
+            EcocentricPrism(),
+            EquityFocusedPrism(),
+            HumanCentricPrism(),
+            InnovationFocusedPrism(),
+            SentientFirstPrism()
+        ]
+        for prism in prisms:
+            with self.subTest(prism=type(prism).__name__):
+                result = self.assert_matches_row_path(prism, self.frame)
+                self.assertNotIn('rows', result)
+
+    def test_mapping_of_columns_is_accepted(self):
+        columns = {name: self.frame[name].to_numpy() for name in self.frame.columns}
+        result = self.assert_matches_row_path(InnovationFocusedPrism(), columns)
+        self.assertEqual(result['metrics']['financial_risk_score'].shape, (10,))
+
+    def test_partial_rows_use_present_metrics_only(self):
+        rows = [{'wellbeing_score': 0.8}, {'wellbeing_score': 0.6, 'privacy_score': 0.4}, {}]
+        prism = HumanCentricPrism()
+        result = prism.evaluate_columns(pd.DataFrame(rows, index=range(3)))
+        self.assertEqual(result['score'].tolist(), [prism.evaluate(row)['score'] for row in rows])
+
+    def test_out_of_range_value_raises(self):
+        frame = self.frame.copy()
+        frame.loc[3, 'carbon_neutrality'] = 1.5
+        with self.assertRaises(ValueError):
+            EcocentricPrism().evaluate_columns(frame)
+
+    def test_missing_column_raises(self):
+        with self.assertRaises(ValueError):
+            SentientFirstPrism().evaluate_columns(self.frame.drop(columns=['empathy_score']))
+
+    def test_optional_field_is_checked_in_both_paths(self):
+        prism = SentientFirstPrism()
+        frame = self.frame.copy()
+        frame.loc[3, 'AI_ethics_score'] = 1.5
+        with self.assertRaises(ValueError):
+            prism.evaluate(frame.iloc[3].to_dict())
+        with self.assertRaises(ValueError):
+            prism.evaluate_columns(frame)
+
+        without = self.frame.drop(columns=['AI_ethics_score'])
+        self.assertEqual(prism.evaluate_columns(without)['score'].tolist(), [0.0] * 10)
+
+    def test_invalid_column_is_logged_once(self):
+        frame = self.frame.copy()
+        frame.loc[3, 'carbon_neutrality'] = 1.5
+        frame.loc[3, 'sentient_welfare'] = 1.5
+        frame.loc[3, 'financial_risk'] = 1.5
+        for prism in (EcocentricPrism(), InnovationFocusedPrism(), SentientFirstPrism()):
+            with self.subTest(prism=prism.__class__.__name__):
+                with self.assertLogs(level="ERROR") as logs, self.assertRaises(ValueError):
+                    prism.evaluate_columns(frame)
+                self.assertEqual(len(logs.records), 1)
+                self.assertIn(f"Invalid input for {prism.__class__.__name__}", logs.output[0])
+
+    def test_prism_without_kernel_falls_back_to_rows(self):
+        class RowOnlyPrism(EthicalPrismAgent):
+            def evaluate(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+                return {"score": input_data['sentient_welfare'] / 2, "metrics": {}}
+
+        result = RowOnlyPrism().evaluate_columns(self.frame)
+        self.assertEqual(result['score'].tolist(), [0.3] * 10)
+        self.assertEqual(len(result['rows']), 10)
+
+class TestLazyNarratives(unittest.TestCase):
+    def setUp(self):
+        self.input_data = {
+            'environmental_impact': 0.8,
+            'biodiversity_preservation': 0.7,
+            'carbon_neutrality': 0.9,
+            'water_conservation': 0.6,
+            'renewable_resource_use': 0.85,
+            'financial_risk': 0.2,
+            'reputational_risk': 0.3,
+            'technological_risk': 0.4,
+            'economic_benefit': 0.9,
+            'societal_benefit': 0.85,
+            'AI_ethics_score': 0.7,
+            'sentient_welfare': 0.6,
+            'empathy_score': 0.5,
+            'autonomy_respect': 0.7,
+            'sentient_safety': 0.8,
+            'organisational_welfare': 0.9
+        }
+        self.prisms = [EcocentricPrism(), InnovationFocusedPrism(), SentientFirstPrism()]
+
+    def test_numeric_payload_is_unchanged_without_narratives(self):
+        for prism in self.prisms:
+            with self.subTest(prism=type(prism).__name__):
+                full = prism.evaluate(self.input_data)
+                lazy = prism.evaluate(self.input_data, narratives=False)
+                self.assertEqual(lazy['score'], full['score'])
+                for name, metric in lazy['metrics'].items():
+                    self.assertNotIn('narrative', metric)
+                    self.assertEqual(metric['value'], full['metrics'][name]['value'])
+
+    def test_render_narratives_matches_eager_output(self):
+        for prism in self.prisms:
+            with self.subTest(prism=type(prism).__name__):
+                lazy = prism.evaluate(self.input_data, narratives=False)
+                self.assertEqual(prism.render_narratives(lazy), prism.evaluate(self.input_data))
+
+    def test_sentient_first_narrative_format(self):
+        result = SentientFirstPrism().evaluate(self.input_data)
+        self.assertEqual(
+            result['metrics']['empathy_score']['narrative'],
+            "Empathy score for sentient beings is 0.50."
+        )
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
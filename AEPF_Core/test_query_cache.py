@@ -0,0 +1,55 @@
+import unittest
+
+from query_cache import LRUQueryCache, canonical_evidence
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestLRUQueryCache(unittest.TestCase):
+    def test_hits_and_misses_are_counted(self):
+        cache = LRUQueryCache(maxsize=4)
+        self.assertIsNone(cache.get("a", None))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = LRUQueryCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = LRUQueryCache(maxsize=2, ttl=10, clock=clock)
+        cache.put("a", 1)
+        clock.now = 9.9
+        self.assertEqual(cache.get("a"), 1)
+        clock.now = 10.0
+        self.assertIsNone(cache.get("a", None))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear_keeps_counters(self):
+        cache = LRUQueryCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_canonical_evidence_ignores_order(self):
+        self.assertEqual(canonical_evidence({"a": 1, "b": 0}), canonical_evidence({"b": 0, "a": 1}))
+        self.assertIsNone(canonical_evidence({"a": {"score": 0.5}}))
+
+if __name__ == '__main__':
+    unittest.main()
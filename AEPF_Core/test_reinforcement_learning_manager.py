@@ -1,4 +1,6 @@
+import threading
 import unittest
+import numpy as np
 from AEPF_Core.reinforcement_learning_manager import ReinforcementLearningManager
 
 class TestReinforcementLearningManager(unittest.TestCase):
@@ -37,5 +39,83 @@ class TestReinforcementLearningManager(unittest.TestCase):
         # Check that the updated weights differ from the initial weights
         self.assertNotEqual(initial_weights, updated_weights, "Weights did not change after update with no reward")
 
+class TestArrayBackedReinforcementLearningManager(unittest.TestCase):
+    WEIGHTS = {"ecocentric": 0.5, "equity_focused": 0.3, "human_centric": 0.4}
+
+    def test_weights_are_a_vector_with_stable_index(self):
+        manager = ReinforcementLearningManager(self.WEIGHTS, seed=0)
+        self.assertEqual(manager.agents, list(self.WEIGHTS))
+        manager.update({}, 1.0)
+        self.assertEqual(list(manager.get_current_weights()), list(self.WEIGHTS))
+        self.assertAlmostEqual(manager.weight_vector.sum(), 1.0)
+        self.assertEqual(manager.get_current_weights()["equity_focused"],
+                         manager.weight_vector[manager.agent_index["equity_focused"]])
+
+    def test_replay_is_deterministic_for_a_seed(self):
+        runs = []
+        for _ in range(2):
+            manager = ReinforcementLearningManager(self.WEIGHTS, seed=42)
+            for reward in (0.1, 0.9, 0.5):
+                manager.select_action()
+                manager.update({}, reward)
+            runs.append(manager.weight_vector.copy())
+        np.testing.assert_array_equal(runs[0], runs[1])
+        other = ReinforcementLearningManager(self.WEIGHTS, seed=7)
+        other.update({}, 0.1)
+        self.assertFalse(np.array_equal(other.weight_vector, runs[0]))
+
+    def test_batch_update_matches_sequential_updates(self):
+        rewards = np.random.default_rng(1).random(500)
+        sequential = ReinforcementLearningManager(self.WEIGHTS, seed=3)
+        for reward in rewards:
+            sequential.update({}, reward)
+        batched = ReinforcementLearningManager(self.WEIGHTS, seed=3)
+        batched.update_batch(None, rewards)
+        np.testing.assert_allclose(batched.weight_vector, sequential.weight_vector, rtol=0, atol=1e-12)
+        self.assertEqual(batched.version, sequential.version)
+
+    def test_version_tracks_changes(self):
+        manager = ReinforcementLearningManager(self.WEIGHTS, seed=0)
+        version = manager.version
+        weights = manager.get_current_weights()
+        self.assertIs(manager.get_current_weights(), weights)
+        manager.update_batch(None, [0.2, 0.4])
+        self.assertEqual(manager.version, version + 2)
+        self.assertIsNot(manager.get_current_weights(), weights)
+
+    def test_snapshots_are_immutable(self):
+        manager = ReinforcementLearningManager(self.WEIGHTS, seed=0)
+        snapshot = manager.snapshot()
+        vector = snapshot.vector.copy()
+        manager.update({}, 0.9)
+        np.testing.assert_array_equal(snapshot.vector, vector)
+        self.assertIsNot(manager.snapshot(), snapshot)
+        with self.assertRaises(ValueError):
+            manager.weight_vector[0] = 1.0
+
+    def test_readers_see_consistent_snapshots_during_updates(self):
+        manager = ReinforcementLearningManager(self.WEIGHTS, seed=0)
+        manager.select_action()  # the initial weights are not normalized
+        stop = threading.Event()
+        torn = []
+
+        def read():
+            while not stop.is_set():
+                snapshot = manager.snapshot()
+                if abs(snapshot.vector.sum() - 1.0) > 1e-9 or \
+                        list(snapshot.weights.values()) != snapshot.vector.tolist():
+                    torn.append(snapshot)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for reward in np.random.default_rng(0).random(2000):
+            manager.update({}, reward)
+        stop.set()
+        for reader in readers:
+            reader.join()
+        self.assertEqual(torn, [])
+        self.assertEqual(manager.snapshot().version, manager.version)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
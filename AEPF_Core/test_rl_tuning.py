@@ -0,0 +1,120 @@
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+import numpy as np
+
+from history_store import SQLiteHistoryStore
+from rl_tuning import TuningConfig, grid, iter_history, load_replay, run_config, tune
+
+def make_records(count: int = 300, seed: int = 0) -> list:
+    rng = np.random.default_rng(seed)
+    records = []
+    for i in range(count):
+        scores = rng.random(3)
+        records.append({
+            'timestamp': f"20250101_{i:06d}",
+            'scenario': None,
+            'weights': {},
+            'prism_results': {
+                'ecocentric': {'score': scores[0], 'metrics': {}},
+                'equity_focused': {'score': scores[1], 'metrics': {}},
+                'human_centric': {'score': scores[2], 'metrics': {}},
+            },
+            'total_score': float(scores.mean()),
+            'reward': float(0.7 * scores[0] + 0.3 * scores[1]),
+        })
+    return records
+
+class TestRLTuning(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.replay = load_replay(make_records())
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_replay_from_history_store_and_pickle(self):
+        records = make_records(20)
+        records[3].pop('reward')
+        db_path = Path(self.tmp_dir.name) / "history.db"
+        store = SQLiteHistoryStore(db_path)
+        store.extend(records)
+        store.close()
+        pkl_path = Path(self.tmp_dir.name) / "history.pkl"
+        with open(pkl_path, "wb") as f:
+            pickle.dump(records, f)
+
+        for path in (db_path, pkl_path):
+            replay = load_replay(iter_history(path))
+            self.assertEqual(replay.agents, ['ecocentric', 'equity_focused', 'human_centric'])
+            self.assertEqual(replay.scores.shape, (19, 3))
+            self.assertEqual(len(replay), 19)
+
+    def test_missing_history_is_an_error(self):
+        path = Path(self.tmp_dir.name) / "mistyped.db"
+        with self.assertRaises(FileNotFoundError):
+            list(iter_history(path))
+        self.assertFalse(path.exists())
+
+    def test_each_position_is_checkpointed_once(self):
+        config = TuningConfig(0.05, 0.0, seed=0)
+        with mock.patch("rl_tuning._save_checkpoint") as save:
+            # 300 decisions in chunks of 50: six chunks, the last one on the interval
+            run_config(config, self.replay, chunk_size=50, checkpoint_dir=self.tmp_dir.name,
+                       checkpoint_every=3)
+            self.assertEqual([call.args[2] for call in save.call_args_list], [150, 300])
+            save.reset_mock()
+            run_config(config, self.replay, chunk_size=50, checkpoint_dir=self.tmp_dir.name,
+                       checkpoint_every=4)
+            self.assertEqual([call.args[2] for call in save.call_args_list], [200, 300])
+
+    def test_loss_matches_direct_computation(self):
+        weights = np.array([0.5, 0.3, 0.2])
+        expected = np.mean((self.replay.scores @ weights - self.replay.rewards) ** 2)
+        self.assertAlmostEqual(self.replay.loss(weights), expected)
+
+    def test_runs_are_reproducible(self):
+        config = TuningConfig(0.05, 0.1, seed=3)
+        first = run_config(config, self.replay, chunk_size=32)
+        second = run_config(config, self.replay, chunk_size=32)
+        self.assertEqual(first.weights, second.weights)
+        self.assertEqual(first.curve, second.curve)
+        self.assertEqual(len(first.curve), 1 + -(-len(self.replay) // 32))
+
+    def test_resume_matches_uninterrupted_run(self):
+        config = TuningConfig(0.05, 0.2, seed=1)
+        uninterrupted = run_config(config, self.replay, epochs=2, chunk_size=32)
+
+        checkpoints = self.tmp_dir.name
+        partial = run_config(config, self.replay, epochs=2, chunk_size=32,
+                             checkpoint_dir=checkpoints, checkpoint_every=2, stop_after=5)
+        self.assertEqual(partial.steps, 160)
+        resumed = run_config(config, self.replay, epochs=2, chunk_size=32,
+                             checkpoint_dir=checkpoints, checkpoint_every=2)
+
+        self.assertEqual(resumed.steps, 2 * len(self.replay))
+        np.testing.assert_array_equal(list(resumed.weights.values()), list(uninterrupted.weights.values()))
+        np.testing.assert_array_equal(resumed.curve, uninterrupted.curve)
+
+    def test_mismatched_checkpoint_is_ignored(self):
+        config = TuningConfig(0.05, 0.0, seed=0)
+        run_config(config, self.replay, chunk_size=32, checkpoint_dir=self.tmp_dir.name)
+        rerun = run_config(config, self.replay, chunk_size=64, checkpoint_dir=self.tmp_dir.name)
+        self.assertEqual(rerun.curve, run_config(config, self.replay, chunk_size=64).curve)
+
+    def test_tune_orders_results_by_loss(self):
+        configs = grid([0.01, 0.1], [0.0, 0.1], [0])
+        serial = tune(configs, self.replay, workers=1, chunk_size=32)
+        parallel = tune(configs, self.replay, workers=2, chunk_size=32)
+
+        self.assertEqual(len(serial), 4)
+        losses = [result.loss for result in serial]
+        self.assertEqual(losses, sorted(losses))
+        self.assertEqual([r.config for r in parallel], [r.config for r in serial])
+        self.assertEqual([r.weights for r in parallel], [r.weights for r in serial])
+
+if __name__ == '__main__':
+    unittest.main()
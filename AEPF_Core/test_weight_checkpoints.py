@@ -0,0 +1,124 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from pathlib import Path
+
+import numpy as np
+
+from AEPF_Core.reinforcement_learning_manager import ExampleRLManager, ReinforcementLearningManager
+from AEPF_Core.weight_checkpoints import WeightCheckpointer, WeightCheckpointStore
+
+INITIAL_WEIGHTS = {
+    "ecocentric": 0.2,
+    "equity_focused": 0.2,
+    "human_centric": 0.2,
+    "innovation_focused": 0.2,
+    "sentient_first": 0.2
+}
+
+class TestWeightCheckpointStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = WeightCheckpointStore(Path(self.tmp_dir.name) / "weights", keep=3)
+        self.manager = ReinforcementLearningManager(INITIAL_WEIGHTS, seed=7)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_empty_store(self):
+        self.assertIsNone(self.store.load())
+        self.assertIsNone(self.store.restore(self.manager))
+        self.assertEqual(self.store.versions(), [])
+
+    def test_restart_resumes_weights_and_random_stream(self):
+        self.manager.update_batch(None, [0.9, 0.1, 0.5])
+        checkpoint = self.store.save(self.manager)
+        self.assertEqual(checkpoint.version, 1)
+        self.manager.update(None, 0.4)
+        expected = self.manager.get_current_weights()
+
+        restarted = ReinforcementLearningManager(INITIAL_WEIGHTS, seed=0)
+        self.store.restore(restarted)
+        restarted.update(None, 0.4)
+        self.assertEqual(restarted.get_current_weights(), expected)
+
+    def test_restore_bumps_version_once(self):
+        self.store.save(self.manager)
+        version = self.manager.version
+        self.store.restore(self.manager)
+        self.assertEqual(self.manager.version, version + 1)
+        with self.assertRaises(AttributeError):
+            self.manager.version = 0
+
+    def test_rollback_to_named_version(self):
+        self.manager.update(None, 0.9)
+        stable = self.store.save(self.manager, name="stable").as_dict()
+        for reward in (0.1, 0.2, 0.3):
+            self.manager.update(None, reward)
+            self.store.save(self.manager)
+
+        rolled_back = self.store.rollback(self.manager, "stable")
+        self.assertEqual(self.manager.get_current_weights(), stable)
+        self.assertEqual(rolled_back.version, 5)
+        self.assertEqual(self.store.load().as_dict(), stable)
+        with self.assertRaises(KeyError):
+            self.store.load("missing")
+
+    def test_old_unnamed_checkpoints_are_pruned(self):
+        self.store.save(self.manager, name="baseline")
+        for _ in range(5):
+            self.manager.update(None, 0.5)
+            self.store.save(self.manager)
+        self.assertEqual(self.store.versions(), [1, 4, 5, 6])
+        self.assertEqual(self.store.load("baseline").version, 1)
+
+    def test_concurrent_savers_get_distinct_versions(self):
+        store = WeightCheckpointStore(self.store.directory, keep=None)
+
+        def save_many():
+            for _ in range(10):
+                store.save_weights(INITIAL_WEIGHTS)
+
+        threads = [threading.Thread(target=save_many) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(store.versions(), list(range(1, 81)))
+        self.assertEqual([entry["version"] for entry in store.history()], list(range(1, 81)))
+
+    def test_pruning_does_not_open_checkpoints(self):
+        self.store.save_weights(INITIAL_WEIGHTS, name="baseline")
+        with mock.patch.object(self.store, "_read", side_effect=AssertionError("checkpoint opened")):
+            for _ in range(5):
+                self.store.save_weights(INITIAL_WEIGHTS)
+        self.assertEqual(self.store.versions(), [1, 4, 5, 6])
+
+    def test_no_temporary_files_are_left(self):
+        self.store.save(self.manager)
+        self.assertEqual(os.listdir(self.store.directory), ["weights-00000001.npz"])
+
+    def test_example_manager_round_trip(self):
+        manager = ExampleRLManager(dict(INITIAL_WEIGHTS))
+        manager.update_weights(None)
+        self.store.save(manager)
+        restored = ExampleRLManager(dict(INITIAL_WEIGHTS))
+        self.store.restore(restored)
+        self.assertEqual(restored.weights, manager.weights)
+        self.assertEqual(restored.version, 1)
+
+    def test_checkpointer_saves_every_n_changes(self):
+        checkpointer = WeightCheckpointer(self.manager, self.store, every=3)
+        saved = []
+        for _ in range(7):
+            self.manager.update(None, 0.5)
+            saved.append(checkpointer.maybe_save() is not None)
+            if saved[-1]:
+                np.testing.assert_array_equal(self.store.load().weights, self.manager.weight_vector)
+        self.assertEqual(saved, [False, False, True, False, False, True, False])
+        self.assertFalse(self.store.load().weights.flags.writeable)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,269 @@
+"""
+Versioned checkpoints of the RL prism weights.
+
+Each checkpoint is one small ``weights-<version>.npz`` file in the checkpoint
+directory (``weights-<version>.named.npz`` for named checkpoints) holding two
+arrays:
+
+* ``weights`` - the weight vector, float64;
+* ``meta`` - a JSON document with the format version, the agent names in
+  vector order, the checkpoint's optional name, its creation time and, for
+  managers with a seeded generator, the generator state.
+
+Files are written to a temporary name and hard-linked into place, which
+fails if the version is already taken, so concurrent savers never share a
+version, a reader or a crash never sees a partial checkpoint, and nothing is
+unpickled on load.
+Versions only grow: rolling back restores an earlier checkpoint and records
+it again as the newest version, so the history of what was live is kept.
+"""
+
+from typing import Dict, Any, List, Optional, Union
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+import json
+import logging
+import os
+import re
+import time
+import uuid
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FORMAT_NAME = "aepf-rl-weights"
+FORMAT_VERSION = 1
+_FILE_PATTERN = re.compile(r"^weights-(\d+)(\.named)?\.npz$")
+
+@dataclass(frozen=True)
+class WeightCheckpoint:
+    """One saved set of weights."""
+    version: int
+    agents: List[str]
+    weights: np.ndarray
+    name: Optional[str] = None
+    created: Optional[str] = None
+    rng_state: Optional[Dict[str, Any]] = field(default=None, repr=False)
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(zip(self.agents, self.weights.tolist()))
+
+class WeightCheckpointStore:
+    """Directory of versioned weight checkpoints."""
+
+    def __init__(self, directory: Union[str, Path], keep: Optional[int] = 20):
+        """
+        Args:
+            directory (Union[str, Path]): Where the checkpoints live; created on first save.
+            keep (int, optional): Number of recent unnamed checkpoints to keep. Named
+                checkpoints are rollback targets and are never pruned. None keeps all.
+        """
+        self.directory = Path(directory)
+        self.keep = keep
+
+    def _path(self, version: int, named: bool = False) -> Path:
+        return self.directory / f"weights-{version:08d}{'.named' if named else ''}.npz"
+
+    def _files(self) -> Dict[int, Path]:
+        """Map each saved version to its file."""
+        if not self.directory.is_dir():
+            return {}
+        return {
+            int(match.group(1)): self.directory / match.group(0)
+            for match in map(_FILE_PATTERN.match, os.listdir(self.directory)) if match
+        }
+
+    def versions(self) -> List[int]:
+        """Return the saved versions, oldest first."""
+        return sorted(self._files())
+
+    def latest_version(self) -> Optional[int]:
+        versions = self.versions()
+        return versions[-1] if versions else None
+
+    def save(self, manager: Any, name: Optional[str] = None) -> WeightCheckpoint:
+        """
+        Save a manager's current weights as the next version.
+
+        Args:
+            manager: An RL manager exposing its weights through ``get_current_weights()``
+                or a ``weights`` dict, such as ReinforcementLearningManager or ExampleRLManager.
+            name (str, optional): A name to roll back to later, e.g. "stable".
+
+        Returns:
+            WeightCheckpoint: The saved checkpoint.
+        """
+        weights = manager.get_current_weights() if hasattr(manager, "get_current_weights") else manager.weights
+        rng = getattr(manager, "rng", None)
+        return self.save_weights(weights, name=name,
+                                 rng_state=rng.bit_generator.state if rng is not None else None)
+
+    def save_weights(self, weights: Dict[str, float], name: Optional[str] = None,
+                     rng_state: Optional[Dict[str, Any]] = None) -> WeightCheckpoint:
+        """Save a weights dict as the next version."""
+        if name is not None and name.isdigit():
+            raise ValueError("Checkpoint names cannot be numbers, which are read as versions.")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        agents = list(weights)
+        vector = np.array(list(weights.values()), dtype=float)
+        created = datetime.now().isoformat(timespec="seconds")
+        version = (self.latest_version() or 0) + 1
+        while True:
+            meta = {
+                "format": FORMAT_NAME,
+                "format_version": FORMAT_VERSION,
+                "version": version,
+                "agents": agents,
+                "name": name,
+                "created": created,
+                "rng_state": rng_state
+            }
+            tmp_path = self.directory / f".weights-{uuid.uuid4().hex}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    np.savez(f, weights=vector, meta=np.array(json.dumps(meta)))
+                    f.flush()
+                    os.fsync(f.fileno())
+                # Unlike a rename, linking fails if another saver took the version
+                os.link(tmp_path, self._path(version, named=name is not None))
+                break
+            except FileExistsError:
+                version = max(version, self.latest_version() or 0) + 1
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        self._prune()
+        return WeightCheckpoint(version, agents, vector, name, created, rng_state)
+
+    def _read(self, version: int, path: Optional[Path] = None) -> WeightCheckpoint:
+        path = path or self._files()[version]
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            weights = data["weights"]
+        if meta.get("format") != FORMAT_NAME or meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported weight checkpoint format in {path}")
+        weights.setflags(write=False)
+        return WeightCheckpoint(version, meta["agents"], weights, meta.get("name"),
+                                meta.get("created"), meta.get("rng_state"))
+
+    def load(self, version: Union[int, str, None] = None) -> Optional[WeightCheckpoint]:
+        """
+        Read a checkpoint.
+
+        Args:
+            version: A version number, a checkpoint name (the newest checkpoint with
+                that name), or None for the latest checkpoint.
+
+        Returns:
+            Optional[WeightCheckpoint]: The checkpoint, or None if the store is empty.
+
+        Raises:
+            KeyError: If the requested version or name does not exist.
+        """
+        files = self._files()
+        if version is None:
+            latest = max(files, default=None)
+            return self._read(latest, files[latest]) if latest is not None else None
+        if isinstance(version, int):
+            if version not in files:
+                raise KeyError(f"No weight checkpoint with version {version}")
+            return self._read(version, files[version])
+        # Only named checkpoints need to be opened
+        for candidate in sorted(files, reverse=True):
+            if files[candidate].name.endswith(".named.npz"):
+                checkpoint = self._read(candidate, files[candidate])
+                if checkpoint.name == version:
+                    return checkpoint
+        raise KeyError(f"No weight checkpoint named {version!r}")
+
+    def history(self) -> List[Dict[str, Any]]:
+        """Return the version, name and creation time of every checkpoint, oldest first."""
+        return [
+            {"version": checkpoint.version, "name": checkpoint.name, "created": checkpoint.created}
+            for checkpoint in (self._read(version, path) for version, path in sorted(self._files().items()))
+        ]
+
+    def restore(self, manager: Any, version: Union[int, str, None] = None) -> Optional[WeightCheckpoint]:
+        """
+        Load a checkpoint into a manager.
+
+        The weights replace the manager's weights, and the generator state is
+        restored when both the checkpoint and the manager have one, so a
+        restarted learner continues the same random stream.
+
+        Returns:
+            Optional[WeightCheckpoint]: The restored checkpoint, or None if the store is empty.
+        """
+        checkpoint = self.load(version)
+        if checkpoint is None:
+            return None
+        version = getattr(manager, "version", 0)
+        manager.weights = checkpoint.as_dict()
+        # ReinforcementLearningManager bumps its version when its weights are set;
+        # ExampleRLManager's weights are a plain attribute, so bump it here for
+        # consumers caching on the version
+        if getattr(manager, "version", 0) == version:
+            manager.version = version + 1
+        rng = getattr(manager, "rng", None)
+        if rng is not None and checkpoint.rng_state is not None:
+            rng.bit_generator.state = checkpoint.rng_state
+        logger.info(f"Restored RL weights from checkpoint version {checkpoint.version}.")
+        return checkpoint
+
+    def rollback(self, manager: Any, version: Union[int, str]) -> WeightCheckpoint:
+        """
+        Restore an earlier checkpoint and record it as the newest version.
+
+        Args:
+            manager: The RL manager to roll back.
+            version: The version number or name to roll back to.
+
+        Returns:
+            WeightCheckpoint: The new checkpoint holding the rolled back weights.
+        """
+        target = self.restore(manager, version)
+        if target is None:
+            raise KeyError(f"No weight checkpoint {version!r}")
+        return self.save_weights(target.as_dict(), rng_state=target.rng_state)
+
+    def _prune(self) -> None:
+        if self.keep is None:
+            return
+        # Named checkpoints are told apart by their file name, so nothing is opened
+        unnamed = [path for _, path in sorted(self._files().items()) if not path.name.endswith(".named.npz")]
+        for path in unnamed[:-self.keep] if self.keep else unnamed:
+            path.unlink(missing_ok=True)
+
+class WeightCheckpointer:
+    """Save a manager's weights periodically, by number of changes or by time."""
+
+    def __init__(self, manager: Any, store: WeightCheckpointStore, every: int = 100,
+                 interval: Optional[float] = None):
+        """
+        Args:
+            manager: The RL manager to checkpoint. Its ``version`` counts weight changes.
+            store (WeightCheckpointStore): Where to save.
+            every (int): Save after this many weight changes.
+            interval (float, optional): Also save when this many seconds have passed
+                since the last save and the weights changed.
+        """
+        self.manager = manager
+        self.store = store
+        self.every = every
+        self.interval = interval
+        self._saved_version = getattr(manager, "version", 0)
+        self._saved_at = time.monotonic()
+
+    def maybe_save(self) -> Optional[WeightCheckpoint]:
+        """Save if enough changes or time have accumulated; return the checkpoint if saved."""
+        changes = getattr(self.manager, "version", 0) - self._saved_version
+        due = changes >= self.every or (
+            changes > 0 and self.interval is not None and time.monotonic() - self._saved_at >= self.interval
+        )
+        return self.save() if due else None
+
+    def save(self, name: Optional[str] = None) -> WeightCheckpoint:
+        checkpoint = self.store.save(self.manager, name=name)
+        self._saved_version = getattr(self.manager, "version", 0)
+        self._saved_at = time.monotonic()
+        return checkpoint